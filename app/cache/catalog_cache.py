@@ -0,0 +1,108 @@
+from cache.lru_cache import LRUCache
+from config.config import CACHE_CONFIG
+from db.connection import after_commit, current_connection
+from models.category import Category
+from models.product import Product
+from repositories.category_repository import CategoryRepository
+from repositories.product_repository import ProductRepository
+
+_categories = LRUCache(CACHE_CONFIG["max_size"], CACHE_CONFIG["ttl"])
+_products = LRUCache(CACHE_CONFIG["max_size"], CACHE_CONFIG["ttl"])
+
+
+def _cached(cache: LRUCache, key, loader):
+    # Inside a unit of work the caller must see its own uncommitted writes,
+    # and nothing uncommitted may leak into the shared cache.
+    if not CACHE_CONFIG["enabled"] or current_connection() is not None:
+        return loader()
+    return cache.get_or_load(key, loader)
+
+
+class CatalogCache:
+    """
+    Process-wide read cache in front of the category and product repositories.
+
+    Cached objects are shared between callers and must be treated as read-only.
+    """
+
+    @staticmethod
+    def category_by_id(category_id: int) -> Category | None:
+        """
+        Returns a category by ID, from the cache when possible.
+        """
+        return _cached(
+            _categories,
+            ("id", category_id),
+            lambda: CategoryRepository.get_by_id(category_id),
+        )
+
+    @staticmethod
+    def categories() -> list[Category]:
+        """
+        Returns all categories, from the cache when possible.
+        """
+        return _cached(_categories, "all", CategoryRepository.list_all)
+
+    @staticmethod
+    def category_name_exists(name: str) -> bool:
+        """
+        Tells whether a category name is in use, from the cache when possible.
+        """
+        return _cached(
+            _categories, ("name", name), lambda: CategoryRepository.name_exists(name)
+        )
+
+    @staticmethod
+    def product_by_id(product_id: int) -> Product | None:
+        """
+        Returns a product by ID, from the cache when possible.
+        """
+        return _cached(
+            _products,
+            ("id", product_id),
+            lambda: ProductRepository.get_by_id(product_id),
+        )
+
+    @staticmethod
+    def products() -> list[Product]:
+        """
+        Returns all products, from the cache when possible.
+        """
+        return _cached(_products, "all", ProductRepository.list_all)
+
+    @staticmethod
+    def product_name_exists(name: str) -> bool:
+        """
+        Tells whether a product name is in use, from the cache when possible.
+        """
+        return _cached(
+            _products, ("name", name), lambda: ProductRepository.name_exists(name)
+        )
+
+    @staticmethod
+    def invalidate_categories() -> None:
+        """
+        Drops cached categories once the current write commits.
+
+        Products are dropped as well, since deleting a category cascades to
+        its products.
+        """
+        after_commit(_categories.clear)
+        after_commit(_products.clear)
+
+    @staticmethod
+    def invalidate_products() -> None:
+        """
+        Drops cached products once the current write commits.
+        """
+        after_commit(_products.clear)
+
+    @staticmethod
+    def stats() -> dict:
+        """
+        Returns hit/miss/eviction counters for both caches.
+
+        Returns:
+            dict: Counters keyed by 'categories' and 'products'.
+        """
+        return {"categories": _categories.stats(), "products": _products.stats()}
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded cache with least-recently-used eviction and an
+    optional time-to-live.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to call the loader.
+        evictions (int): Entries dropped to respect ``max_size``.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept.
+            ttl (float, optional): Seconds an entry stays valid; None keeps it until evicted.
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value for a key, loading and storing it on a miss.
+
+        A value loaded while the cache was being invalidated is returned to
+        the caller but not stored, so a concurrent write is never masked.
+
+        Args:
+            key: A hashable cache key.
+            loader (callable): Produces the value when it is not cached.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if generation == self._generation:
+                expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: 'size', 'max_size', 'hits', 'misses' and 'evictions'.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,337 @@
+"""
+Non-interactive MarketFlow command line, for scripts and automation.
+
+    python main.py orders create --client 3 --product 7
+    python main.py products list --format jsonl
+    python main.py clients create --file clients.csv
+    python main.py orders get 42 --details --format json
+
+Every controller operation is a subcommand of its entity. Results go to
+stdout as they are produced (JSON lines by default); errors go to stderr as
+JSON lines too. The whole invocation shares one connection pool, and
+``--file`` creates records in bulk from a CSV (with a header) or JSONL file.
+
+Exit status: 0 on success, 1 if any operation failed, 2 on usage errors.
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import sys
+from datetime import date
+from itertools import islice
+
+from config.config import IMPORT_CONFIG
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, fit
+
+# Fields accepted by the commands, their types and the option that sets them.
+FIELDS = {
+    "name": (str, "--name"),
+    "email": (str, "--email"),
+    "price": (float, "--price"),
+    "category_id": (int, "--category"),
+    "client_id": (int, "--client"),
+    "product_id": (int, "--product"),
+    # Only set from --file records; create() always uses today.
+    "order_date": (date.fromisoformat, None),
+}
+
+# Per entity: its service, the fields of create() in argument order, extra
+# fields a --file record may set, the field update() changes (if any) and
+# whether it can be deleted. File records become create_many() rows.
+ENTITIES = {
+    "clients": {
+        "service": ("services.client_service", "ClientService"),
+        "create": ("name", "email"),
+        "optional": (),
+        "update": "email",
+        "delete": False,
+    },
+    "categories": {
+        "service": ("services.category_service", "CategoryService"),
+        "create": ("name",),
+        "optional": (),
+        "update": "name",
+        "delete": True,
+    },
+    "products": {
+        "service": ("services.product_service", "ProductService"),
+        "create": ("name", "price", "category_id"),
+        "optional": (),
+        "update": "price",
+        "delete": True,
+    },
+    "orders": {
+        "service": ("services.order_service", "OrderService"),
+        "create": ("client_id", "product_id"),
+        "optional": ("order_date",),
+        "update": None,
+        "delete": False,
+    },
+}
+
+FORMATS = ("jsonl", "json", "csv", "table")
+
+
+class RecordWriter:
+    """
+    Streams records to a text stream in one of FORMATS.
+
+    Nothing is held back except the CSV and table header, which are written
+    with the first record, so output can be piped into another program
+    while a large listing is still being read.
+    """
+
+    def __init__(self, stream, format: str = "jsonl"):
+        """
+        Args:
+            stream: Where to write, e.g. sys.stdout.
+            format (str): One of FORMATS.
+        """
+        self.stream = stream
+        self.format = format
+        self.count = 0
+        self._columns = None
+        self._csv = csv.writer(stream) if format == "csv" else None
+
+    def write(self, record: dict) -> None:
+        if self.format == "jsonl":
+            self.stream.write(json.dumps(record, default=str) + "\n")
+        elif self.format == "json":
+            self.stream.write("[\n" if self.count == 0 else ",\n")
+            self.stream.write("  " + json.dumps(record, default=str))
+        else:
+            if self._columns is None:
+                self._columns = list(record)
+                self._write_row(self._columns)
+            self._write_row([record.get(column) for column in self._columns])
+        self.count += 1
+
+    def close(self) -> None:
+        if self.format == "json":
+            self.stream.write("\n]\n" if self.count else "[]\n")
+        self.stream.flush()
+
+    def _write_row(self, values: list) -> None:
+        if self._csv is not None:
+            self._csv.writerow(values)
+            return
+        cells = (_cell(column, value) for column, value in zip(self._columns, values))
+        self.stream.write(" ".join(cells).rstrip() + "\n")
+
+
+class ErrorWriter:
+    """
+    Writes errors to a stream as JSON lines and counts them.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, error: dict) -> None:
+        self.stream.write(json.dumps(error, default=str) + "\n")
+        self.count += 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser: one subcommand per entity, one sub-subcommand per operation.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="MarketFlow command line.",
+        epilog="Run without arguments for the interactive menu.",
+    )
+    entities = parser.add_subparsers(dest="entity", required=True)
+
+    for entity, spec in ENTITIES.items():
+        entity_parser = entities.add_parser(entity, help=f"manage {entity}")
+        operations = entity_parser.add_subparsers(dest="operation", required=True)
+
+        create = _operation(operations, "create", f"create {entity}")
+        for field in spec["create"]:
+            field_type, option = FIELDS[field]
+            create.add_argument(option, dest=field, type=field_type)
+        create.add_argument(
+            "--file", help="create one record per CSV row or JSONL line instead"
+        )
+        create.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CONFIG["chunk_size"],
+            help="records inserted together from --file",
+        )
+
+        list_parser = _operation(operations, "list", f"list all {entity}")
+        get = _operation(operations, "get", "show one record by ID")
+        get.add_argument("id", type=int)
+        if entity == "orders":
+            for subparser in (list_parser, get):
+                subparser.add_argument(
+                    "--details",
+                    action="store_true",
+                    help="include client and product names",
+                )
+
+        if spec["update"]:
+            field_type, option = FIELDS[spec["update"]]
+            update = _operation(operations, "update", f"change the {spec['update']}")
+            update.add_argument("id", type=int)
+            update.add_argument(
+                option, dest=spec["update"], type=field_type, required=True
+            )
+
+        if spec["delete"]:
+            delete = _operation(operations, "delete", "delete one record by ID")
+            delete.add_argument("id", type=int)
+
+    return parser
+
+
+def _operation(operations, name: str, help: str) -> argparse.ArgumentParser:
+    operation = operations.add_parser(name, help=help)
+    operation.add_argument("--format", choices=FORMATS, default="jsonl")
+    return operation
+
+
+def run(argv: list[str], stdout=None, stderr=None) -> int:
+    """
+    Runs one command line and returns its exit status.
+
+    Args:
+        argv (list[str]): The arguments, without the program name.
+        stdout: Stream for results; defaults to sys.stdout.
+        stderr: Stream for errors; defaults to sys.stderr.
+
+    Returns:
+        int: 0 on success, 1 if any operation failed.
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    spec = ENTITIES[args.entity]
+    if args.operation == "create" and not args.file:
+        missing = [
+            FIELDS[field][1] for field in spec["create"] if getattr(args, field) is None
+        ]
+        if missing:
+            parser.error(f"{args.entity} create needs {', '.join(missing)} or --file.")
+
+    from db.connection import get_pool
+    from metrics.exporter import start_metrics
+    from tracing.instrument import start_tracing
+
+    start_metrics()
+    start_tracing()
+    module_name, class_name = spec["service"]
+    service = getattr(importlib.import_module(module_name), class_name)
+    writer = RecordWriter(stdout, args.format)
+    errors = ErrorWriter(stderr)
+    try:
+        _dispatch(args, spec, service, writer, errors)
+    except (ValueError, OSError) as error:
+        errors.write({"error": str(error)})
+    finally:
+        writer.close()
+        get_pool().close_all()
+    return 1 if errors.count else 0
+
+
+def _dispatch(args, spec, service, writer: RecordWriter, errors: ErrorWriter) -> None:
+    if args.operation == "create":
+        if args.file:
+            _create_from_file(args.file, args.chunk_size, spec, service, writer, errors)
+        else:
+            values = [getattr(args, field) for field in spec["create"]]
+            writer.write(service.create(*values).to_dict())
+    elif args.operation == "list":
+        items = (
+            service.iter_views()
+            if getattr(args, "details", False)
+            else service.iter_all()
+        )
+        for item in items:
+            writer.write(item.to_dict())
+    elif args.operation == "get":
+        if getattr(args, "details", False):
+            writer.write(service.get_view_by_id(args.id).to_dict())
+        else:
+            writer.write(service.get_by_id(args.id).to_dict())
+    elif args.operation == "update":
+        writer.write(service.update(args.id, getattr(args, spec["update"])).to_dict())
+    elif args.operation == "delete":
+        service.delete(args.id)
+        writer.write({"id": args.id, "deleted": True})
+
+
+def _create_from_file(path, chunk_size, spec, service, writer, errors) -> None:
+    """
+    Creates the records of a file with create_many, one chunk at a time.
+
+    A chunk that the service rejects is retried record by record, so one bad
+    line only rejects itself. Each created record is reported with its line
+    number and new ID.
+    """
+    from services.order_import_service import read_records
+
+    records = read_records(path)
+    while True:
+        batch = list(islice(records, chunk_size))
+        if not batch:
+            return
+        chunk = []
+        for line, record in batch:
+            try:
+                chunk.append((line, _bulk_row(record, spec)))
+            except ValueError as ve:
+                errors.write({"line": line, "error": str(ve)})
+        if chunk:
+            _insert_chunk(chunk, service, writer, errors)
+
+
+def _insert_chunk(chunk, service, writer, errors) -> None:
+    try:
+        ids = service.create_many([row for _, row in chunk])
+    except ValueError:
+        ids = None
+    if ids is not None:
+        for (line, _), new_id in zip(chunk, ids):
+            writer.write({"line": line, "id": new_id})
+        return
+
+    for line, row in chunk:
+        try:
+            (new_id,) = service.create_many([row])
+        except ValueError as ve:
+            errors.write({"line": line, "error": str(ve)})
+        else:
+            writer.write({"line": line, "id": new_id})
+
+
+def _bulk_row(record, spec):
+    if not isinstance(record, dict):
+        raise ValueError("Record is not a JSON object.")
+    values = [_field(record, field) for field in spec["create"]]
+    for field in spec["optional"]:
+        if record.get(field) not in (None, ""):
+            values.append(_field(record, field))
+    # create_many takes bare values for single-field entities (categories).
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def _field(record: dict, field: str):
+    value = record.get(field)
+    if value is None or value == "":
+        raise ValueError(f"Missing '{field}'.")
+    field_type = FIELDS[field][0]
+    try:
+        return field_type(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {field}: {value!r}.") from None
+
+
+def _cell(column: str, value) -> str:
+    return fit(value, ID_WIDTH if column in ("id", "line") else TEXT_WIDTH)
@@ -3,7 +3,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-REQUIRED_ENV_VARS = ["DB_HOST", "DB_PORT", "DB_USER", "DB_PASSWORD", "DB_NAME"]
+# "mariadb" talks to a MariaDB server; "sqlite" uses an embedded database file.
+DB_BACKEND = os.getenv("DB_BACKEND", "mariadb").lower()
+
+REQUIRED_ENV_VARS = (
+    ["DB_HOST", "DB_PORT", "DB_USER", "DB_PASSWORD", "DB_NAME"]
+    if DB_BACKEND == "mariadb"
+    else []
+)
 missing_vars = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
 
 if missing_vars:
@@ -13,8 +20,82 @@ if missing_vars:
 
 DB_CONFIG = {
     "host": os.getenv("DB_HOST"),
-    "port": int(os.getenv("DB_PORT")),
+    "port": int(os.getenv("DB_PORT", "3306")),
     "user": os.getenv("DB_USER"),
     "password": os.getenv("DB_PASSWORD"),
     "database": os.getenv("DB_NAME"),
 }
+
+SQLITE_CONFIG = {
+    # A file path, or ":memory:" for a private in-process database.
+    "path": os.getenv("DB_SQLITE_PATH", "marketflow.db"),
+    "busy_timeout": float(os.getenv("DB_SQLITE_BUSY_TIMEOUT", "5")),
+}
+
+DB_POOL_CONFIG = {
+    "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+    "max_idle_time": float(os.getenv("DB_POOL_MAX_IDLE_TIME", "300")),
+    "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+}
+
+BULK_CONFIG = {
+    "max_rows": int(os.getenv("DB_BULK_MAX_ROWS", "1000")),
+    "lookup_chunk_size": int(os.getenv("DB_BULK_LOOKUP_CHUNK_SIZE", "1000")),
+}
+
+STREAM_CONFIG = {
+    "fetch_size": int(os.getenv("DB_STREAM_FETCH_SIZE", "500")),
+}
+
+PAGINATION_CONFIG = {
+    "page_size": int(os.getenv("PAGE_SIZE", "20")),
+    "max_page_size": int(os.getenv("MAX_PAGE_SIZE", "500")),
+}
+
+CACHE_CONFIG = {
+    "enabled": os.getenv("CACHE_ENABLED", "true").lower() == "true",
+    "max_size": int(os.getenv("CACHE_MAX_SIZE", "1024")),
+    "ttl": (
+        float(os.getenv("CACHE_TTL_SECONDS"))
+        if os.getenv("CACHE_TTL_SECONDS")
+        else None
+    ),
+}
+
+STATEMENT_CONFIG = {
+    "prepared": os.getenv("DB_PREPARED_STATEMENTS", "true").lower() == "true",
+}
+
+IMPORT_CONFIG = {
+    "chunk_size": int(os.getenv("IMPORT_CHUNK_SIZE", "5000")),
+}
+
+QUERY_LOG_CONFIG = {
+    "enabled": os.getenv("QUERY_INSTRUMENTATION", "false").lower() == "true",
+    "slow_ms": float(os.getenv("QUERY_SLOW_MS", "100")),
+    "slow_log": os.getenv("QUERY_SLOW_LOG", "slow_queries.jsonl"),
+    "explain": os.getenv("QUERY_SLOW_EXPLAIN", "false").lower() == "true",
+}
+
+METRICS_CONFIG = {
+    "enabled": os.getenv("METRICS_ENABLED", "false").lower() == "true",
+    "host": os.getenv("METRICS_HOST", "127.0.0.1"),
+    # 0 turns the HTTP endpoint off.
+    "port": int(os.getenv("METRICS_PORT", "9464")),
+    # An empty path turns the file dump off.
+    "dump_path": os.getenv("METRICS_DUMP_PATH", ""),
+    "dump_interval": float(os.getenv("METRICS_DUMP_INTERVAL", "15")),
+}
+
+TRACING_CONFIG = {
+    "enabled": os.getenv("TRACING_ENABLED", "false").lower() == "true",
+    # Share of traces recorded, decided once per trace at its root span.
+    "sample_rate": float(os.getenv("TRACING_SAMPLE_RATE", "0.1")),
+    # "jsonl" writes spans to TRACING_PATH; "otlp" posts them to TRACING_OTLP_ENDPOINT.
+    "exporter": os.getenv("TRACING_EXPORTER", "jsonl").lower(),
+    "path": os.getenv("TRACING_PATH", "traces.jsonl"),
+    "endpoint": os.getenv("TRACING_OTLP_ENDPOINT", "http://127.0.0.1:4318/v1/traces"),
+    "service_name": os.getenv("TRACING_SERVICE_NAME", "marketflow"),
+}
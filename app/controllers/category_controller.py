@@ -1,5 +1,6 @@
-from app.utils.entity_display import list_entities
+from utils.entity_display import list_entities
 from services.category_service import CategoryService
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, Column, browse_pages
 
 
 class CategoryController:
@@ -24,17 +25,18 @@ class CategoryController:
     @staticmethod
     def list_all():
         """
-        Retrieves and displays all registered categories.
+        Displays registered categories one page at a time.
         """
-        categories = CategoryService.list_all()
-        if not categories:
-            print("\n⚠️ No categories registered.\n")
-            return
-
-        print("\n📦 Registered Categories:")
-        print()
-        for category in categories:
-            print(f"- ID: {category.id}\n- Name: {category.name}\n")
+        browse_pages(
+            CategoryService.list_page,
+            CategoryService.list_page_before,
+            [
+                Column("ID", ID_WIDTH, lambda category: category.id),
+                Column("Name", TEXT_WIDTH, lambda category: category.name),
+            ],
+            "\n📦 Registered Categories:",
+            "\n⚠️ No categories registered.\n",
+        )
 
     @staticmethod
     def get_by_id():
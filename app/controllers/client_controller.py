@@ -1,5 +1,6 @@
 from services.client_service import ClientService
-from app.utils.entity_display import list_entities
+from utils.entity_display import list_entities
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, Column, browse_pages
 
 
 class ClientController:
@@ -25,19 +26,19 @@ class ClientController:
     @staticmethod
     def list_all():
         """
-        Retrieves and displays all registered clients.
+        Displays registered clients one page at a time.
         """
-        clients = ClientService.list_all()
-        if not clients:
-            print("\n⚠️ No clients registered.\n")
-            return
-
-        print("\n📋 Registered Clients:")
-        print()
-        for client in clients:
-            print(
-                f"- ID: {client.id}\n- Name: {client.name}\n- Email: {client.email}\n"
-            )
+        browse_pages(
+            ClientService.list_page,
+            ClientService.list_page_before,
+            [
+                Column("ID", ID_WIDTH, lambda client: client.id),
+                Column("Name", TEXT_WIDTH, lambda client: client.name),
+                Column("Email", 32, lambda client: client.email),
+            ],
+            "\n📋 Registered Clients:",
+            "\n⚠️ No clients registered.\n",
+        )
 
     @staticmethod
     def get_by_id():
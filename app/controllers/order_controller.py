@@ -1,7 +1,9 @@
-from app.utils.entity_display import list_entities
+from utils.entity_display import list_entities
+from models.order_view import OrderView
 from services.order_service import OrderService
 from services.client_service import ClientService
 from services.product_service import ProductService
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, Column, browse_pages
 
 
 class OrderController:
@@ -17,16 +19,9 @@ class OrderController:
             client_id = int(input("Enter client ID: "))
             product_id = int(input("Enter product ID: "))
             order = OrderService.create(client_id, product_id)
-            client = ClientService.get_by_id(order.client_id)
-            product = ProductService.get_by_id(order.product_id)
+            view = OrderService.get_view_by_id(order.id)
 
-            print(
-                f"\n✅ Order created successfully:\n"
-                f"- ID: {order.id}\n"
-                f"- Client: {client.name} ({client.email})\n"
-                f"- Product: {product.name} - R${product.price:.2f}\n"
-                f"- Date: {order.order_date}\n"
-            )
+            print(f"\n✅ Order created successfully:\n{OrderController._details(view)}")
 
         except ValueError as ve:
             print(f"\n❌ {ve}\n")
@@ -35,41 +30,44 @@ class OrderController:
 
     @staticmethod
     def list_all():
-        orders = OrderService.list_all()
-        if not orders:
-            print("\n⚠️ No orders found.\n")
-            return
-
-        print("\n📦 Registered Orders:")
-        print()
-        for order in orders:
-            client = ClientService.get_by_id(order.client_id)
-            product = ProductService.get_by_id(order.product_id)
-            print(
-                f"- ID: {order.id}\n"
-                f"- Client: {client.name} ({client.email})\n"
-                f"- Product: {product.name} - R${product.price:.2f}\n"
-                f"- Date: {order.order_date}\n"
-            )
-        print()
+        """
+        Displays orders with their client and product, one page at a time.
+        """
+        browse_pages(
+            OrderService.list_view_page,
+            OrderService.list_view_page_before,
+            [
+                Column("ID", ID_WIDTH, lambda view: view.id),
+                Column("Client", TEXT_WIDTH, lambda view: view.client_name),
+                Column("Product", TEXT_WIDTH, lambda view: view.product_name),
+                Column("Price", 10, lambda view: f"R${view.product_price:.2f}"),
+                Column("Date", 10, lambda view: view.order_date),
+            ],
+            "\n📦 Registered Orders:",
+            "\n⚠️ No orders found.\n",
+        )
 
     @staticmethod
     def get_by_id():
         try:
             list_entities(OrderService, "order")
             order_id = int(input("Enter order ID: "))
-            order = OrderService.get_by_id(order_id)
-            client = ClientService.get_by_id(order.client_id)
-            product = ProductService.get_by_id(order.product_id)
+            view = OrderService.get_view_by_id(order_id)
 
-            print(
-                f"\n🔍 Order found:\n"
-                f"- ID: {order.id}\n"
-                f"- Client: {client.name} ({client.email})\n"
-                f"- Product: {product.name} - R${product.price:.2f}\n"
-                f"- Date: {order.order_date}\n"
-            )
+            print(f"\n🔍 Order found:\n{OrderController._details(view)}")
         except ValueError as ve:
             print(f"\n❌ {ve}\n")
         except Exception:
             print("\n❌ Invalid input. Please enter a numeric ID.\n")
+
+    @staticmethod
+    def _details(view: OrderView) -> str:
+        """
+        Formats an order with its client and product details for display.
+        """
+        return (
+            f"- ID: {view.id}\n"
+            f"- Client: {view.client_name} ({view.client_email})\n"
+            f"- Product: {view.product_name} - R${view.product_price:.2f}\n"
+            f"- Date: {view.order_date}\n"
+        )
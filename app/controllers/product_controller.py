@@ -1,6 +1,7 @@
-from app.utils.entity_display import list_entities
+from utils.entity_display import list_entities
 from services.product_service import ProductService
-from services.category_service import CategoryService
+from utils.label_resolver import LabelResolver
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, Column, browse_pages
 
 
 class ProductController:
@@ -42,25 +43,26 @@ class ProductController:
     @staticmethod
     def list_all():
         """
-        Retrieves and displays all registered products.
+        Displays registered products one page at a time.
         """
-        products = ProductService.list_all()
-        if not products:
-            print("\n⚠️ No products registered.\n")
-            return
-
-        print("\n📦 Registered Products:")
-        print()
-
-        categories = {c.id: c.name for c in CategoryService.list_all()}
-        for product in products:
-            category_name = categories.get(product.category_id, "Unknown")
-            print(
-                f"- ID: {product.id}\n"
-                f"- Name: {product.name}\n"
-                f"- Price: ${product.price:.2f}\n"
-                f"- Category: {category_name}\n"
-            )
+        labels = LabelResolver()
+        browse_pages(
+            ProductService.list_page,
+            ProductService.list_page_before,
+            [
+                Column("ID", ID_WIDTH, lambda product: product.id),
+                Column("Name", TEXT_WIDTH, lambda product: product.name),
+                Column("Price", 10, lambda product: f"${product.price:.2f}"),
+                Column(
+                    "Category",
+                    TEXT_WIDTH,
+                    lambda product: labels.label("category_id", product.category_id),
+                ),
+            ],
+            "\n📦 Registered Products:",
+            "\n⚠️ No products registered.\n",
+            prepare_page=labels.load,
+        )
 
     @staticmethod
     def get_by_id():
@@ -0,0 +1,339 @@
+"""
+asyncio flavour of ``db.connection``: a per-event-loop pool, units of work
+and the statement helpers the ``async_*`` repositories use.
+
+MariaDB only: connections come from the backend's ``connect_async()``, which
+only the MariaDB backend (``mysql.connector.aio``) provides. With
+DB_BACKEND=sqlite the asyncio services refuse to open a connection.
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+
+from config.config import BULK_CONFIG, DB_POOL_CONFIG
+from db.backends import backend
+from db.errors import translate_error
+from db.pooling import CHECK, CONNECT, NOTIFY, RESET, WAIT, PoolState, UnitOfWork
+from db.statements import ExecuteResult
+
+
+class AsyncConnectionPool(PoolState):
+    """
+    Pool of asyncio connections for a single event loop.
+
+    Shares its bookkeeping with ``ConnectionPool`` through ``PoolState``; only
+    the waiting and the database calls are done the asyncio way, so hundreds
+    of coroutines can share a few connections.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_idle_time: float = 300.0,
+        max_lifetime: float = 3600.0,
+        connect=None,
+    ):
+        """
+        Initializes an empty pool.
+
+        Args:
+            min_size (int): Connections kept open even when idle.
+            max_size (int): Upper bound on open connections.
+            timeout (float): Seconds to wait for a connection before giving up.
+            max_idle_time (float): Seconds an idle connection may sit unused.
+            max_lifetime (float): Seconds a connection may live before being replaced.
+            connect (coroutine function, optional): Factory for new physical connections.
+        """
+        super().__init__(min_size, max_size, timeout, max_idle_time, max_lifetime)
+        self._connect = connect or open_async_connection
+        self._available = asyncio.Condition()
+
+    async def acquire(self, timeout: float = None):
+        """
+        Borrows a validated connection from the pool.
+
+        Args:
+            timeout (float, optional): Overrides the pool timeout for this call.
+
+        Returns:
+            MySQLConnection: An open asyncio connection reserved for the caller.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for the whole timeout.
+        """
+        return await self._run(self.acquire_steps(timeout))
+
+    async def release(self, connection, discard: bool = False) -> None:
+        """
+        Returns a borrowed connection to the pool, rolling back any open transaction.
+
+        Args:
+            connection: A connection previously returned by ``acquire``.
+            discard (bool): Drop the connection instead of reusing it.
+        """
+        await self._run(self.release_steps(connection, discard))
+
+    async def close_all(self) -> None:
+        """
+        Closes every idle connection. Borrowed connections are closed on release.
+        """
+        await self._run(self.close_all_steps())
+
+    async def _run(self, steps):
+        # The state only changes between awaits, so it needs no lock of its own.
+        reply = error = None
+        while True:
+            try:
+                if error is None:
+                    action, argument = steps.send(reply)
+                else:
+                    action, argument = steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            reply = error = None
+            try:
+                reply = await self._perform(action, argument)
+            except BaseException as e:
+                error = e
+
+    async def _perform(self, action, argument):
+        if action == CONNECT:
+            return await self._connect()
+        if action == CHECK:
+            return await _is_alive(argument)
+        if action == RESET:
+            return await _reset(argument)
+        if action == WAIT:
+            async with self._available:
+                # Re-check under the condition's lock so a release that
+                # happened meanwhile is not missed.
+                if self.exhausted():
+                    try:
+                        await asyncio.wait_for(self._available.wait(), argument)
+                    except asyncio.TimeoutError:
+                        pass
+        elif action == NOTIFY:
+            async with self._available:
+                self._available.notify()
+        else:
+            await _close_quietly(argument)
+
+
+# asyncio primitives belong to one event loop, so each loop gets its own pool.
+_pools = weakref.WeakKeyDictionary()
+_unit_of_work = UnitOfWork("current_async")
+
+
+def get_async_pool() -> AsyncConnectionPool:
+    """
+    Returns the connection pool of the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = AsyncConnectionPool(**DB_POOL_CONFIG)
+        _pools[loop] = pool
+    return pool
+
+
+async def close_async_pool() -> None:
+    """
+    Closes the idle connections of the running loop's pool; call before the loop stops.
+    """
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close_all()
+
+
+async def open_async_connection(retries=30, delay=1):
+    """
+    Attempts to open an asyncio connection, retrying if the connection fails.
+
+    Raises:
+        RuntimeError: If the selected backend has no asyncio driver.
+    """
+    connect = getattr(backend, "connect_async", None)
+    if connect is None:
+        raise RuntimeError(
+            f"❌ The asyncio services need DB_BACKEND=mariadb (not '{backend.NAME}')."
+        )
+
+    for attempt in range(retries):
+        try:
+            return await connect()
+        except backend.Error as e:
+            print(
+                f"⏳ Attempt {attempt + 1}/{retries}: waiting for the database... (Error: {e})"
+            )
+            await asyncio.sleep(delay)
+
+    raise ConnectionError(
+        "❌ Failed to connect to the database after multiple attempts."
+    )
+
+
+@asynccontextmanager
+async def async_transaction():
+    """
+    Opens an asyncio unit of work shared by every repository call inside the block.
+
+    Behaves like ``transaction()``: the outermost block commits or rolls back,
+    nested blocks join it, and ``async_after_commit`` callbacks run once it has
+    committed. Each asyncio task has its own unit of work.
+
+    Yields:
+        MySQLConnection: The connection bound to the unit of work.
+    """
+    connection = _unit_of_work.current()
+    if connection is not None:
+        yield connection
+        return
+
+    pool = get_async_pool()
+    connection = await pool.acquire()
+    try:
+        with _unit_of_work.bind(connection) as callbacks:
+            try:
+                yield connection
+                await connection.commit()
+            except BaseException:
+                await _rollback_quietly(connection)
+                raise
+    finally:
+        await pool.release(connection)
+
+    for callback in callbacks:
+        callback()
+
+
+def async_after_commit(callback) -> None:
+    """
+    Runs a callback once the current asyncio unit of work commits, like ``after_commit``.
+
+    Args:
+        callback (callable): A function taking no arguments.
+    """
+    _unit_of_work.after_commit(callback)
+
+
+@asynccontextmanager
+async def async_borrow_connection():
+    """
+    Yields the unit-of-work connection if one is open, otherwise a pooled
+    connection that is returned to the pool when the block exits.
+    """
+    connection = _unit_of_work.current()
+    if connection is not None:
+        yield connection
+        return
+
+    pool = get_async_pool()
+    connection = await pool.acquire()
+    try:
+        yield connection
+    finally:
+        await pool.release(connection)
+
+
+async def fetch_one(connection, sql: str, params: tuple = ()) -> dict | None:
+    """
+    Runs a query and returns its first row as a dictionary, or None.
+    """
+    cursor = await connection.cursor(dictionary=True)
+    try:
+        await cursor.execute(sql, params)
+        return await cursor.fetchone()
+    finally:
+        await cursor.close()
+
+
+async def fetch_all(connection, sql: str, params: tuple = ()) -> list[dict]:
+    """
+    Runs a query and returns all its rows as dictionaries.
+    """
+    cursor = await connection.cursor(dictionary=True)
+    try:
+        await cursor.execute(sql, params)
+        return await cursor.fetchall()
+    finally:
+        await cursor.close()
+
+
+async def fetch_in(connection, query: str, values) -> list[dict]:
+    """
+    Runs a ``WHERE ... IN (...)`` query for many values, like ``bulk.select_in``.
+
+    Args:
+        connection: The connection to run on.
+        query (str): SELECT statement with a ``{placeholders}`` slot for the IN list.
+        values: Values to look up; duplicates are ignored.
+
+    Returns:
+        list[dict]: All matching rows, as dictionaries.
+    """
+    values = list(dict.fromkeys(values))
+    size = BULK_CONFIG["lookup_chunk_size"]
+    results = []
+    for start in range(0, len(values), size):
+        end = start + size
+        chunk = values[start:end]
+        sql = query.format(placeholders=", ".join(["%s"] * len(chunk)))
+        results.extend(await fetch_all(connection, sql, chunk))
+    return results
+
+
+async def execute(connection, sql: str, params: tuple = ()) -> ExecuteResult:
+    """
+    Runs a write statement.
+
+    Returns:
+        ExecuteResult: The matched row count and the generated ID, if any.
+
+    Raises:
+        DuplicateKeyError: If the statement violates a unique key.
+        ForeignKeyError: If the statement references a missing row.
+    """
+    cursor = await connection.cursor()
+    try:
+        await cursor.execute(sql, params)
+        return ExecuteResult(cursor.rowcount, cursor.lastrowid)
+    except backend.Error as error:
+        translated = translate_error(error)
+        if translated is error:
+            raise
+        raise translated from error
+    finally:
+        await cursor.close()
+
+
+async def _is_alive(connection) -> bool:
+    try:
+        return await connection.is_connected()
+    except backend.Error:
+        return False
+
+
+async def _reset(connection) -> bool:
+    try:
+        if connection.in_transaction:
+            await connection.rollback()
+        return True
+    except backend.Error:
+        return False
+
+
+async def _rollback_quietly(connection) -> None:
+    try:
+        await connection.rollback()
+    except backend.Error:
+        pass
+
+
+async def _close_quietly(connection) -> None:
+    try:
+        await connection.close()
+    except backend.Error:
+        pass
@@ -0,0 +1,56 @@
+import importlib
+
+from config.config import DB_BACKEND
+
+BACKENDS = {
+    "mariadb": "db.backends.mariadb",
+    "sqlite": "db.backends.sqlite",
+}
+
+
+def load_backend(name: str):
+    """
+    Imports a storage backend module by name.
+
+    A backend module provides everything the connection layer needs to know
+    about a database engine:
+
+        NAME                  The backend name, e.g. 'sqlite'.
+        Error                 Base class of the driver's errors.
+        DATA_ERRORS           Errors that reject data but leave a statement usable.
+        PREPARED_STATEMENTS   Whether ``db.statements`` may prepare server-side.
+        MIGRATIONS_DIR        Where the backend's numbered migrations live.
+        MAX_PARAMETERS        Placeholders allowed per statement, or None.
+        UPDATE_RETURNING      Whether UPDATE ... RETURNING is supported.
+        connect()             Opens a connection with the mysql.connector API.
+        connect_async()       Optional; opens a mysql.connector.aio connection
+                              for ``db.async_connection`` (MariaDB only).
+        is_duplicate_key(e)   Whether an error is a unique-key violation.
+        is_foreign_key(e)     Whether an error is a missing foreign-key reference.
+        max_statement_bytes(cursor)       Largest statement the server accepts.
+        first_insert_id(cursor, count)    First ID generated by a multi-row insert.
+        explain(cursor, sql, params)      The plan of a statement, as dictionaries.
+        full_scans(cursor, sql, params)   Tables a statement would read in full.
+        reset_tables(cursor, tables)      Empties tables and restarts their IDs.
+
+    Only the selected backend is imported, so the SQLite backend runs without
+    ``mysql.connector`` installed.
+
+    Args:
+        name (str): 'mariadb' or 'sqlite'.
+
+    Returns:
+        module: The backend module.
+
+    Raises:
+        ValueError: If the name is not a known backend.
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown database backend '{name}'. Choose from: {', '.join(BACKENDS)}."
+        )
+    return importlib.import_module(BACKENDS[name])
+
+
+# The backend selected by DB_BACKEND, used by the whole connection layer.
+backend = load_backend(DB_BACKEND)
@@ -0,0 +1,85 @@
+import os
+
+import mysql.connector
+from mysql.connector import DataError, IntegrityError, errorcode
+from mysql.connector.constants import ClientFlag
+from config.config import DB_CONFIG
+
+NAME = "mariadb"
+Error = mysql.connector.Error
+DATA_ERRORS = (IntegrityError, DataError)
+PREPARED_STATEMENTS = True
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+# The text protocol interpolates parameters client-side, so there is no cap.
+MAX_PARAMETERS = None
+# MariaDB's RETURNING covers INSERT, REPLACE and DELETE, but not UPDATE.
+UPDATE_RETURNING = False
+
+_FOREIGN_KEY_ERRNOS = {errorcode.ER_NO_REFERENCED_ROW, errorcode.ER_NO_REFERENCED_ROW_2}
+
+
+def connect():
+    """
+    Opens a MariaDB connection.
+
+    FOUND_ROWS makes UPDATE report matched rather than changed rows, so a zero
+    rowcount reliably means "no such row".
+    """
+    return mysql.connector.connect(
+        **DB_CONFIG,
+        consume_results=True,
+        client_flags=[ClientFlag.FOUND_ROWS],
+    )
+
+
+async def connect_async():
+    """
+    Opens an asyncio MariaDB connection with the same session settings as connect().
+    """
+    # Imported here so the synchronous backend works without the aio extra.
+    import mysql.connector.aio
+
+    return await mysql.connector.aio.connect(
+        **DB_CONFIG,
+        consume_results=True,
+        client_flags=ClientFlag.get_default() | ClientFlag.FOUND_ROWS,
+    )
+
+
+def is_duplicate_key(error: Exception) -> bool:
+    return isinstance(error, IntegrityError) and error.errno == errorcode.ER_DUP_ENTRY
+
+
+def is_foreign_key(error: Exception) -> bool:
+    return isinstance(error, IntegrityError) and error.errno in _FOREIGN_KEY_ERRNOS
+
+
+def max_statement_bytes(cursor) -> int:
+    cursor.execute("SELECT @@max_allowed_packet")
+    return int(cursor.fetchone()[0])
+
+
+def first_insert_id(cursor, count: int) -> int:
+    # LAST_INSERT_ID() is the first ID of a multi-row insert; InnoDB hands out
+    # the rest consecutively (innodb_autoinc_lock_mode 0 or 1, the default).
+    return cursor.lastrowid
+
+
+def explain(cursor, sql: str, params: tuple) -> list[dict]:
+    cursor.execute("EXPLAIN " + sql, params)
+    return cursor.fetchall()
+
+
+def full_scans(cursor, sql: str, params: tuple) -> list[str]:
+    return [
+        row["table"] for row in explain(cursor, sql, params) if row["type"] == "ALL"
+    ]
+
+
+def reset_tables(cursor, tables) -> None:
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        for table in tables:
+            cursor.execute(f"TRUNCATE TABLE {table}")
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
@@ -0,0 +1,212 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import date
+from decimal import Decimal
+
+from config.config import SQLITE_CONFIG
+from db.backends.sqlite_dialect import translate
+
+NAME = "sqlite"
+Error = sqlite3.Error
+DATA_ERRORS = (sqlite3.IntegrityError,)
+# sqlite3 already keeps compiled statements per connection (cached_statements).
+PREPARED_STATEMENTS = False
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "migrations", "sqlite"
+)
+# SQLITE_MAX_VARIABLE_NUMBER since SQLite 3.32.
+MAX_PARAMETERS = 32766
+UPDATE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+MAX_SQL_LENGTH = 1_000_000_000
+STATEMENT_CACHE_SIZE = 256
+
+# Every pooled connection to ":memory:" must see the same database, so it is
+# opened as a named shared-cache database kept alive by one anchor connection.
+MEMORY_URI = "file:marketflow?mode=memory&cache=shared"
+
+# Match what mysql.connector returns: dates as date, DECIMAL columns as Decimal.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(Decimal, float)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter("DECIMAL", lambda value: Decimal(value.decode()))
+
+_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+_memory_anchor = None
+_anchor_lock = threading.Lock()
+
+
+class SQLiteCursor:
+    """
+    A sqlite3 cursor behind the subset of the mysql.connector cursor API the
+    repositories use: %s placeholders, dictionary rows, rowcount and lastrowid.
+    """
+
+    __slots__ = ("_cursor", "_dictionary", "_columns")
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        self._cursor = cursor
+        self._dictionary = dictionary
+        self._columns = None
+
+    def execute(self, sql: str, params=()) -> None:
+        self._cursor.execute(translate(sql), tuple(params))
+        self._columns = None
+
+    def executemany(self, sql: str, rows) -> None:
+        self._cursor.executemany(translate(sql), [tuple(row) for row in rows])
+        self._columns = None
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return self._row(row) if row is not None else None
+
+    def fetchmany(self, size: int = 1) -> list:
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self) -> list:
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> int:
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self) -> None:
+        self._cursor.close()
+
+    def _row(self, row):
+        if not self._dictionary:
+            return row
+        if self._columns is None:
+            self._columns = [column[0] for column in self._cursor.description]
+        return dict(zip(self._columns, row))
+
+
+class SQLiteConnection:
+    """
+    A sqlite3 connection behind the subset of the mysql.connector connection
+    API used by the pool, the unit of work and the repositories.
+    """
+
+    __slots__ = ("_connection", "_open")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self._open = True
+
+    def cursor(self, dictionary: bool = False, prepared: bool = False) -> SQLiteCursor:
+        return SQLiteCursor(self._connection.cursor(), dictionary)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._connection.in_transaction
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+    def is_connected(self) -> bool:
+        return self._open
+
+    def close(self) -> None:
+        self._open = False
+        self._connection.close()
+
+
+def connect() -> SQLiteConnection:
+    """
+    Opens a connection to the configured SQLite database.
+
+    Foreign keys are enforced (SQLite leaves them off by default), and file
+    databases use write-ahead logging so readers do not block the writer.
+    """
+    path = SQLITE_CONFIG["path"]
+    memory = path == ":memory:"
+    if memory:
+        _anchor_memory_database()
+
+    connection = _open(MEMORY_URI if memory else path, uri=memory)
+    if not memory:
+        connection.execute("PRAGMA journal_mode = WAL")
+    return SQLiteConnection(connection)
+
+
+def is_duplicate_key(error: Exception) -> bool:
+    return isinstance(error, sqlite3.IntegrityError) and str(error).startswith(
+        ("UNIQUE constraint failed", "PRIMARY KEY constraint failed")
+    )
+
+
+def is_foreign_key(error: Exception) -> bool:
+    return isinstance(error, sqlite3.IntegrityError) and str(error).startswith(
+        "FOREIGN KEY constraint failed"
+    )
+
+
+def max_statement_bytes(cursor) -> int:
+    return MAX_SQL_LENGTH
+
+
+def first_insert_id(cursor, count: int) -> int:
+    # lastrowid is the ID of the last row; a single statement holds the write
+    # lock, so the IDs of a multi-row insert are consecutive.
+    return cursor.lastrowid - count + 1
+
+
+def explain(cursor, sql: str, params: tuple) -> list[dict]:
+    cursor.execute("EXPLAIN QUERY PLAN " + translate(sql), params)
+    return cursor.fetchall()
+
+
+def full_scans(cursor, sql: str, params: tuple) -> list[str]:
+    scans = []
+    for row in explain(cursor, sql, params):
+        match = _SCAN.match(row["detail"])
+        if match and match.group(1) != "CONSTANT":
+            scans.append(match.group(1))
+    return scans
+
+
+def reset_tables(cursor, tables) -> None:
+    for table in tables:
+        cursor.execute(f"DELETE FROM {table}")
+    cursor.execute(
+        "DELETE FROM sqlite_sequence WHERE name IN ({})".format(
+            ", ".join(["%s"] * len(tables))
+        ),
+        tuple(tables),
+    )
+
+
+def _open(target: str, uri: bool) -> sqlite3.Connection:
+    # check_same_thread is off because the pool hands a connection to one
+    # thread at a time, not always the one that opened it.
+    connection = sqlite3.connect(
+        target,
+        uri=uri,
+        timeout=SQLITE_CONFIG["busy_timeout"],
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+def _anchor_memory_database() -> None:
+    global _memory_anchor
+    if _memory_anchor is None:
+        with _anchor_lock:
+            if _memory_anchor is None:
+                _memory_anchor = _open(MEMORY_URI, uri=True)
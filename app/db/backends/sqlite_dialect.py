@@ -0,0 +1,78 @@
+from functools import lru_cache
+
+import queries.migration_queries as migration_queries
+import queries.rollup_queries as rollup_queries
+
+# SQLite forms of the statements in queries/ that use MariaDB-only syntax
+# (ON DUPLICATE KEY UPDATE, UPDATE/DELETE with JOIN, GET_LOCK), keyed by the
+# MariaDB text. Every other statement only needs its %s placeholders
+# rewritten.
+VARIANTS = {
+    rollup_queries.ADD_PRODUCT_SALES_FOR_ORDERS: """
+        INSERT INTO sales_by_product_day (sales_date, product_id, order_count, revenue)
+        SELECT o.order_date, o.product_id, COUNT(*), SUM(o.unit_price)
+        FROM orders o
+        WHERE o.id BETWEEN ? AND ?
+        GROUP BY o.order_date, o.product_id
+        ON CONFLICT (sales_date, product_id) DO UPDATE SET
+            order_count = order_count + excluded.order_count,
+            revenue = revenue + excluded.revenue
+    """,
+    rollup_queries.ADD_CATEGORY_SALES_FOR_ORDERS: """
+        INSERT INTO sales_by_category_day (sales_date, category_id, order_count, revenue)
+        SELECT o.order_date, p.category_id, COUNT(*), SUM(o.unit_price)
+        FROM orders o
+        JOIN products p ON o.product_id = p.id
+        WHERE o.id BETWEEN ? AND ?
+        GROUP BY o.order_date, p.category_id
+        ON CONFLICT (sales_date, category_id) DO UPDATE SET
+            order_count = order_count + excluded.order_count,
+            revenue = revenue + excluded.revenue
+    """,
+    rollup_queries.SUBTRACT_PRODUCT_FROM_CATEGORY_SALES: """
+        UPDATE sales_by_category_day
+        SET order_count = sales_by_category_day.order_count - s.order_count,
+            revenue = sales_by_category_day.revenue - s.revenue
+        FROM products p
+        JOIN sales_by_product_day s ON s.product_id = p.id
+        WHERE p.id = ?
+          AND p.category_id = sales_by_category_day.category_id
+          AND s.sales_date = sales_by_category_day.sales_date
+    """,
+    rollup_queries.DELETE_CATEGORY_PRODUCT_SALES: """
+        DELETE FROM sales_by_product_day
+        WHERE product_id IN (SELECT id FROM products WHERE category_id = ?)
+    """,
+    rollup_queries.DELETE_EMPTY_CATEGORY_SALES_OF_PRODUCT: """
+        DELETE FROM sales_by_category_day
+        WHERE category_id = (SELECT category_id FROM products WHERE id = ?)
+          AND order_count = 0
+    """,
+    migration_queries.CREATE_MIGRATIONS_TABLE: """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    # SQLite lets one writer in at a time, so migrations need no extra lock.
+    migration_queries.ACQUIRE_MIGRATION_LOCK: "SELECT 1 AS acquired WHERE ? IS NOT NULL",
+    migration_queries.RELEASE_MIGRATION_LOCK: "SELECT 1 AS released",
+}
+
+
+@lru_cache(maxsize=1024)
+def translate(sql: str) -> str:
+    """
+    Returns the SQLite form of a MariaDB statement.
+
+    Args:
+        sql (str): A statement written for MariaDB with %s placeholders.
+
+    Returns:
+        str: Its registered variant, or the statement with ? placeholders.
+    """
+    variant = VARIANTS.get(sql)
+    if variant is not None:
+        return variant
+    return sql.replace("%s", "?")
@@ -0,0 +1,132 @@
+from config.config import BULK_CONFIG
+from db.backends import backend
+from db.connection import borrow_connection, current_connection
+from db.errors import translate_error
+
+# Share of the statement size limit (max_allowed_packet on MariaDB) a single
+# statement may use; the rest is headroom for escaping, which can grow string
+# values beyond their raw length.
+PACKET_HEADROOM = 0.75
+ROW_OVERHEAD_BYTES = 4
+
+
+def insert_many(statement: str, row_placeholder: str, rows: list[tuple]) -> list[int]:
+    """
+    Inserts rows with multi-row ``INSERT ... VALUES`` statements.
+
+    Rows are split into chunks that fit the backend's statement size and
+    placeholder limits and ``BULK_CONFIG['max_rows']``. Each chunk is
+    committed on its own unless a unit of work is already open, in which case
+    the caller's transaction decides.
+
+    Generated IDs are derived from the first ID of each chunk, which relies on
+    a multi-row insert getting consecutive IDs (InnoDB with
+    ``innodb_autoinc_lock_mode`` 0 or 1, the MariaDB default, and SQLite).
+
+    Args:
+        statement (str): INSERT statement with a ``{rows}`` slot for the VALUES list.
+        row_placeholder (str): Placeholder group for one row, e.g. ``"(%s, %s)"``.
+        rows (list[tuple]): Row values in input order.
+
+    Returns:
+        list[int]: The generated IDs, in input order.
+
+    Raises:
+        DuplicateKeyError: If a row violates a unique key.
+        ForeignKeyError: If a row references a missing row.
+    """
+    if not rows:
+        return []
+
+    owns_transaction = current_connection() is None
+    ids = []
+
+    with borrow_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            packet_limit = backend.max_statement_bytes(cursor) * PACKET_HEADROOM
+            for chunk in _chunk_rows(
+                rows,
+                len(statement),
+                len(row_placeholder),
+                packet_limit,
+                _max_rows(row_placeholder),
+            ):
+                sql = statement.format(rows=", ".join([row_placeholder] * len(chunk)))
+                params = [value for row in chunk for value in row]
+                try:
+                    cursor.execute(sql, params)
+                except backend.Error as error:
+                    translated = translate_error(error)
+                    if translated is error:
+                        raise
+                    raise translated from error
+                first_id = backend.first_insert_id(cursor, len(chunk))
+                ids.extend(range(first_id, first_id + len(chunk)))
+                if owns_transaction:
+                    conn.commit()
+        finally:
+            cursor.close()
+
+    return ids
+
+
+def select_in(query: str, values) -> list[dict]:
+    """
+    Runs a ``WHERE ... IN (...)`` query for many values in a few round trips.
+
+    Args:
+        query (str): SELECT statement with a ``{placeholders}`` slot for the IN list.
+        values: Values to look up; duplicates are ignored.
+
+    Returns:
+        list[dict]: All matching rows, as dictionaries.
+    """
+    values = list(dict.fromkeys(values))
+    if not values:
+        return []
+
+    size = BULK_CONFIG["lookup_chunk_size"]
+    results = []
+
+    with borrow_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        for start in range(0, len(values), size):
+            end = start + size
+            chunk = values[start:end]
+            cursor.execute(
+                query.format(placeholders=", ".join(["%s"] * len(chunk))), chunk
+            )
+            results.extend(cursor.fetchall())
+        cursor.close()
+
+    return results
+
+
+def _max_rows(row_placeholder: str) -> int:
+    max_rows = BULK_CONFIG["max_rows"]
+    if backend.MAX_PARAMETERS:
+        per_row = max(1, row_placeholder.count("%s"))
+        max_rows = min(max_rows, backend.MAX_PARAMETERS // per_row)
+    return max_rows
+
+
+def _chunk_rows(rows, statement_size, placeholder_size, packet_limit, max_rows):
+    chunk = []
+    size = statement_size
+
+    for row in rows:
+        row_size = (
+            placeholder_size
+            + ROW_OVERHEAD_BYTES
+            + sum(len(str(value).encode("utf-8")) + ROW_OVERHEAD_BYTES for value in row)
+        )
+        if chunk and (len(chunk) >= max_rows or size + row_size > packet_limit):
+            yield chunk
+            chunk = []
+            size = statement_size
+        chunk.append(row)
+        size += row_size
+
+    if chunk:
+        yield chunk
@@ -1,23 +1,200 @@
+import threading
 import time
-import mysql.connector
-from mysql.connector import Error
-from config.config import DB_CONFIG
+from contextlib import contextmanager
 
+from config.config import DB_POOL_CONFIG
+from db import instrumentation
+from db.backends import backend
+from db.pooling import (
+    CHECK,
+    CONNECT,
+    NOTIFY,
+    RESET,
+    WAIT,
+    PoolState,
+    UnitOfWork,
+)
+from metrics.registry import REGISTRY, Counter, Gauge
+from tracing import tracer
 
-def get_db_connection(retries=30, delay=1):
+
+class ConnectionPool(PoolState):
+    """
+    Thread-safe pool of database connections.
+
+    The bookkeeping lives in ``PoolState``; this pool advances it under a
+    lock and performs the steps that talk to the database outside of it.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_idle_time: float = 300.0,
+        max_lifetime: float = 3600.0,
+        connect=None,
+    ):
+        """
+        Initializes an empty pool.
+
+        Args:
+            min_size (int): Connections kept open even when idle.
+            max_size (int): Upper bound on open connections.
+            timeout (float): Seconds to wait for a connection before giving up.
+            max_idle_time (float): Seconds an idle connection may sit unused.
+            max_lifetime (float): Seconds a connection may live before being replaced.
+            connect (callable, optional): Factory for new physical connections.
+        """
+        super().__init__(min_size, max_size, timeout, max_idle_time, max_lifetime)
+        self._connect = connect or open_connection
+        self._lock = threading.Condition()
+
+    def acquire(self, timeout: float = None):
+        """
+        Borrows a validated connection from the pool.
+
+        Args:
+            timeout (float, optional): Overrides the pool timeout for this call.
+
+        Returns:
+            An open connection reserved for the caller.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for the whole timeout.
+        """
+        return self._run(self.acquire_steps(timeout))
+
+    def release(self, connection, discard: bool = False) -> None:
+        """
+        Returns a borrowed connection to the pool.
+
+        Any transaction left open by the borrower is rolled back so the next
+        caller never sees a stale snapshot or half-finished writes.
+
+        Args:
+            connection: A connection previously returned by ``acquire``.
+            discard (bool): Drop the connection instead of reusing it, e.g. when
+                an unbuffered result set was abandoned halfway through.
+        """
+        self._run(self.release_steps(connection, discard))
+
+    def owns(self, connection) -> bool:
+        with self._lock:
+            return super().owns(connection)
+
+    def fill(self) -> None:
+        """
+        Opens connections until at least ``min_size`` are available.
+        """
+        self._run(self.fill_steps())
+
+    def close_all(self) -> None:
+        """
+        Closes every idle connection. Borrowed connections are closed on release.
+        """
+        self._run(self.close_all_steps())
+
+    def stats(self) -> dict:
+        with self._lock:
+            return super().stats()
+
+    def _run(self, steps):
+        # Advance the state under the lock; talk to the database outside it.
+        reply = error = None
+        while True:
+            with self._lock:
+                try:
+                    if error is None:
+                        action, argument = steps.send(reply)
+                    else:
+                        action, argument = steps.throw(error)
+                except StopIteration as done:
+                    return done.value
+                reply = error = None
+                if action == WAIT:
+                    self._lock.wait(argument)
+                    continue
+                if action == NOTIFY:
+                    self._lock.notify()
+                    continue
+            try:
+                reply = self._perform(action, argument)
+            except BaseException as e:
+                error = e
+
+    def _perform(self, action, argument):
+        if action == CONNECT:
+            return self._connect()
+        if action == CHECK:
+            return _is_alive(argument)
+        if action == RESET:
+            return _reset(argument)
+        _close_quietly(argument)
+
+
+_CONNECT_SECONDS = REGISTRY.histogram(
+    "marketflow_db_connect_seconds",
+    "Time to open a database connection, including retries, in seconds.",
+)
+_CONNECT_RETRIES = REGISTRY.counter(
+    "marketflow_db_connect_retries_total",
+    "Connection attempts that failed and were retried.",
+)
+_ACQUIRE_SECONDS = REGISTRY.histogram(
+    "marketflow_db_acquire_seconds",
+    "Time get_db_connection took to hand out a pooled connection, in seconds.",
+)
+
+_POOL_COUNTERS = {
+    "acquired": "Connections handed out by the pool.",
+    "created": "Connections opened by the pool.",
+    "recycled": "Connections closed for their age or idle time.",
+    "discarded": "Broken connections dropped by the pool.",
+    "waits": "Checkouts that had to wait for a free connection.",
+    "timeouts": "Checkouts that gave up waiting.",
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+_close_listeners = []
+_unit_of_work = UnitOfWork("current")
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Returns the process-wide connection pool, creating it on first use.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = ConnectionPool(**DB_POOL_CONFIG)
+                pool.fill()
+                _pool = pool
+    return _pool
+
+
+def open_connection(retries=30, delay=1):
     """
     Attempts to connect to the database, retrying if the connection fails.
+
+    The connection comes from the backend selected by DB_BACKEND, wrapped for
+    per-query timing when query instrumentation is enabled.
     """
+    start = time.perf_counter()
     for attempt in range(retries):
         try:
-            connection = mysql.connector.connect(**DB_CONFIG)
+            connection = backend.connect()
             if connection.is_connected():
                 # print("✅ Successfully connected to the database.")
-                return connection
-        except Error as e:
+                _CONNECT_SECONDS.observe(time.perf_counter() - start)
+                return instrumentation.instrument(connection)
+        except backend.Error as e:
             print(
                 f"⏳ Attempt {attempt + 1}/{retries}: waiting for the database... (Error: {e})"
             )
+            _CONNECT_RETRIES.inc()
             time.sleep(delay)
 
     raise ConnectionError(
@@ -25,10 +202,185 @@ def get_db_connection(retries=30, delay=1):
     )
 
 
-def close_connection(connection):
+def on_connection_closed(callback) -> None:
+    """
+    Registers a callback invoked with each connection right before it is closed.
+
+    Used to release per-connection state such as prepared statements.
+
+    Args:
+        callback (callable): A function taking the connection being closed.
+    """
+    _close_listeners.append(callback)
+
+
+def get_db_connection():
+    """
+    Borrows a connection from the shared pool.
+
+    Pair every call with ``close_connection`` so the connection goes back to the pool.
+    """
+    span = tracer.start_span("db.acquire", {"db.system": backend.NAME})
+    start = time.perf_counter()
+    try:
+        connection = get_pool().acquire()
+    except Exception as error:
+        span.end(error)
+        raise
+    _ACQUIRE_SECONDS.observe(time.perf_counter() - start)
+    span.end()
+    return connection
+
+
+def close_connection(connection, discard: bool = False):
     """
-    Closes the database connection if it is open.
+    Returns a pooled connection to the pool, or closes it if it is not pooled.
+
+    Pass ``discard=True`` to drop a pooled connection that must not be reused.
     """
-    if connection and connection.is_connected():
-        connection.close()
+    if connection is None:
+        return
+    if _pool is not None and _pool.owns(connection):
+        _pool.release(connection, discard=discard)
+    elif connection.is_connected():
+        _close_quietly(connection)
         # print("🔒 Database connection closed.")
+
+
+def current_connection():
+    """
+    Returns the connection of the unit of work open in this context, if any.
+    """
+    return _unit_of_work.current()
+
+
+def after_commit(callback) -> None:
+    """
+    Runs a callback once the current unit of work commits.
+
+    Outside a unit of work the callback runs immediately; if the unit of work
+    rolls back, the callback is dropped.
+
+    Args:
+        callback (callable): A function taking no arguments.
+    """
+    _unit_of_work.after_commit(callback)
+
+
+@contextmanager
+def transaction():
+    """
+    Opens a unit of work shared by every repository call inside the block.
+
+    The first (outermost) ``transaction()`` borrows a pooled connection and
+    commits when the block exits normally or rolls back if it raises. Nested
+    blocks, including the ones opened by repository writes, join the outer
+    unit of work instead of committing on their own.
+
+    Yields:
+        The connection bound to the unit of work.
+    """
+    connection = _unit_of_work.current()
+    if connection is not None:
+        yield connection
+        return
+
+    connection = get_db_connection()
+    try:
+        with _unit_of_work.bind(connection) as callbacks:
+            try:
+                yield connection
+                connection.commit()
+            except BaseException:
+                _rollback_quietly(connection)
+                raise
+    finally:
+        close_connection(connection)
+
+    for callback in callbacks:
+        callback()
+
+
+@contextmanager
+def borrow_connection():
+    """
+    Yields the unit-of-work connection if one is open, otherwise a pooled
+    connection that is returned to the pool when the block exits.
+
+    Intended for reads: nothing is committed here.
+    """
+    connection = _unit_of_work.current()
+    if connection is not None:
+        yield connection
+        return
+
+    connection = get_db_connection()
+    try:
+        yield connection
+    finally:
+        close_connection(connection)
+
+
+def _pool_metrics() -> list:
+    # Read at export time; a process that never opened the pool reports nothing.
+    if _pool is None:
+        return []
+    stats = _pool.stats()
+    connections = Gauge(
+        "marketflow_db_pool_connections",
+        "Pooled connections by state.",
+        ("state",),
+    )
+    connections.set(stats["idle"], "idle")
+    connections.set(stats["in_use"], "in_use")
+    max_size = Gauge("marketflow_db_pool_max_size", "Maximum pooled connections.")
+    max_size.set(stats["max_size"])
+    metrics = [connections, max_size]
+    for key, help in _POOL_COUNTERS.items():
+        counter = Counter(f"marketflow_db_pool_{key}_total", help)
+        counter.inc(amount=stats[key])
+        metrics.append(counter)
+    wait_time = Counter(
+        "marketflow_db_pool_wait_seconds_total",
+        "Time callers spent waiting for a free pooled connection, in seconds.",
+    )
+    wait_time.inc(amount=stats["wait_time"])
+    metrics.append(wait_time)
+    return metrics
+
+
+REGISTRY.add_collector(_pool_metrics)
+
+
+def _is_alive(connection) -> bool:
+    try:
+        return connection.is_connected()
+    except backend.Error:
+        return False
+
+
+def _reset(connection) -> bool:
+    try:
+        if connection.in_transaction:
+            connection.rollback()
+        return True
+    except backend.Error:
+        return False
+
+
+def _rollback_quietly(connection) -> None:
+    try:
+        connection.rollback()
+    except backend.Error:
+        pass
+
+
+def _close_quietly(connection) -> None:
+    for listener in _close_listeners:
+        listener(connection)
+    # shutdown() drops the socket without draining pending result sets, which
+    # close() would do for connections opened with consume_results=True.
+    try:
+        getattr(connection, "shutdown", connection.close)()
+    except backend.Error:
+        pass
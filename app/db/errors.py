@@ -0,0 +1,35 @@
+from db.backends import backend
+
+
+class DuplicateKeyError(Exception):
+    """
+    Raised when a write collides with a unique key (e.g. an email or category name).
+    """
+
+
+class ForeignKeyError(Exception):
+    """
+    Raised when a write references a row that does not exist.
+    """
+
+
+def translate_error(error: Exception) -> Exception:
+    """
+    Maps a driver error to the application's database error, if there is one.
+
+    Args:
+        error (Exception): The error raised by the driver.
+
+    Returns:
+        Exception: The translated error, or the original one.
+    """
+    if backend.is_duplicate_key(error):
+        return DuplicateKeyError(_message(error))
+    if backend.is_foreign_key(error):
+        return ForeignKeyError(_message(error))
+    return error
+
+
+def _message(error: Exception) -> str:
+    # mysql.connector keeps the server message apart from the error number.
+    return getattr(error, "msg", None) or str(error)
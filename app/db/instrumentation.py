@@ -0,0 +1,385 @@
+import importlib
+import json
+import pkgutil
+import re
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import queries
+from config.config import QUERY_LOG_CONFIG
+from db.backends import backend
+from tracing import tracer
+
+# Upper bounds of the latency histogram buckets, in milliseconds; a last
+# bucket counts everything slower.
+LATENCY_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Queries whose string parameters are personal data (client names, emails).
+SENSITIVE_PREFIXES = ("client.",)
+REDACTED = "<redacted>"
+MAX_LOGGED_PARAMS = 20
+
+_EMAIL = re.compile(r"[^@\s]+@[^@\s]+")
+_STATEMENT_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE")
+
+_settings = dict(QUERY_LOG_CONFIG)
+_stats = {}
+_stats_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+
+class QueryStats:
+    """
+    Call count, errors, rows and latency histogram of one named query.
+    """
+
+    __slots__ = ("calls", "errors", "rows", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float, rows: int, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.rows += max(rows, 0)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip([*map(str, LATENCY_BUCKETS_MS), "+Inf"], self.buckets)),
+        }
+
+
+class InstrumentedConnection:
+    """
+    Wraps a driver connection so that every cursor it opens is timed.
+
+    Everything except ``cursor()`` is delegated to the wrapped connection, so
+    the pool, the unit of work and the repositories use it unchanged.
+    """
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(
+            self._connection.cursor(*args, **kwargs), self._connection
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class InstrumentedCursor:
+    """
+    Times each statement from ``execute`` until its result has been read.
+
+    Writes are recorded as soon as they return; reads once the rows are
+    exhausted, the cursor is closed or the next statement starts, so the
+    time spent streaming rows from the server is included. When tracing is
+    on, each statement is also a 'db.query' span with the rows and
+    approximate bytes it returned.
+    """
+
+    __slots__ = ("_cursor", "_connection", "_pending")
+
+    def __init__(self, cursor, connection):
+        self._cursor = cursor
+        self._connection = connection
+        self._pending = None
+
+    def execute(self, sql: str, params=()):
+        self._finish()
+        span = tracer.start_span(
+            "db.query", {"db.system": backend.NAME, "db.query.name": query_name(sql)}
+        )
+        start = time.perf_counter()
+        try:
+            result = self._cursor.execute(sql, params)
+        except Exception as error:
+            _record(sql, params, start, 0, failed=True, connection=None)
+            span.end(error)
+            raise
+        if self._cursor.description is None:
+            rows = self._cursor.rowcount
+            _record(sql, params, start, rows, False, self._connection)
+            span.set("db.rows", rows)
+            span.end()
+        else:
+            # sql, params, start, rows, span, bytes
+            self._pending = [sql, params, start, 0, span, 0]
+        return result
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if self._pending is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._fetched([row])
+        return row
+
+    def fetchmany(self, size: int = 1):
+        rows = self._cursor.fetchmany(size)
+        if self._pending is not None:
+            self._fetched(rows)
+            if len(rows) < size:
+                self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if self._pending is not None:
+            self._fetched(rows)
+            self._finish()
+        return rows
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _fetched(self, rows: list) -> None:
+        self._pending[3] += len(rows)
+        if self._pending[4].recording:
+            self._pending[5] += _payload_bytes(rows)
+
+    def _finish(self) -> None:
+        if self._pending is not None:
+            sql, params, start, rows, span, size = self._pending
+            self._pending = None
+            _record(sql, params, start, rows, False, self._connection)
+            span.set("db.rows", rows)
+            span.set("db.bytes", size)
+            span.end()
+
+
+def enable(slow_ms: float = None, slow_log: str = None, explain: bool = None) -> None:
+    """
+    Turns query instrumentation on, optionally overriding the configured settings.
+
+    Only connections opened afterwards are instrumented; the defaults come
+    from QUERY_INSTRUMENTATION, QUERY_SLOW_MS, QUERY_SLOW_LOG and QUERY_SLOW_EXPLAIN.
+
+    Args:
+        slow_ms (float, optional): Latency above which a query is logged as slow.
+        slow_log (str, optional): JSONL file the slow queries are appended to.
+        explain (bool, optional): Whether to capture the plan of slow queries.
+    """
+    overrides = {"slow_ms": slow_ms, "slow_log": slow_log, "explain": explain}
+    _settings.update({k: v for k, v in overrides.items() if v is not None})
+    _settings["enabled"] = True
+
+
+def disable() -> None:
+    """
+    Stops recording. Connections already instrumented keep a negligible check.
+    """
+    _settings["enabled"] = False
+
+
+def is_enabled() -> bool:
+    return _settings["enabled"]
+
+
+def instrument(connection):
+    """
+    Returns the connection wrapped for timing, or unchanged when both query
+    instrumentation and tracing are off.
+
+    With both off nothing is wrapped, so queries pay no overhead.
+    """
+    if not _settings["enabled"] and not tracer.is_enabled():
+        return connection
+    return InstrumentedConnection(connection)
+
+
+def query_stats() -> dict[str, dict]:
+    """
+    Returns a snapshot of the statistics of every query seen so far.
+
+    Returns:
+        dict[str, dict]: Per query name, its 'calls', 'errors', 'rows',
+        'total_ms', 'mean_ms', 'max_ms' and latency 'buckets' (upper bound in
+        milliseconds to count).
+    """
+    with _stats_lock:
+        return {name: stats.to_dict() for name, stats in _stats.items()}
+
+
+def reset_query_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def format_report(limit: int = 20) -> str:
+    """
+    Formats the queries with the most total time as a fixed-width table.
+
+    Args:
+        limit (int): Maximum number of queries to list.
+
+    Returns:
+        str: The report, one line per query.
+    """
+    ranked = sorted(query_stats().items(), key=lambda item: -item[1]["total_ms"])
+    lines = [
+        f"{'query':<40} {'calls':>8} {'errors':>7} {'mean ms':>9} {'max ms':>9} {'total ms':>10}"
+    ]
+    for name, stats in ranked[:limit]:
+        lines.append(
+            f"{name:<40} {stats['calls']:>8} {stats['errors']:>7} {stats['mean_ms']:>9.2f} "
+            f"{stats['max_ms']:>9.2f} {stats['total_ms']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def query_name(sql: str) -> str:
+    """
+    Returns the stable name of a statement, e.g. 'order.get_all' or 'product.get_by_id'.
+
+    Statements from the queries package are named after their module and
+    constant, without the entity words: ``order_queries.GET_ALL_ORDERS`` is
+    'order.get_all'. Bulk statements built from a ``{rows}`` or
+    ``{placeholders}`` template keep the template's name. Anything else is
+    named after its first keyword, e.g. 'sql.delete'.
+
+    Args:
+        sql (str): The statement text as passed to the driver.
+
+    Returns:
+        str: The query name.
+    """
+    exact, templates = _named_queries()
+    name = exact.get(sql)
+    if name is not None:
+        return name
+    for prefix, template_name in templates:
+        if sql.startswith(prefix):
+            return template_name
+    keyword = sql.strip().split(None, 1)[0].lower() if sql.strip() else "empty"
+    return f"sql.{keyword}"
+
+
+@lru_cache(maxsize=1)
+def _named_queries():
+    exact, templates = {}, []
+    for module_info in pkgutil.iter_modules(queries.__path__):
+        module = importlib.import_module(f"queries.{module_info.name}")
+        entity = module_info.name.removesuffix("_queries")
+        for constant, sql in vars(module).items():
+            if not constant.isupper() or not isinstance(sql, str):
+                continue
+            if not sql.strip().upper().startswith(_STATEMENT_PREFIXES):
+                continue
+            name = f"{entity}.{_action(entity, constant)}"
+            slot = sql.find("{")
+            if slot == -1:
+                exact[sql] = name
+            else:
+                templates.append((sql[:slot], name))
+    # Longest prefix first, so the most specific template wins.
+    templates.sort(key=lambda template: -len(template[0]))
+    return exact, templates
+
+
+def _action(entity: str, constant: str) -> str:
+    entity_words = {entity, entity + "s"}
+    if entity.endswith("y"):
+        entity_words.add(entity[:-1] + "ies")
+    words = [word for word in constant.lower().split("_") if word not in entity_words]
+    return "_".join(words)
+
+
+def _record(sql, params, start, rows, failed, connection) -> None:
+    if not _settings["enabled"]:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    name = query_name(sql)
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = QueryStats()
+        stats.record(elapsed_ms, rows, failed)
+
+    if elapsed_ms >= _settings["slow_ms"]:
+        _log_slow_query(name, sql, params, elapsed_ms, rows, failed, connection)
+
+
+def _log_slow_query(name, sql, params, elapsed_ms, rows, failed, connection) -> None:
+    entry = {
+        "at": datetime.now(timezone.utc).isoformat(),
+        "query": name,
+        "ms": round(elapsed_ms, 3),
+        "rows": rows,
+        "failed": failed,
+        "params": _redact(name, params),
+        "sql": " ".join(sql.split()),
+    }
+    if _settings["explain"] and connection is not None and not failed:
+        entry["plan"] = _explain(connection, sql, params)
+
+    with _log_lock:
+        with open(_settings["slow_log"], "a", encoding="utf-8") as log:
+            log.write(json.dumps(entry, default=str) + "\n")
+
+
+def _explain(connection, sql, params):
+    if not sql.strip().upper().startswith(_STATEMENT_PREFIXES[:4]):
+        return None
+    cursor = connection.cursor(dictionary=True)
+    try:
+        return backend.explain(cursor, sql, params)
+    except backend.Error as error:
+        return f"EXPLAIN failed: {error}"
+    finally:
+        cursor.close()
+
+
+def _payload_bytes(rows: list) -> int:
+    # Approximate: text and binary values by length, anything else as 8 bytes.
+    size = 0
+    for row in rows:
+        for value in row.values() if isinstance(row, dict) else row:
+            if isinstance(value, (str, bytes, bytearray)):
+                size += len(value)
+            elif value is not None:
+                size += 8
+    return size
+
+
+def _redact(name: str, params) -> list:
+    params = list(params or ())
+    sensitive = name.startswith(SENSITIVE_PREFIXES)
+    logged = [
+        (
+            REDACTED
+            if isinstance(value, str) and (sensitive or _EMAIL.search(value))
+            else value
+        )
+        for value in params[:MAX_LOGGED_PARAMS]
+    ]
+    if len(params) > MAX_LOGGED_PARAMS:
+        logged.append(f"... {len(params) - MAX_LOGGED_PARAMS} more")
+    return logged
@@ -0,0 +1,174 @@
+import importlib
+import os
+import pkgutil
+import re
+from collections import namedtuple
+
+import queries
+import queries.migration_queries as q
+from db.backends import backend
+from db.connection import borrow_connection, close_connection, get_db_connection
+
+# Each backend has its own migrations: db/migrations for MariaDB, whose base
+# tables come from docker/mariadb/schema.sql, and db/migrations/sqlite, which
+# also creates the base tables.
+MIGRATIONS_DIR = backend.MIGRATIONS_DIR
+LOCK_TIMEOUT_SECONDS = 30
+
+# Queries that read a whole table on purpose, as "module.CONSTANT".
+FULL_SCAN_ALLOWLIST = {
+    "category_queries.GET_ALL_CATEGORIES",
+    "client_queries.GET_ALL_CLIENTS",
+    "migration_queries.GET_APPLIED_VERSIONS",
+    "order_queries.GET_ALL_ORDERS",
+    "product_queries.GET_ALL_PRODUCTS",
+}
+
+Migration = namedtuple("Migration", ["version", "name", "path"])
+
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+_LIMIT_PARAM = re.compile(r"LIMIT\s+%s", re.IGNORECASE)
+
+
+def discover(directory: str = MIGRATIONS_DIR) -> list[Migration]:
+    """
+    Lists the numbered migration files in a directory.
+
+    Files are named '<version>_<name>.sql', e.g. '0001_catalog_name_indexes.sql'.
+
+    Args:
+        directory (str): Where the migration files live.
+
+    Returns:
+        list[Migration]: The migrations, ordered by version.
+
+    Raises:
+        ValueError: If two files share a version number.
+    """
+    migrations = {}
+    for filename in sorted(os.listdir(directory)):
+        match = _FILENAME.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version: {version}.")
+        migrations[version] = Migration(
+            version, match.group(2), os.path.join(directory, filename)
+        )
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def applied_versions() -> set[int]:
+    """
+    Returns the versions already recorded in the schema_migrations table.
+    """
+    with borrow_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(q.CREATE_MIGRATIONS_TABLE)
+        cursor.execute(q.GET_APPLIED_VERSIONS)
+        versions = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+    return versions
+
+
+def migrate(directory: str = MIGRATIONS_DIR) -> list[Migration]:
+    """
+    Applies every migration that has not been applied yet, in version order.
+
+    Each migration is recorded in schema_migrations once all its statements
+    ran. A server-side lock keeps two processes from migrating at once, and
+    migrations use IF NOT EXISTS so a run interrupted halfway can be repeated.
+
+    Args:
+        directory (str): Where the migration files live.
+
+    Returns:
+        list[Migration]: The migrations applied by this call.
+
+    Raises:
+        RuntimeError: If the migration lock cannot be acquired.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(q.ACQUIRE_MIGRATION_LOCK, (LOCK_TIMEOUT_SECONDS,))
+        if cursor.fetchone()[0] != 1:
+            raise RuntimeError("Could not acquire the migration lock.")
+        try:
+            cursor.execute(q.CREATE_MIGRATIONS_TABLE)
+            cursor.execute(q.GET_APPLIED_VERSIONS)
+            applied = {row[0] for row in cursor.fetchall()}
+
+            pending = [m for m in discover(directory) if m.version not in applied]
+            for migration in pending:
+                for statement in _statements(migration.path):
+                    cursor.execute(statement)
+                cursor.execute(q.RECORD_MIGRATION, (migration.version, migration.name))
+                conn.commit()
+        finally:
+            cursor.execute(q.RELEASE_MIGRATION_LOCK)
+            cursor.fetchall()
+    finally:
+        cursor.close()
+        close_connection(conn)
+
+    return pending
+
+
+def verify_query_plans(allowlist=FULL_SCAN_ALLOWLIST) -> list[str]:
+    """
+    EXPLAINs every query in the queries package and reports full table scans.
+
+    On SQLite the plan comes from EXPLAIN QUERY PLAN, run on each query's
+    SQLite form.
+
+    Placeholders are bound to dummy values, so the plans reflect the indexes
+    available rather than any particular data. Run it against a database
+    holding realistic data: on near-empty tables the optimizer may prefer a
+    scan even where an index exists.
+
+    Args:
+        allowlist (set[str]): Queries allowed to scan, as 'module.CONSTANT'.
+
+    Returns:
+        list[str]: One line per scanning query, e.g.
+            'product_queries.CHECK_PRODUCT_NAME_EXISTS: full scan of products'.
+    """
+    problems = []
+    with borrow_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        for name, sql in _explainable_queries():
+            if name in allowlist:
+                continue
+            sql = _LIMIT_PARAM.sub("LIMIT 20", sql.replace("{placeholders}", "%s"))
+            params = ("1",) * sql.count("%s")
+            for table in backend.full_scans(cursor, sql, params):
+                problems.append(f"{name}: full scan of {table}")
+        cursor.close()
+    return problems
+
+
+def _explainable_queries():
+    for module_info in pkgutil.iter_modules(queries.__path__):
+        module = importlib.import_module(f"queries.{module_info.name}")
+        for constant, sql in vars(module).items():
+            if not constant.isupper() or not isinstance(sql, str):
+                continue
+            statement = sql.strip().upper()
+            if not statement.startswith(("SELECT", "UPDATE", "DELETE", "INSERT")):
+                continue
+            # Plain INSERT ... VALUES reads no table; INSERT ... SELECT does.
+            if statement.startswith("INSERT") and "SELECT" not in statement:
+                continue
+            yield f"{module_info.name}.{constant}", sql
+
+
+def _statements(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as migration_file:
+        lines = [line for line in migration_file if not line.strip().startswith("--")]
+    return [
+        statement.strip()
+        for statement in "".join(lines).split(";")
+        if statement.strip()
+    ]
@@ -0,0 +1,5 @@
+-- Category names are unique; the lookup by name no longer scans the table.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_categories_name ON categories (name);
+
+-- Product names are looked up by equality but are not unique.
+CREATE INDEX IF NOT EXISTS idx_products_name ON products (name);
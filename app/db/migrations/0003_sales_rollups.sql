@@ -0,0 +1,19 @@
+-- Daily sales per product and per category, maintained as orders are placed.
+-- Revenue is the product price at the time the order was recorded.
+CREATE TABLE IF NOT EXISTS sales_by_product_day (
+    sales_date DATE NOT NULL,
+    product_id INT NOT NULL,
+    order_count INT NOT NULL,
+    revenue DECIMAL(14,2) NOT NULL,
+    PRIMARY KEY (sales_date, product_id),
+    KEY idx_sales_product_day_product (product_id, sales_date)
+) CHARACTER SET utf8mb4;
+
+CREATE TABLE IF NOT EXISTS sales_by_category_day (
+    sales_date DATE NOT NULL,
+    category_id INT NOT NULL,
+    order_count INT NOT NULL,
+    revenue DECIMAL(14,2) NOT NULL,
+    PRIMARY KEY (sales_date, category_id),
+    KEY idx_sales_category_day_category (category_id, sales_date)
+) CHARACTER SET utf8mb4;
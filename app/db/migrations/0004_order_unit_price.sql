@@ -0,0 +1,25 @@
+-- Orders keep the price they were placed at, and the sales rollups are
+-- computed from it both as orders are placed and when they are rebuilt, so a
+-- rebuild no longer rewrites past revenue with today's prices.
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS unit_price DECIMAL(10,2) NULL;
+
+-- Existing orders keep a NULL unit_price: there is no price history, and the
+-- product rollup only holds daily totals (rebuilt with current prices), so
+-- no past price can be derived exactly. The rollups count these orders at
+-- the product's current price, which makes their revenue approximate.
+
+-- 0003 created the rollups empty: fill them from every order.
+DELETE FROM sales_by_category_day;
+DELETE FROM sales_by_product_day;
+
+INSERT INTO sales_by_product_day (sales_date, product_id, order_count, revenue)
+SELECT o.order_date, o.product_id, COUNT(*), SUM(COALESCE(o.unit_price, p.price))
+FROM orders o
+JOIN products p ON o.product_id = p.id
+GROUP BY o.order_date, o.product_id;
+
+INSERT INTO sales_by_category_day (sales_date, category_id, order_count, revenue)
+SELECT o.order_date, p.category_id, COUNT(*), SUM(COALESCE(o.unit_price, p.price))
+FROM orders o
+JOIN products p ON o.product_id = p.id
+GROUP BY o.order_date, p.category_id;
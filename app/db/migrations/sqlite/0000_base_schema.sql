@@ -0,0 +1,29 @@
+-- Base tables, matching docker/mariadb/schema.sql.
+-- AUTOINCREMENT keeps IDs from being reused after deletes, as in MariaDB.
+CREATE TABLE IF NOT EXISTS clients (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    price DECIMAL(10,2) NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id INTEGER NOT NULL REFERENCES clients (id) ON DELETE CASCADE,
+    product_id INTEGER NOT NULL REFERENCES products (id) ON DELETE CASCADE,
+    order_date DATE NOT NULL DEFAULT CURRENT_DATE
+);
+
+-- MariaDB indexes foreign key columns implicitly; SQLite needs them spelled out.
+CREATE INDEX IF NOT EXISTS idx_products_category ON products (category_id);
@@ -0,0 +1,4 @@
+-- Orders by date, and a client's or a product's orders by date.
+CREATE INDEX IF NOT EXISTS idx_orders_order_date ON orders (order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_client_date ON orders (client_id, order_date);
+CREATE INDEX IF NOT EXISTS idx_orders_product_date ON orders (product_id, order_date);
@@ -0,0 +1,23 @@
+-- Daily sales per product and per category, maintained as orders are placed.
+-- Revenue is the product price at the time the order was recorded.
+CREATE TABLE IF NOT EXISTS sales_by_product_day (
+    sales_date DATE NOT NULL,
+    product_id INTEGER NOT NULL,
+    order_count INTEGER NOT NULL,
+    revenue DECIMAL(14,2) NOT NULL,
+    PRIMARY KEY (sales_date, product_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sales_product_day_product
+    ON sales_by_product_day (product_id, sales_date);
+
+CREATE TABLE IF NOT EXISTS sales_by_category_day (
+    sales_date DATE NOT NULL,
+    category_id INTEGER NOT NULL,
+    order_count INTEGER NOT NULL,
+    revenue DECIMAL(14,2) NOT NULL,
+    PRIMARY KEY (sales_date, category_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sales_category_day_category
+    ON sales_by_category_day (category_id, sales_date);
@@ -0,0 +1,304 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Steps that need I/O, which PoolState hands to the pool as (action, argument)
+# pairs; the pool performs them blocking or with asyncio and sends back:
+CONNECT = "connect"  # open a new physical connection; send back the connection
+CHECK = "check"  # check the argument connection is alive; send back a bool
+RESET = "reset"  # roll back an open transaction; send back False if that failed
+CLOSE = "close"  # close the argument connection; send back nothing
+WAIT = "wait"  # wait up to argument seconds for a release; send back nothing
+NOTIFY = "notify"  # wake one waiting caller; send back nothing
+
+
+class PoolTimeoutError(ConnectionError):
+    """
+    Raised when no pooled connection becomes available within the pool timeout.
+    """
+
+
+class _PooledConnection:
+    """
+    Bookkeeping for a single physical connection owned by the pool.
+    """
+
+    __slots__ = ("connection", "created_at", "last_used_at")
+
+    def __init__(self, connection):
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used_at = now
+
+
+class PoolState:
+    """
+    Sizes, idle and borrowed connections, and counters of a connection pool.
+
+    Connections are validated on checkout, recycled once they have been idle
+    for longer than ``max_idle_time`` or alive for longer than ``max_lifetime``
+    seconds, and callers wait at most ``timeout`` seconds for a free slot.
+
+    Shared by ``ConnectionPool`` and ``AsyncConnectionPool``, which only differ
+    in how they perform the steps. The ``*_steps`` generators change the state
+    only between steps, so a pool that advances them under its lock (and
+    performs the steps outside of it) never exposes a half-updated pool.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_idle_time: float = 300.0,
+        max_lifetime: float = 3600.0,
+    ):
+        """
+        Initializes an empty pool.
+
+        Args:
+            min_size (int): Connections kept open even when idle.
+            max_size (int): Upper bound on open connections.
+            timeout (float): Seconds to wait for a connection before giving up.
+            max_idle_time (float): Seconds an idle connection may sit unused.
+            max_lifetime (float): Seconds a connection may live before being replaced.
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                "Pool sizes must satisfy 0 <= min_size <= max_size, max_size >= 1."
+            )
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0
+        self._stats = {
+            "acquired": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+        }
+
+    def acquire_steps(self, timeout: float = None):
+        """
+        Checks out a connection: reuses an idle one, opens a new one or waits.
+
+        Args:
+            timeout (float, optional): Overrides the pool timeout for this call.
+
+        Returns:
+            The connection, as the generator's return value.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for the whole timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited_since = None
+
+        while True:
+            entry = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._expired(candidate):
+                    self._size -= 1
+                    self._stats["recycled"] += 1
+                    yield CLOSE, candidate.connection
+                    continue
+                entry = candidate
+                break
+
+            if entry is None and self._size < self.max_size:
+                self._size += 1
+                try:
+                    connection = yield CONNECT, None
+                except BaseException:
+                    self._size -= 1
+                    yield NOTIFY, None
+                    raise
+                entry = _PooledConnection(connection)
+                self._stats["created"] += 1
+            elif entry is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    self._record_wait(waited_since)
+                    raise PoolTimeoutError(
+                        f"❌ No database connection available after {timeout:.1f}s "
+                        f"(pool size {self.max_size})."
+                    )
+                if waited_since is None:
+                    waited_since = time.monotonic()
+                    self._stats["waits"] += 1
+                yield WAIT, remaining
+                continue
+            elif not (yield CHECK, entry.connection):
+                self._size -= 1
+                self._stats["discarded"] += 1
+                yield NOTIFY, None
+                yield CLOSE, entry.connection
+                continue
+
+            entry.last_used_at = time.monotonic()
+            self._in_use[id(entry.connection)] = entry
+            self._stats["acquired"] += 1
+            self._record_wait(waited_since)
+            return entry.connection
+
+    def release_steps(self, connection, discard: bool = False):
+        """
+        Checks a borrowed connection back in, rolling back any open transaction.
+
+        Args:
+            connection: A connection previously checked out of this pool.
+            discard (bool): Drop the connection instead of reusing it.
+        """
+        entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            yield CLOSE, connection
+            return
+
+        healthy = not discard
+        if healthy:
+            healthy = yield RESET, connection
+
+        if healthy and not self._expired(entry):
+            entry.last_used_at = time.monotonic()
+            self._idle.append(entry)
+        else:
+            self._size -= 1
+            self._stats["recycled" if healthy else "discarded"] += 1
+            yield CLOSE, connection
+        yield NOTIFY, None
+
+    def fill_steps(self):
+        """
+        Opens connections until at least ``min_size`` are available.
+        """
+        while self._size < self.min_size:
+            self._size += 1
+            try:
+                connection = yield CONNECT, None
+            except BaseException:
+                self._size -= 1
+                raise
+            self._stats["created"] += 1
+            self._idle.appendleft(_PooledConnection(connection))
+            yield NOTIFY, None
+
+    def close_all_steps(self):
+        """
+        Closes every idle connection. Borrowed connections are closed on release.
+        """
+        idle, self._idle = list(self._idle), deque()
+        self._size -= len(idle)
+        for entry in idle:
+            yield CLOSE, entry.connection
+
+    def exhausted(self) -> bool:
+        """
+        Tells whether a checkout would have to wait.
+        """
+        return not self._idle and self._size >= self.max_size
+
+    def owns(self, connection) -> bool:
+        """
+        Tells whether a connection is currently checked out from this pool.
+        """
+        return id(connection) in self._in_use
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the pool counters.
+
+        Returns:
+            dict: Sizes ('size', 'idle', 'in_use', 'max_size') and cumulative
+            counters ('acquired', 'created', 'recycled', 'discarded', 'waits',
+            'wait_time' in seconds, 'timeouts').
+        """
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "max_size": self.max_size,
+            **self._stats,
+        }
+
+    def _expired(self, entry: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            return True
+        return (
+            now - entry.last_used_at > self.max_idle_time and self._size > self.min_size
+        )
+
+    def _record_wait(self, waited_since) -> None:
+        if waited_since is not None:
+            self._stats["wait_time"] += time.monotonic() - waited_since
+
+
+class UnitOfWork:
+    """
+    The connection and pending after-commit callbacks of the unit of work open
+    in the current context (thread or asyncio task).
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name (str): Distinguishes the context variables, e.g. 'async'.
+        """
+        self._connection = ContextVar(f"marketflow_{name}_connection", default=None)
+        self._callbacks = ContextVar(
+            f"marketflow_{name}_commit_callbacks", default=None
+        )
+
+    def current(self):
+        """
+        Returns the connection of the unit of work open in this context, if any.
+        """
+        return self._connection.get()
+
+    def after_commit(self, callback) -> None:
+        """
+        Runs a callback once the current unit of work commits.
+
+        Outside a unit of work the callback runs immediately; if the unit of work
+        rolls back, the callback is dropped.
+
+        Args:
+            callback (callable): A function taking no arguments.
+        """
+        callbacks = self._callbacks.get()
+        if callbacks is None:
+            callback()
+        else:
+            callbacks.append(callback)
+
+    @contextmanager
+    def bind(self, connection):
+        """
+        Makes a connection the current unit of work for the duration of the block.
+
+        Yields:
+            list: The callbacks registered with ``after_commit`` meanwhile, for
+            the caller to run once it has committed.
+        """
+        callbacks = []
+        token = self._connection.set(connection)
+        callbacks_token = self._callbacks.set(callbacks)
+        try:
+            yield callbacks
+        finally:
+            self._callbacks.reset(callbacks_token)
+            self._connection.reset(token)
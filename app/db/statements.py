@@ -0,0 +1,199 @@
+import threading
+from collections import namedtuple
+
+from config.config import STATEMENT_CONFIG
+from db.backends import backend
+from db.connection import on_connection_closed
+from db.errors import translate_error
+
+ExecuteResult = namedtuple("ExecuteResult", ["rowcount", "lastrowid"])
+
+# Backends without server-side prepared statements always use the text path.
+_prepared = STATEMENT_CONFIG["prepared"] and backend.PREPARED_STATEMENTS
+_registries = {}
+_lock = threading.Lock()
+
+
+class StatementRegistry:
+    """
+    Server-side prepared statements for a single connection.
+
+    Each named statement gets its own prepared cursor, so MariaDB parses it
+    once per connection and later executions only send the parameters.
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes an empty registry bound to a connection.
+
+        Args:
+            connection: The connection the statements are prepared on.
+        """
+        self._connection = connection
+        self._cursors = {}
+
+    def cursor(self, name: str, sql: str):
+        """
+        Returns the prepared cursor for a statement, preparing it on first use.
+
+        Args:
+            name (str): Stable statement name, e.g. 'product.by_id'.
+            sql (str): The statement text.
+
+        Returns:
+            A prepared, dictionary-returning cursor.
+        """
+        cursor = self._cursors.get(name)
+        if cursor is None:
+            cursor = self._connection.cursor(prepared=True, dictionary=True)
+            self._cursors[name] = cursor
+        return cursor
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def close(self) -> None:
+        """
+        Deallocates every prepared statement held by the registry.
+        """
+        cursors, self._cursors = self._cursors, {}
+        for cursor in cursors.values():
+            try:
+                cursor.close()
+            except backend.Error:
+                pass
+
+
+def use_prepared_statements(enabled: bool) -> None:
+    """
+    Switches between prepared statements and the text protocol at runtime.
+
+    Useful to compare the two; the default comes from DB_PREPARED_STATEMENTS.
+    Ignored by backends that cannot prepare statements.
+    """
+    global _prepared
+    _prepared = enabled and backend.PREPARED_STATEMENTS
+
+
+def registry_for(connection) -> StatementRegistry:
+    """
+    Returns the statement registry of a connection, creating it on first use.
+    """
+    with _lock:
+        registry = _registries.get(id(connection))
+        if registry is None:
+            registry = StatementRegistry(connection)
+            _registries[id(connection)] = registry
+        return registry
+
+
+def fetch_one(connection, name: str, sql: str, params: tuple) -> dict | None:
+    """
+    Runs a single-row lookup and returns its row as a dictionary.
+
+    Args:
+        connection: The connection to run on.
+        name (str): Stable statement name, e.g. 'client.by_id'.
+        sql (str): The statement text.
+        params (tuple): Statement parameters.
+
+    Returns:
+        dict | None: The first row, or None if there is none.
+    """
+    if not _prepared:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+        cursor.close()
+        return row
+
+    cursor = _prepared_cursor(connection, name, sql, params)
+    # Drain the result: a prepared statement cannot run again until it is read.
+    rows = cursor.fetchall()
+    return rows[0] if rows else None
+
+
+def execute(connection, name: str, sql: str, params: tuple) -> ExecuteResult:
+    """
+    Runs a write statement.
+
+    Args:
+        connection: The connection to run on.
+        name (str): Stable statement name, e.g. 'order.create'.
+        sql (str): The statement text.
+        params (tuple): Statement parameters.
+
+    Returns:
+        ExecuteResult: The matched row count and the generated ID, if any.
+
+    Raises:
+        DuplicateKeyError: If the statement violates a unique key.
+        ForeignKeyError: If the statement references a missing row.
+    """
+    try:
+        if not _prepared:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                return ExecuteResult(cursor.rowcount, cursor.lastrowid)
+            finally:
+                cursor.close()
+
+        cursor = _prepared_cursor(connection, name, sql, params)
+        return ExecuteResult(cursor.rowcount, cursor.lastrowid)
+    except backend.Error as error:
+        translated = translate_error(error)
+        if translated is error:
+            raise
+        raise translated from error
+
+
+def execute_returning(connection, name: str, sql: str, params: tuple) -> dict | None:
+    """
+    Runs a write statement that returns a row, such as ``UPDATE ... RETURNING``.
+
+    Args:
+        connection: The connection to run on.
+        name (str): Stable statement name, e.g. 'client.update_returning'.
+        sql (str): The statement text.
+        params (tuple): Statement parameters.
+
+    Returns:
+        dict | None: The returned row, or None if the statement matched no row.
+
+    Raises:
+        DuplicateKeyError: If the statement violates a unique key.
+        ForeignKeyError: If the statement references a missing row.
+    """
+    try:
+        return fetch_one(connection, name, sql, params)
+    except backend.Error as error:
+        translated = translate_error(error)
+        if translated is error:
+            raise
+        raise translated from error
+
+
+def _prepared_cursor(connection, name, sql, params):
+    registry = registry_for(connection)
+    try:
+        cursor = registry.cursor(name, sql)
+        cursor.execute(sql, params)
+    except backend.DATA_ERRORS:
+        # Rejected data leaves the prepared statement usable.
+        raise
+    except backend.Error:
+        # The statement may be gone on the server; prepare it afresh next time.
+        _drop_registry(connection)
+        raise
+    return cursor
+
+
+def _drop_registry(connection) -> None:
+    with _lock:
+        registry = _registries.pop(id(connection), None)
+    if registry is not None:
+        registry.close()
+
+
+on_connection_closed(_drop_registry)
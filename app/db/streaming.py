@@ -0,0 +1,41 @@
+from typing import Iterator
+
+from config.config import STREAM_CONFIG
+from db.connection import close_connection, get_db_connection
+
+
+def stream_rows(
+    query: str, params: tuple = (), fetch_size: int = None
+) -> Iterator[dict]:
+    """
+    Yields the rows of a query as they arrive from the server.
+
+    The query runs on an unbuffered cursor over its own pooled connection, so
+    only ``fetch_size`` rows are held in memory at a time and other repository
+    calls (including an open unit of work) can run while the caller iterates.
+    If the caller stops early, the connection is dropped rather than drained.
+
+    Args:
+        query (str): The SELECT statement to run.
+        params (tuple): Query parameters.
+        fetch_size (int, optional): Rows read per batch; defaults to
+            ``STREAM_CONFIG['fetch_size']``.
+
+    Yields:
+        dict: One row at a time.
+    """
+    fetch_size = fetch_size or STREAM_CONFIG["fetch_size"]
+    conn = get_db_connection()
+    exhausted = False
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield from rows
+        exhausted = True
+        cursor.close()
+    finally:
+        close_connection(conn, discard=not exhausted)
@@ -0,0 +1,46 @@
+import argparse
+
+from services.order_import_service import OrderImportService
+from utils.wait_for_db import wait_for_db
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import orders from a CSV or JSONL file."
+    )
+    parser.add_argument("path", help="the .csv or .jsonl file to import")
+    parser.add_argument(
+        "--rejects", help="where rejected records go (default: <path>.rejects.jsonl)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, help="records validated and inserted together"
+    )
+    args = parser.parse_args()
+
+    wait_for_db()
+
+    def report(progress):
+        print(
+            f"⏳ {progress.rows:,} rows read, {progress.imported:,} imported, "
+            f"{progress.rejected:,} rejected ({progress.rows_per_second:,.0f} rows/s)"
+        )
+
+    try:
+        result = OrderImportService.import_file(
+            args.path, args.rejects, args.chunk_size, on_chunk=report
+        )
+    except ValueError as ve:
+        parser.error(str(ve))
+
+    print(
+        f"✅ Imported {result.imported:,} of {result.rows:,} orders in {result.seconds:.1f}s "
+        f"({result.rows_per_second:,.0f} rows/s)."
+    )
+    if result.rejected:
+        print(
+            f"⚠️ {result.rejected:,} rejected records written to {args.rejects or args.path + '.rejects.jsonl'}."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,17 @@
-from controllers.client_controller import ClientController
-from controllers.category_controller import CategoryController
-from controllers.product_controller import ProductController
-from controllers.order_controller import OrderController
+import importlib
+import sys
+
+# Menu choice -> (module, class) of its controller. Controllers are imported
+# on first use, so the menu appears before the services, repositories and
+# database driver they depend on are loaded.
+CONTROLLERS = {
+    "1": ("controllers.client_controller", "ClientController"),
+    "2": ("controllers.category_controller", "CategoryController"),
+    "3": ("controllers.product_controller", "ProductController"),
+    "4": ("controllers.order_controller", "OrderController"),
+}
+
+_loaded_controllers = {}
 
 
 def main_menu():
@@ -55,6 +65,45 @@ def order_menu():
     print("=============================")
 
 
+MENUS = {
+    "1": client_menu,
+    "2": category_menu,
+    "3": product_menu,
+    "4": order_menu,
+}
+
+
+def load_controller(choice: str):
+    """
+    Returns the controller of a main-menu choice, importing it on first use.
+
+    The first load also starts the metrics and tracing exporters, when
+    enabled, so they instrument the classes before any of them runs.
+
+    Args:
+        choice (str): A key of CONTROLLERS.
+
+    Returns:
+        type: The controller class.
+    """
+    controller = _loaded_controllers.get(choice)
+    if controller is None:
+        if not _loaded_controllers:
+            start_observability()
+        module_name, class_name = CONTROLLERS[choice]
+        controller = getattr(importlib.import_module(module_name), class_name)
+        _loaded_controllers[choice] = controller
+    return controller
+
+
+def start_observability():
+    from metrics.exporter import start_metrics
+    from tracing.instrument import start_tracing
+
+    start_metrics()
+    start_tracing()
+
+
 def run_menu(controller, menu_function):
     while True:
         menu_function()
@@ -87,14 +136,8 @@ def main():
         main_menu()
         choice = input("Choose an option: ").strip()
 
-        if choice == "1":
-            run_menu(ClientController, client_menu)
-        elif choice == "2":
-            run_menu(CategoryController, category_menu)
-        elif choice == "3":
-            run_menu(ProductController, product_menu)
-        elif choice == "4":
-            run_menu(OrderController, order_menu)
+        if choice in CONTROLLERS:
+            run_menu(load_controller(choice), MENUS[choice])
         elif choice == "0":
             print("\n👋 Exiting MarketFlow. Goodbye!\n")
             break
@@ -103,4 +146,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from cli import run
+
+        sys.exit(run(sys.argv[1:]))
     main()
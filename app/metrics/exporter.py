@@ -0,0 +1,100 @@
+import atexit
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config.config import METRICS_CONFIG
+from metrics.instrument import install
+from metrics.registry import REGISTRY
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would otherwise flood stderr.
+        pass
+
+
+def serve(host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+    """
+    Serves the registry at http://host:port/metrics from a background thread.
+
+    Args:
+        host (str): Interface to bind; the default only accepts local scrapes.
+        port (int): Port to listen on; 0 picks a free one.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call ``shutdown()`` to stop it.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    return server
+
+
+def dump(path: str) -> None:
+    """
+    Writes the registry to a file in the Prometheus text format.
+
+    The file is replaced atomically, so a reader such as node_exporter's
+    textfile collector never sees a half-written dump.
+
+    Args:
+        path (str): Destination file, conventionally ending in '.prom'.
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        file.write(REGISTRY.render())
+    os.replace(temporary, path)
+
+
+def start_file_dump(path: str, interval: float = 15.0) -> threading.Event:
+    """
+    Dumps the registry every ``interval`` seconds and once more at exit.
+
+    Args:
+        path (str): Destination file.
+        interval (float): Seconds between dumps.
+
+    Returns:
+        threading.Event: Set it to stop the periodic dumps.
+    """
+    stopped = threading.Event()
+
+    def run():
+        while not stopped.wait(interval):
+            dump(path)
+
+    threading.Thread(target=run, name="metrics-dump", daemon=True).start()
+    atexit.register(dump, path)
+    return stopped
+
+
+def start_metrics() -> None:
+    """
+    Instruments repositories and services and starts the configured exporters.
+
+    Does nothing unless METRICS_ENABLED is true. METRICS_PORT (0 for none)
+    selects the HTTP endpoint and METRICS_DUMP_PATH the periodic file dump.
+    """
+    if not METRICS_CONFIG["enabled"]:
+        return
+    install()
+    if METRICS_CONFIG["port"]:
+        serve(METRICS_CONFIG["host"], METRICS_CONFIG["port"])
+    if METRICS_CONFIG["dump_path"]:
+        start_file_dump(METRICS_CONFIG["dump_path"], METRICS_CONFIG["dump_interval"])
@@ -0,0 +1,71 @@
+import time
+
+import repositories
+import services
+from metrics.registry import REGISTRY
+from utils.method_hooks import find_classes, hook_static_methods
+
+# Packages whose classes are instrumented, and the layer label they get.
+LAYERS = {
+    "repository": (repositories, "Repository"),
+    "service": (services, "Service"),
+}
+
+_LABELS = ("layer", "class", "method")
+
+CALLS = REGISTRY.counter(
+    "marketflow_method_calls_total", "Repository and service method calls.", _LABELS
+)
+ERRORS = REGISTRY.counter(
+    "marketflow_method_errors_total",
+    "Repository and service method calls that raised, by exception type.",
+    _LABELS + ("error",),
+)
+DURATION = REGISTRY.histogram(
+    "marketflow_method_duration_seconds",
+    "Repository and service method latency, in seconds.",
+    _LABELS,
+)
+
+
+def install() -> list[str]:
+    """
+    Wraps every public method of the repository and service classes with metrics.
+
+    Classes are patched in place, so no repository or service code has to
+    change. Installing twice leaves methods wrapped once.
+
+    Returns:
+        list[str]: The instrumented methods, as 'Class.method'.
+    """
+    instrumented = []
+    for layer, (package, suffix) in LAYERS.items():
+        for cls in find_classes(package, suffix):
+            instrumented.extend(instrument_class(cls, layer))
+    return instrumented
+
+
+def instrument_class(cls, layer: str) -> list[str]:
+    """
+    Wraps the public static methods of one class with call, error and latency metrics.
+
+    Args:
+        cls (type): The class to patch.
+        layer (str): The 'layer' label, e.g. 'repository'.
+
+    Returns:
+        list[str]: The instrumented methods, as 'Class.method'.
+    """
+
+    def on_start(class_name, method):
+        return (layer, class_name, method), time.perf_counter()
+
+    return hook_static_methods(cls, "__metrics_hook__", on_start, _on_finish)
+
+
+def _on_finish(state, error, result) -> None:
+    labels, start = state
+    if error is not None:
+        ERRORS.inc(*labels, type(error).__name__)
+    CALLS.inc(*labels)
+    DURATION.observe(time.perf_counter() - start, *labels)
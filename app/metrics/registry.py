@@ -0,0 +1,223 @@
+import math
+import threading
+from bisect import bisect_left
+
+# Upper bounds of the latency buckets, in seconds.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    """
+    Base of the metric types: a name, a help text and one series per label values.
+    """
+
+    type = None
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _check(self, label_values: tuple) -> None:
+        if len(label_values) != len(self.labels):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labels}, got {label_values}."
+            )
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        """
+        Returns the current samples as (sample name, labels, value) tuples.
+        """
+        with self._lock:
+            series = list(self._series.items())
+        return [
+            (self.name, dict(zip(self.labels, values)), value)
+            for values, value in series
+        ]
+
+
+class Counter(_Metric):
+    """
+    A value that only goes up, such as calls or errors.
+    """
+
+    type = "counter"
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        self._check(label_values)
+        with self._lock:
+            self._series[label_values] = self._series.get(label_values, 0) + amount
+
+
+class Gauge(_Metric):
+    """
+    A value that goes up and down, such as open connections.
+    """
+
+    type = "gauge"
+
+    def set(self, value: float, *label_values) -> None:
+        self._check(label_values)
+        with self._lock:
+            self._series[label_values] = value
+
+
+class Histogram(_Metric):
+    """
+    Observations counted into cumulative buckets, with their sum and count.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labels: tuple = (), buckets=LATENCY_BUCKETS
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values) -> None:
+        self._check(label_values)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # One count per bucket plus +Inf, then the sum.
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [
+                    0.0
+                ]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            series = [(values, list(counts)) for values, counts in self._series.items()]
+        samples = []
+        for values, counts in series:
+            labels = dict(zip(self.labels, values))
+            cumulative = 0
+            for bound, count in zip([*self.buckets, math.inf], counts):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _number(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", labels, counts[-1]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    """
+    The metrics of a process, rendered together in the Prometheus text format.
+
+    Besides metrics updated as things happen, collectors are called at render
+    time for values that are cheaper to read on demand, such as pool sizes.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Adds a metric, or returns the one already registered under its name.
+
+        Args:
+            metric (_Metric): A Counter, Gauge or Histogram.
+
+        Returns:
+            _Metric: The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: tuple = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))
+
+    def histogram(
+        self, name: str, help: str, labels: tuple = (), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def add_collector(self, collector) -> None:
+        """
+        Registers a callable returning extra metrics to render on every export.
+
+        Args:
+            collector (callable): Takes no arguments and returns a list of metrics.
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (0.0.4).
+
+        Returns:
+            str: The exposition, ending with a newline.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{key}="{_escape_label(str(value))}"' for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+# The registry every MarketFlow metric is registered in.
+REGISTRY = Registry()
@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from db.migrate import migrate, verify_query_plans
+from utils.wait_for_db import wait_for_db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations.")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="EXPLAIN every query afterwards and fail on full table scans",
+    )
+    args = parser.parse_args()
+
+    wait_for_db()
+    applied = migrate()
+    for migration in applied:
+        print(f"✅ Applied migration {migration.version:04d}_{migration.name}.")
+    if not applied:
+        print("ℹ️ Schema is up to date.")
+
+    if args.verify:
+        problems = verify_query_plans()
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("✅ No query scans a whole table.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ class Category:
         name (str): Name of the category.
     """
 
+    __slots__ = ("id", "name")
+
     def __init__(self, id: int = None, name: str = ""):
         """
         Initializes a Category instance with basic sanitization.
@@ -40,6 +42,22 @@ class Category:
         """
         return cls(id=data.get("id"), name=data.get("name", ""))
 
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates a Category instance from a database row without re-sanitizing it.
+
+        Args:
+            row (dict): A row with the 'id' and 'name' columns.
+
+        Returns:
+            Category: A populated Category object.
+        """
+        category = cls.__new__(cls)
+        category.id = row["id"]
+        category.name = row["name"]
+        return category
+
     def __repr__(self) -> str:
         """
         Returns a developer-friendly string representation of the category.
@@ -8,6 +8,8 @@ class Client:
         email (str): Email address of the client.
     """
 
+    __slots__ = ("id", "name", "email")
+
     def __init__(self, id: int = None, name: str = "", email: str = ""):
         """
         Initializes a Client instance with basic sanitization.
@@ -45,6 +47,23 @@ class Client:
             id=data.get("id"), name=data.get("name", ""), email=data.get("email", "")
         )
 
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates a Client instance from a database row without re-sanitizing it.
+
+        Args:
+            row (dict): A row with the 'id', 'name' and 'email' columns.
+
+        Returns:
+            Client: A populated Client object.
+        """
+        client = cls.__new__(cls)
+        client.id = row["id"]
+        client.name = row["name"]
+        client.email = row["email"]
+        return client
+
     def __repr__(self) -> str:
         """
         Returns a developer-friendly string representation of the client.
@@ -0,0 +1,71 @@
+from datetime import date
+
+
+class DailySales:
+    """
+    Sales totals for a single day, read from the sales rollups.
+
+    Attributes:
+        sales_date (date): The day the orders were placed.
+        order_count (int): Number of orders placed that day.
+        revenue (float): Sum of the ordered products' prices.
+    """
+
+    __slots__ = ("sales_date", "order_count", "revenue")
+
+    def __init__(
+        self, sales_date: date = None, order_count: int = 0, revenue: float = 0.0
+    ):
+        """
+        Initializes a DailySales instance.
+
+        Args:
+            sales_date (date): The day the totals refer to.
+            order_count (int): Number of orders.
+            revenue (float): Total revenue.
+        """
+        self.sales_date = sales_date
+        self.order_count = int(order_count)
+        self.revenue = round(float(revenue), 2)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the daily totals into a dictionary.
+
+        Returns:
+            dict: A dictionary with keys 'sales_date', 'order_count' and 'revenue'.
+        """
+        return {
+            "sales_date": self.sales_date.isoformat(),
+            "order_count": self.order_count,
+            "revenue": self.revenue,
+        }
+
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates a DailySales instance from an aggregated rollup row.
+
+        Args:
+            row (dict): A row with 'sales_date', 'order_count' and 'revenue'.
+
+        Returns:
+            DailySales: A populated DailySales object.
+        """
+        sales = cls.__new__(cls)
+        sales.sales_date = row["sales_date"]
+        sales.order_count = int(row["order_count"])
+        sales.revenue = float(row["revenue"])
+        return sales
+
+    def __repr__(self) -> str:
+        """
+        Returns a developer-friendly string representation of the daily totals.
+
+        Returns:
+            str: Representation showing the date, order count and revenue.
+        """
+        return (
+            f"<DailySales sales_date={self.sales_date} "
+            f"order_count={self.order_count} revenue={self.revenue:.2f}>"
+        )
@@ -12,6 +12,8 @@ class Order:
         order_date (date): Date when the order was placed.
     """
 
+    __slots__ = ("id", "client_id", "product_id", "order_date")
+
     def __init__(
         self,
         id: int = None,
@@ -65,6 +67,24 @@ class Order:
             order_date=data.get("order_date", date.today()),
         )
 
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates an Order instance from a database row without applying defaults.
+
+        Args:
+            row (dict): A row with the 'id', 'client_id', 'product_id' and 'order_date' columns.
+
+        Returns:
+            Order: A populated Order object.
+        """
+        order = cls.__new__(cls)
+        order.id = row["id"]
+        order.client_id = row["client_id"]
+        order.product_id = row["product_id"]
+        order.order_date = row["order_date"]
+        return order
+
     def __repr__(self) -> str:
         """
         Returns a developer-friendly string representation of the order.
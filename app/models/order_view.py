@@ -0,0 +1,135 @@
+from datetime import date
+
+
+class OrderView:
+    """
+    Read-side projection of an order joined with its client and product.
+
+    Attributes:
+        id (int): Unique identifier of the order.
+        client_id (int): ID of the client who made the order.
+        product_id (int): ID of the product being ordered.
+        order_date (date): Date when the order was placed.
+        client_name (str): Name of the client.
+        client_email (str): Email address of the client.
+        product_name (str): Name of the product.
+        product_price (float): Current price of the product.
+    """
+
+    __slots__ = (
+        "id",
+        "client_id",
+        "product_id",
+        "order_date",
+        "client_name",
+        "client_email",
+        "product_name",
+        "product_price",
+    )
+
+    def __init__(
+        self,
+        id: int = None,
+        client_id: int = None,
+        product_id: int = None,
+        order_date: date = None,
+        client_name: str = "",
+        client_email: str = "",
+        product_name: str = "",
+        product_price: float = 0.0,
+    ):
+        """
+        Initializes an OrderView instance.
+
+        Args:
+            id (int, optional): The unique identifier of the order.
+            client_id (int): The client's ID.
+            product_id (int): The product's ID.
+            order_date (date): Date of the order.
+            client_name (str): The client's name.
+            client_email (str): The client's email address.
+            product_name (str): The product's name.
+            product_price (float): The product's price.
+        """
+        self.id = id
+        self.client_id = client_id
+        self.product_id = product_id
+        self.order_date = order_date
+        self.client_name = client_name
+        self.client_email = client_email
+        self.product_name = product_name
+        self.product_price = round(float(product_price), 2)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the order view into a dictionary.
+
+        Returns:
+            dict: A dictionary with the order fields and the joined client and product fields.
+        """
+        return {
+            "id": self.id,
+            "client_id": self.client_id,
+            "product_id": self.product_id,
+            "order_date": self.order_date.isoformat(),
+            "client_name": self.client_name,
+            "client_email": self.client_email,
+            "product_name": self.product_name,
+            "product_price": self.product_price,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates an OrderView instance from a joined order row.
+
+        Args:
+            data (dict): A dictionary containing order, client and product fields.
+
+        Returns:
+            OrderView: A populated OrderView object.
+        """
+        return cls(
+            id=data.get("id"),
+            client_id=data.get("client_id"),
+            product_id=data.get("product_id"),
+            order_date=data.get("order_date"),
+            client_name=data.get("client_name", ""),
+            client_email=data.get("client_email", ""),
+            product_name=data.get("product_name", ""),
+            product_price=data.get("product_price", 0.0),
+        )
+
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates an OrderView instance from a joined database row without re-sanitizing it.
+
+        Args:
+            row (dict): A row from the order join queries.
+
+        Returns:
+            OrderView: A populated OrderView object.
+        """
+        view = cls.__new__(cls)
+        view.id = row["id"]
+        view.client_id = row["client_id"]
+        view.product_id = row["product_id"]
+        view.order_date = row["order_date"]
+        view.client_name = row["client_name"]
+        view.client_email = row["client_email"]
+        view.product_name = row["product_name"]
+        view.product_price = float(row["product_price"])
+        return view
+
+    def __repr__(self) -> str:
+        """
+        Returns a developer-friendly string representation of the order view.
+
+        Returns:
+            str: Representation showing the order and its client and product names.
+        """
+        return (
+            f"<OrderView id={self.id} client='{self.client_name}' "
+            f"product='{self.product_name}' order_date={self.order_date}>"
+        )
@@ -9,6 +9,8 @@ class Product:
         category_id (int): ID of the category the product belongs to.
     """
 
+    __slots__ = ("id", "name", "price", "category_id")
+
     def __init__(
         self,
         id: int = None,
@@ -62,6 +64,26 @@ class Product:
             category_id=data.get("category_id"),
         )
 
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates a Product instance from a database row without re-sanitizing it.
+
+        The price column is DECIMAL(10,2), so it only needs converting to float.
+
+        Args:
+            row (dict): A row with the 'id', 'name', 'price' and 'category_id' columns.
+
+        Returns:
+            Product: A populated Product object.
+        """
+        product = cls.__new__(cls)
+        product.id = row["id"]
+        product.name = row["name"]
+        product.price = float(row["price"])
+        product.category_id = row["category_id"]
+        return product
+
     def __repr__(self) -> str:
         """
         Returns a developer-friendly string representation of the product.
@@ -0,0 +1,73 @@
+class SalesTotal:
+    """
+    Sales totals of one product or category over a date range.
+
+    Attributes:
+        id (int): ID of the product or category.
+        name (str): Name of the product or category.
+        order_count (int): Number of orders in the range.
+        revenue (float): Sum of the ordered products' prices.
+    """
+
+    __slots__ = ("id", "name", "order_count", "revenue")
+
+    def __init__(
+        self, id: int = None, name: str = "", order_count: int = 0, revenue: float = 0.0
+    ):
+        """
+        Initializes a SalesTotal instance.
+
+        Args:
+            id (int): ID of the product or category.
+            name (str): Its name.
+            order_count (int): Number of orders.
+            revenue (float): Total revenue.
+        """
+        self.id = id
+        self.name = name
+        self.order_count = int(order_count)
+        self.revenue = round(float(revenue), 2)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the totals into a dictionary.
+
+        Returns:
+            dict: A dictionary with keys 'id', 'name', 'order_count' and 'revenue'.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "order_count": self.order_count,
+            "revenue": self.revenue,
+        }
+
+    @classmethod
+    def from_row(cls, row: dict):
+        """
+        Creates a SalesTotal instance from an aggregated rollup row.
+
+        Args:
+            row (dict): A row with 'id', 'name', 'order_count' and 'revenue'.
+
+        Returns:
+            SalesTotal: A populated SalesTotal object.
+        """
+        total = cls.__new__(cls)
+        total.id = row["id"]
+        total.name = row["name"]
+        total.order_count = int(row["order_count"])
+        total.revenue = float(row["revenue"])
+        return total
+
+    def __repr__(self) -> str:
+        """
+        Returns a developer-friendly string representation of the totals.
+
+        Returns:
+            str: Representation showing id, name, order count and revenue.
+        """
+        return (
+            f"<SalesTotal id={self.id} name='{self.name}' "
+            f"order_count={self.order_count} revenue={self.revenue:.2f}>"
+        )
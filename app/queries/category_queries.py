@@ -15,6 +15,22 @@ GET_ALL_CATEGORIES = """
     ORDER BY id
 """
 
+GET_CATEGORIES_PAGE_AFTER = """
+    SELECT id, name
+    FROM categories
+    WHERE id > %s
+    ORDER BY id
+    LIMIT %s
+"""
+
+GET_CATEGORIES_PAGE_BEFORE = """
+    SELECT id, name
+    FROM categories
+    WHERE id < %s
+    ORDER BY id DESC
+    LIMIT %s
+"""
+
 UPDATE_CATEGORY = """
     UPDATE categories
     SET name = %s
@@ -31,3 +47,28 @@ CHECK_CATEGORY_NAME_EXISTS = """
     FROM categories
     WHERE name = %s
 """
+
+CREATE_CATEGORIES_BULK = """
+    INSERT INTO categories (name)
+    VALUES {rows}
+"""
+
+CATEGORY_VALUES_ROW = "(%s)"
+
+GET_EXISTING_CATEGORY_IDS = """
+    SELECT id
+    FROM categories
+    WHERE id IN ({placeholders})
+"""
+
+GET_EXISTING_CATEGORY_NAMES = """
+    SELECT name
+    FROM categories
+    WHERE name IN ({placeholders})
+"""
+
+GET_CATEGORY_NAMES_BY_IDS = """
+    SELECT id, name
+    FROM categories
+    WHERE id IN ({placeholders})
+"""
@@ -15,14 +15,62 @@ GET_ALL_CLIENTS = """
     ORDER BY id
 """
 
+GET_CLIENTS_PAGE_AFTER = """
+    SELECT id, name, email
+    FROM clients
+    WHERE id > %s
+    ORDER BY id
+    LIMIT %s
+"""
+
+GET_CLIENTS_PAGE_BEFORE = """
+    SELECT id, name, email
+    FROM clients
+    WHERE id < %s
+    ORDER BY id DESC
+    LIMIT %s
+"""
+
 UPDATE_CLIENT = """
     UPDATE clients
     SET email = %s
     WHERE id = %s
 """
 
+UPDATE_CLIENT_RETURNING = """
+    UPDATE clients
+    SET email = %s
+    WHERE id = %s
+    RETURNING id, name, email
+"""
+
 CHECK_EMAIL_EXISTS = """
     SELECT COUNT(*) as count
     FROM clients
     WHERE email = %s
 """
+
+CREATE_CLIENTS_BULK = """
+    INSERT INTO clients (name, email)
+    VALUES {rows}
+"""
+
+CLIENT_VALUES_ROW = "(%s, %s)"
+
+GET_EXISTING_CLIENT_IDS = """
+    SELECT id
+    FROM clients
+    WHERE id IN ({placeholders})
+"""
+
+GET_EXISTING_EMAILS = """
+    SELECT email
+    FROM clients
+    WHERE email IN ({placeholders})
+"""
+
+GET_CLIENT_NAMES_BY_IDS = """
+    SELECT id, name
+    FROM clients
+    WHERE id IN ({placeholders})
+"""
@@ -0,0 +1,22 @@
+CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    ) CHARACTER SET utf8mb4
+"""
+
+GET_APPLIED_VERSIONS = """
+    SELECT version
+    FROM schema_migrations
+    ORDER BY version
+"""
+
+RECORD_MIGRATION = """
+    INSERT INTO schema_migrations (version, name)
+    VALUES (%s, %s)
+"""
+
+ACQUIRE_MIGRATION_LOCK = "SELECT GET_LOCK('marketflow_migrations', %s) AS acquired"
+
+RELEASE_MIGRATION_LOCK = "SELECT RELEASE_LOCK('marketflow_migrations') AS released"
@@ -1,6 +1,19 @@
 CREATE_ORDER = """
-    INSERT INTO orders (client_id, product_id, order_date)
-    VALUES (%s, %s, %s)
+    INSERT INTO orders (client_id, product_id, order_date, unit_price)
+    VALUES (%s, %s, %s, (SELECT price FROM products WHERE id = %s))
+"""
+
+CREATE_ORDER_IF_REFERENCED = """
+    INSERT INTO orders (client_id, product_id, order_date, unit_price)
+    SELECT %s, %s, %s, p.price
+    FROM products p
+    WHERE EXISTS (SELECT 1 FROM clients WHERE id = %s)
+      AND p.id = %s
+"""
+
+CHECK_ORDER_REFERENCES = """
+    SELECT EXISTS (SELECT 1 FROM clients WHERE id = %s) AS client_exists,
+           EXISTS (SELECT 1 FROM products WHERE id = %s) AS product_exists
 """
 
 GET_ORDER_BY_ID = """
@@ -23,8 +36,40 @@ GET_ALL_ORDERS = """
     ORDER BY o.id
 """
 
+GET_ORDERS_PAGE_AFTER = """
+    SELECT o.id, o.client_id, o.product_id, o.order_date,
+           c.name AS client_name, c.email AS client_email,
+           p.name AS product_name, p.price AS product_price
+    FROM orders o
+    JOIN clients c ON o.client_id = c.id
+    JOIN products p ON o.product_id = p.id
+    WHERE o.id > %s
+    ORDER BY o.id
+    LIMIT %s
+"""
+
+GET_ORDERS_PAGE_BEFORE = """
+    SELECT o.id, o.client_id, o.product_id, o.order_date,
+           c.name AS client_name, c.email AS client_email,
+           p.name AS product_name, p.price AS product_price
+    FROM orders o
+    JOIN clients c ON o.client_id = c.id
+    JOIN products p ON o.product_id = p.id
+    WHERE o.id < %s
+    ORDER BY o.id DESC
+    LIMIT %s
+"""
+
 CHECK_ORDER_EXISTS = """
     SELECT COUNT(*) as count
     FROM orders
     WHERE id = %s
 """
+
+CREATE_ORDERS_BULK = """
+    INSERT INTO orders (client_id, product_id, order_date, unit_price)
+    VALUES {rows}
+"""
+
+# Takes client_id, product_id, order_date and product_id again for the price.
+ORDER_VALUES_ROW = "(%s, %s, %s, (SELECT price FROM products WHERE id = %s))"
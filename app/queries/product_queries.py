@@ -15,12 +15,35 @@ GET_ALL_PRODUCTS = """
     ORDER BY id
 """
 
+GET_PRODUCTS_PAGE_AFTER = """
+    SELECT id, name, price, category_id
+    FROM products
+    WHERE id > %s
+    ORDER BY id
+    LIMIT %s
+"""
+
+GET_PRODUCTS_PAGE_BEFORE = """
+    SELECT id, name, price, category_id
+    FROM products
+    WHERE id < %s
+    ORDER BY id DESC
+    LIMIT %s
+"""
+
 UPDATE_PRODUCT = """
     UPDATE products
     SET price = %s
     WHERE id = %s
 """
 
+UPDATE_PRODUCT_RETURNING = """
+    UPDATE products
+    SET price = %s
+    WHERE id = %s
+    RETURNING id, name, price, category_id
+"""
+
 DELETE_PRODUCT = """
     DELETE FROM products
     WHERE id = %s
@@ -31,3 +54,22 @@ CHECK_PRODUCT_NAME_EXISTS = """
     FROM products
     WHERE name = %s
 """
+
+CREATE_PRODUCTS_BULK = """
+    INSERT INTO products (name, price, category_id)
+    VALUES {rows}
+"""
+
+PRODUCT_VALUES_ROW = "(%s, %s, %s)"
+
+GET_EXISTING_PRODUCT_IDS = """
+    SELECT id
+    FROM products
+    WHERE id IN ({placeholders})
+"""
+
+GET_PRODUCT_NAMES_BY_IDS = """
+    SELECT id, name
+    FROM products
+    WHERE id IN ({placeholders})
+"""
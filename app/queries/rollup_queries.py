@@ -0,0 +1,115 @@
+# Revenue counts each order at the price it was placed at (orders.unit_price).
+# Orders from before migration 0004 have no recorded price, so a rebuild
+# counts them at the product's current price: an approximation.
+ADD_PRODUCT_SALES_FOR_ORDERS = """
+    INSERT INTO sales_by_product_day (sales_date, product_id, order_count, revenue)
+    SELECT o.order_date, o.product_id, COUNT(*), SUM(o.unit_price)
+    FROM orders o
+    WHERE o.id BETWEEN %s AND %s
+    GROUP BY o.order_date, o.product_id
+    ON DUPLICATE KEY UPDATE
+        order_count = sales_by_product_day.order_count + VALUES(order_count),
+        revenue = sales_by_product_day.revenue + VALUES(revenue)
+"""
+
+ADD_CATEGORY_SALES_FOR_ORDERS = """
+    INSERT INTO sales_by_category_day (sales_date, category_id, order_count, revenue)
+    SELECT o.order_date, p.category_id, COUNT(*), SUM(o.unit_price)
+    FROM orders o
+    JOIN products p ON o.product_id = p.id
+    WHERE o.id BETWEEN %s AND %s
+    GROUP BY o.order_date, p.category_id
+    ON DUPLICATE KEY UPDATE
+        order_count = sales_by_category_day.order_count + VALUES(order_count),
+        revenue = sales_by_category_day.revenue + VALUES(revenue)
+"""
+
+DELETE_PRODUCT_SALES_IN_RANGE = """
+    DELETE FROM sales_by_product_day
+    WHERE sales_date BETWEEN %s AND %s
+"""
+
+DELETE_CATEGORY_SALES_IN_RANGE = """
+    DELETE FROM sales_by_category_day
+    WHERE sales_date BETWEEN %s AND %s
+"""
+
+REBUILD_PRODUCT_SALES_IN_RANGE = """
+    INSERT INTO sales_by_product_day (sales_date, product_id, order_count, revenue)
+    SELECT o.order_date, o.product_id, COUNT(*), SUM(COALESCE(o.unit_price, p.price))
+    FROM orders o
+    JOIN products p ON o.product_id = p.id
+    WHERE o.order_date BETWEEN %s AND %s
+    GROUP BY o.order_date, o.product_id
+"""
+
+REBUILD_CATEGORY_SALES_IN_RANGE = """
+    INSERT INTO sales_by_category_day (sales_date, category_id, order_count, revenue)
+    SELECT o.order_date, p.category_id, COUNT(*), SUM(COALESCE(o.unit_price, p.price))
+    FROM orders o
+    JOIN products p ON o.product_id = p.id
+    WHERE o.order_date BETWEEN %s AND %s
+    GROUP BY o.order_date, p.category_id
+"""
+
+SUBTRACT_PRODUCT_FROM_CATEGORY_SALES = """
+    UPDATE sales_by_category_day c
+    JOIN products p ON p.category_id = c.category_id
+    JOIN sales_by_product_day s ON s.product_id = p.id AND s.sales_date = c.sales_date
+    SET c.order_count = c.order_count - s.order_count,
+        c.revenue = c.revenue - s.revenue
+    WHERE p.id = %s
+"""
+
+DELETE_PRODUCT_SALES = """
+    DELETE FROM sales_by_product_day
+    WHERE product_id = %s
+"""
+
+DELETE_CATEGORY_PRODUCT_SALES = """
+    DELETE s
+    FROM sales_by_product_day s
+    JOIN products p ON s.product_id = p.id
+    WHERE p.category_id = %s
+"""
+
+DELETE_CATEGORY_SALES = """
+    DELETE FROM sales_by_category_day
+    WHERE category_id = %s
+"""
+
+DELETE_EMPTY_CATEGORY_SALES_OF_PRODUCT = """
+    DELETE c
+    FROM sales_by_category_day c
+    JOIN products p ON p.category_id = c.category_id
+    WHERE p.id = %s AND c.order_count = 0
+"""
+
+GET_DAILY_SALES = """
+    SELECT sales_date, SUM(order_count) AS order_count, SUM(revenue) AS revenue
+    FROM sales_by_category_day
+    WHERE sales_date BETWEEN %s AND %s
+    GROUP BY sales_date
+    ORDER BY sales_date
+"""
+
+GET_PRODUCT_SALES = """
+    SELECT s.product_id AS id, p.name,
+           SUM(s.order_count) AS order_count, SUM(s.revenue) AS revenue
+    FROM sales_by_product_day s
+    JOIN products p ON s.product_id = p.id
+    WHERE s.sales_date BETWEEN %s AND %s
+    GROUP BY s.product_id, p.name
+    ORDER BY revenue DESC, s.product_id
+    LIMIT %s
+"""
+
+GET_CATEGORY_SALES = """
+    SELECT s.category_id AS id, c.name,
+           SUM(s.order_count) AS order_count, SUM(s.revenue) AS revenue
+    FROM sales_by_category_day s
+    JOIN categories c ON s.category_id = c.id
+    WHERE s.sales_date BETWEEN %s AND %s
+    GROUP BY s.category_id, c.name
+    ORDER BY revenue DESC, s.category_id
+"""
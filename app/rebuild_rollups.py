@@ -0,0 +1,29 @@
+import argparse
+from datetime import date
+
+from services.report_service import ReportService
+from utils.wait_for_db import wait_for_db
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily sales rollups from the orders table."
+    )
+    parser.add_argument(
+        "--start", type=date.fromisoformat, help="first day (YYYY-MM-DD)"
+    )
+    parser.add_argument("--end", type=date.fromisoformat, help="last day (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    wait_for_db()
+    try:
+        ReportService.rebuild(args.start, args.end)
+    except ValueError as ve:
+        parser.error(str(ve))
+
+    span = f"{args.start or 'the first order'} to {args.end or 'the last order'}"
+    print(f"✅ Sales rollups rebuilt from {span}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+from db.async_connection import (
+    async_borrow_connection,
+    async_transaction,
+    execute,
+    fetch_all,
+    fetch_in,
+    fetch_one,
+)
+from models.category import Category
+import queries.category_queries as q
+
+
+class AsyncCategoryRepository:
+    """
+    Asyncio counterpart of CategoryRepository, built on the same queries and model.
+    """
+
+    @staticmethod
+    async def create(name: str) -> int:
+        """
+        Inserts a new category into the database.
+
+        Args:
+            name (str): The name of the category.
+
+        Returns:
+            int: The ID of the newly inserted category.
+
+        Raises:
+            DuplicateKeyError: If the name is already in use.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.CREATE_CATEGORY, (name,))
+        return result.lastrowid
+
+    @staticmethod
+    async def existing_ids(category_ids) -> set[int]:
+        """
+        Returns which of the given category IDs exist.
+
+        Args:
+            category_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        async with async_borrow_connection() as conn:
+            rows = await fetch_in(conn, q.GET_EXISTING_CATEGORY_IDS, category_ids)
+        return {row["id"] for row in rows}
+
+    @staticmethod
+    async def get_by_id(category_id: int) -> Category | None:
+        """
+        Retrieves a category by ID.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            Category | None: The Category object, or None if not found.
+        """
+        async with async_borrow_connection() as conn:
+            result = await fetch_one(conn, q.GET_CATEGORY_BY_ID, (category_id,))
+        return Category.from_row(result) if result else None
+
+    @staticmethod
+    async def list_all() -> list[Category]:
+        """
+        Retrieves all categories from the database.
+
+        Returns:
+            list[Category]: A list of all Category objects.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ALL_CATEGORIES)
+        return [Category.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = 20) -> list[Category]:
+        """
+        Retrieves the page of categories that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of categories to return.
+
+        Returns:
+            list[Category]: Up to ``limit`` categories with IDs greater than ``after_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_CATEGORIES_PAGE_AFTER, (after_id, limit)
+            )
+        return [Category.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = 20) -> list[Category]:
+        """
+        Retrieves the page of categories that precedes a given ID (keyset pagination).
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of categories to return.
+
+        Returns:
+            list[Category]: Up to ``limit`` categories with IDs lower than ``before_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_CATEGORIES_PAGE_BEFORE, (before_id, limit)
+            )
+        return [Category.from_row(row) for row in reversed(results)]
+
+    @staticmethod
+    async def update(category_id: int, name: str) -> bool:
+        """
+        Updates a category's name.
+
+        Args:
+            category_id (int): The ID of the category.
+            name (str): The new name.
+
+        Returns:
+            bool: True if the category exists, False otherwise.
+
+        Raises:
+            DuplicateKeyError: If the name belongs to another category.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.UPDATE_CATEGORY, (name, category_id))
+        return result.rowcount > 0
+
+    @staticmethod
+    async def delete(category_id: int) -> bool:
+        """
+        Deletes a category by ID.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            bool: True if the category existed, False otherwise.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.DELETE_CATEGORY, (category_id,))
+        return result.rowcount > 0
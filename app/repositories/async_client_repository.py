@@ -0,0 +1,130 @@
+from db.async_connection import (
+    async_borrow_connection,
+    async_transaction,
+    execute,
+    fetch_all,
+    fetch_in,
+    fetch_one,
+)
+from models.client import Client
+import queries.client_queries as q
+
+
+class AsyncClientRepository:
+    """
+    Asyncio counterpart of ClientRepository, built on the same queries and model.
+    """
+
+    @staticmethod
+    async def create(name: str, email: str) -> int:
+        """
+        Inserts a new client into the database.
+
+        Args:
+            name (str): The name of the client.
+            email (str): The email address of the client.
+
+        Returns:
+            int: The ID of the newly inserted client.
+
+        Raises:
+            DuplicateKeyError: If the email is already registered.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.CREATE_CLIENT, (name, email))
+        return result.lastrowid
+
+    @staticmethod
+    async def existing_ids(client_ids) -> set[int]:
+        """
+        Returns which of the given client IDs exist.
+
+        Args:
+            client_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        async with async_borrow_connection() as conn:
+            rows = await fetch_in(conn, q.GET_EXISTING_CLIENT_IDS, client_ids)
+        return {row["id"] for row in rows}
+
+    @staticmethod
+    async def get_by_id(client_id: int) -> Client | None:
+        """
+        Retrieves a client by ID.
+
+        Args:
+            client_id (int): The ID of the client to retrieve.
+
+        Returns:
+            Client | None: The Client object, or None if not found.
+        """
+        async with async_borrow_connection() as conn:
+            result = await fetch_one(conn, q.GET_CLIENT_BY_ID, (client_id,))
+        return Client.from_row(result) if result else None
+
+    @staticmethod
+    async def list_all() -> list[Client]:
+        """
+        Retrieves all clients from the database.
+
+        Returns:
+            list[Client]: A list of all Client objects.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ALL_CLIENTS)
+        return [Client.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = 20) -> list[Client]:
+        """
+        Retrieves the page of clients that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of clients to return.
+
+        Returns:
+            list[Client]: Up to ``limit`` clients with IDs greater than ``after_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_CLIENTS_PAGE_AFTER, (after_id, limit))
+        return [Client.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = 20) -> list[Client]:
+        """
+        Retrieves the page of clients that precedes a given ID (keyset pagination).
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of clients to return.
+
+        Returns:
+            list[Client]: Up to ``limit`` clients with IDs lower than ``before_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_CLIENTS_PAGE_BEFORE, (before_id, limit)
+            )
+        return [Client.from_row(row) for row in reversed(results)]
+
+    @staticmethod
+    async def update(client_id: int, email: str) -> bool:
+        """
+        Updates a client's email by ID.
+
+        Args:
+            client_id (int): The ID of the client to update.
+            email (str): The new email.
+
+        Returns:
+            bool: True if the client exists, False otherwise.
+
+        Raises:
+            DuplicateKeyError: If the email belongs to another client.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.UPDATE_CLIENT, (email, client_id))
+        return result.rowcount > 0
@@ -0,0 +1,158 @@
+from datetime import date
+from db.async_connection import (
+    async_borrow_connection,
+    async_transaction,
+    execute,
+    fetch_all,
+    fetch_one,
+)
+from db.errors import ForeignKeyError
+from models.order import Order
+from models.order_view import OrderView
+from repositories.async_rollup_repository import AsyncRollupRepository
+import queries.order_queries as q
+
+
+class AsyncOrderRepository:
+    """
+    Asyncio counterpart of OrderRepository, built on the same queries and models.
+    """
+
+    @staticmethod
+    async def create_if_referenced(client_id: int, product_id: int) -> int | None:
+        """
+        Inserts a new order only if its client and product exist, in one statement.
+
+        The order is added to the sales rollups in the same transaction.
+
+        Args:
+            client_id (int): The ID of the client placing the order.
+            product_id (int): The ID of the product being ordered.
+
+        Returns:
+            int | None: The ID of the new order, or None if the client or
+            product does not exist.
+        """
+        params = (client_id, product_id, date.today(), client_id, product_id)
+        try:
+            async with async_transaction() as conn:
+                result = await execute(conn, q.CREATE_ORDER_IF_REFERENCED, params)
+                if not result.rowcount:
+                    return None
+                await AsyncRollupRepository.add_orders(
+                    result.lastrowid, result.lastrowid
+                )
+        except ForeignKeyError:
+            return None
+
+        return result.lastrowid
+
+    @staticmethod
+    async def references_exist(client_id: int, product_id: int) -> tuple[bool, bool]:
+        """
+        Checks whether a client and a product exist, in one query.
+
+        Args:
+            client_id (int): The client ID to check.
+            product_id (int): The product ID to check.
+
+        Returns:
+            tuple[bool, bool]: Whether the client exists and whether the product exists.
+        """
+        async with async_borrow_connection() as conn:
+            row = await fetch_one(
+                conn, q.CHECK_ORDER_REFERENCES, (client_id, product_id)
+            )
+        return bool(row["client_exists"]), bool(row["product_exists"])
+
+    @staticmethod
+    async def get_by_id(order_id: int) -> Order | None:
+        """
+        Retrieves an order by its ID.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            Order | None: The Order object, or None if not found.
+        """
+        async with async_borrow_connection() as conn:
+            result = await fetch_one(conn, q.GET_ORDER_BY_ID, (order_id,))
+        return Order.from_row(result) if result else None
+
+    @staticmethod
+    async def get_view_by_id(order_id: int) -> OrderView | None:
+        """
+        Retrieves an order with its client and product fields.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            OrderView | None: The joined view, or None if not found.
+        """
+        async with async_borrow_connection() as conn:
+            result = await fetch_one(conn, q.GET_ORDER_BY_ID, (order_id,))
+        return OrderView.from_row(result) if result else None
+
+    @staticmethod
+    async def list_all() -> list[Order]:
+        """
+        Retrieves all orders from the database.
+
+        Returns:
+            list[Order]: A list of all Order objects.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ALL_ORDERS)
+        return [Order.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = 20) -> list[Order]:
+        """
+        Retrieves the page of orders that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[Order]: Up to ``limit`` orders with IDs greater than ``after_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ORDERS_PAGE_AFTER, (after_id, limit))
+        return [Order.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = 20) -> list[Order]:
+        """
+        Retrieves the page of orders that precedes a given ID (keyset pagination).
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[Order]: Up to ``limit`` orders with IDs lower than ``before_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_ORDERS_PAGE_BEFORE, (before_id, limit)
+            )
+        return [Order.from_row(row) for row in reversed(results)]
+
+    @staticmethod
+    async def list_view_page(after_id: int = 0, limit: int = 20) -> list[OrderView]:
+        """
+        Retrieves a page of orders with their client and product fields.
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[OrderView]: Up to ``limit`` views with IDs greater than ``after_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ORDERS_PAGE_AFTER, (after_id, limit))
+        return [OrderView.from_row(row) for row in results]
@@ -0,0 +1,142 @@
+from db.async_connection import (
+    async_borrow_connection,
+    async_transaction,
+    execute,
+    fetch_all,
+    fetch_in,
+    fetch_one,
+)
+from models.product import Product
+import queries.product_queries as q
+
+
+class AsyncProductRepository:
+    """
+    Asyncio counterpart of ProductRepository, built on the same queries and model.
+    """
+
+    @staticmethod
+    async def create(name: str, price: float, category_id: int) -> int:
+        """
+        Inserts a new product into the database.
+
+        Args:
+            name (str): Product name.
+            price (float): Product price.
+            category_id (int): ID of the category the product belongs to.
+
+        Returns:
+            int: The ID of the newly created product.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.CREATE_PRODUCT, (name, price, category_id))
+        return result.lastrowid
+
+    @staticmethod
+    async def existing_ids(product_ids) -> set[int]:
+        """
+        Returns which of the given product IDs exist.
+
+        Args:
+            product_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        async with async_borrow_connection() as conn:
+            rows = await fetch_in(conn, q.GET_EXISTING_PRODUCT_IDS, product_ids)
+        return {row["id"] for row in rows}
+
+    @staticmethod
+    async def get_by_id(product_id: int) -> Product | None:
+        """
+        Retrieves a product by ID.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Product | None: The Product object, or None if not found.
+        """
+        async with async_borrow_connection() as conn:
+            result = await fetch_one(conn, q.GET_PRODUCT_BY_ID, (product_id,))
+        return Product.from_row(result) if result else None
+
+    @staticmethod
+    async def list_all() -> list[Product]:
+        """
+        Retrieves all products from the database.
+
+        Returns:
+            list[Product]: A list of all Product objects.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(conn, q.GET_ALL_PRODUCTS)
+        return [Product.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = 20) -> list[Product]:
+        """
+        Retrieves the page of products that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of products to return.
+
+        Returns:
+            list[Product]: Up to ``limit`` products with IDs greater than ``after_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_PRODUCTS_PAGE_AFTER, (after_id, limit)
+            )
+        return [Product.from_row(row) for row in results]
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = 20) -> list[Product]:
+        """
+        Retrieves the page of products that precedes a given ID (keyset pagination).
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of products to return.
+
+        Returns:
+            list[Product]: Up to ``limit`` products with IDs lower than ``before_id``, ascending.
+        """
+        async with async_borrow_connection() as conn:
+            results = await fetch_all(
+                conn, q.GET_PRODUCTS_PAGE_BEFORE, (before_id, limit)
+            )
+        return [Product.from_row(row) for row in reversed(results)]
+
+    @staticmethod
+    async def update(product_id: int, price: float) -> bool:
+        """
+        Updates a product's price.
+
+        Args:
+            product_id (int): ID of the product to update.
+            price (float): New price.
+
+        Returns:
+            bool: True if the product exists, False otherwise.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.UPDATE_PRODUCT, (price, product_id))
+        return result.rowcount > 0
+
+    @staticmethod
+    async def delete(product_id: int) -> bool:
+        """
+        Deletes a product by ID.
+
+        Args:
+            product_id (int): Product ID to delete.
+
+        Returns:
+            bool: True if the product existed, False otherwise.
+        """
+        async with async_transaction() as conn:
+            result = await execute(conn, q.DELETE_PRODUCT, (product_id,))
+        return result.rowcount > 0
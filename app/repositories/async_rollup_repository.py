@@ -0,0 +1,48 @@
+from db.async_connection import async_transaction, execute
+import queries.rollup_queries as q
+
+
+class AsyncRollupRepository:
+    """
+    Asyncio counterpart of the RollupRepository write paths used by the async services.
+    """
+
+    @staticmethod
+    async def add_orders(first_id: int, last_id: int) -> None:
+        """
+        Adds the orders with IDs in a contiguous range to the rollups.
+
+        Must run in the transaction that inserted those orders.
+
+        Args:
+            first_id (int): First order ID of the range.
+            last_id (int): Last order ID of the range, inclusive.
+        """
+        async with async_transaction() as conn:
+            await execute(conn, q.ADD_PRODUCT_SALES_FOR_ORDERS, (first_id, last_id))
+            await execute(conn, q.ADD_CATEGORY_SALES_FOR_ORDERS, (first_id, last_id))
+
+    @staticmethod
+    async def remove_product(product_id: int) -> None:
+        """
+        Removes a product's sales from the rollups before the product is deleted.
+
+        Args:
+            product_id (int): The product about to be deleted.
+        """
+        async with async_transaction() as conn:
+            await execute(conn, q.SUBTRACT_PRODUCT_FROM_CATEGORY_SALES, (product_id,))
+            await execute(conn, q.DELETE_EMPTY_CATEGORY_SALES_OF_PRODUCT, (product_id,))
+            await execute(conn, q.DELETE_PRODUCT_SALES, (product_id,))
+
+    @staticmethod
+    async def remove_category(category_id: int) -> None:
+        """
+        Removes a category's sales, and its products', before the category is deleted.
+
+        Args:
+            category_id (int): The category about to be deleted.
+        """
+        async with async_transaction() as conn:
+            await execute(conn, q.DELETE_CATEGORY_PRODUCT_SALES, (category_id,))
+            await execute(conn, q.DELETE_CATEGORY_SALES, (category_id,))
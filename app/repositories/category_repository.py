@@ -1,4 +1,8 @@
-from db.connection import get_db_connection, close_connection
+from typing import Iterator
+from db.bulk import insert_many, select_in
+from db.connection import borrow_connection, transaction
+from db.statements import execute, fetch_one
+from db.streaming import stream_rows
 from models.category import Category
 import queries.category_queries as q
 
@@ -18,18 +22,74 @@ class CategoryRepository:
 
         Returns:
             int: The ID of the newly inserted category.
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(q.CREATE_CATEGORY, (name,))
-        conn.commit()
-        category_id = cursor.lastrowid
+        Raises:
+            DuplicateKeyError: If the name is already in use.
+        """
+        with transaction() as conn:
+            category_id = execute(
+                conn, "category.create", q.CREATE_CATEGORY, (name,)
+            ).lastrowid
 
-        cursor.close()
-        close_connection(conn)
         return category_id
 
+    @staticmethod
+    def create_many(names: list[str]) -> list[int]:
+        """
+        Inserts many categories using batched multi-row inserts.
+
+        Args:
+            names (list[str]): The category names.
+
+        Returns:
+            list[int]: The IDs of the inserted categories, in input order.
+        """
+        return insert_many(
+            q.CREATE_CATEGORIES_BULK, q.CATEGORY_VALUES_ROW, [(name,) for name in names]
+        )
+
+    @staticmethod
+    def existing_ids(category_ids) -> set[int]:
+        """
+        Returns which of the given category IDs exist.
+
+        Args:
+            category_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        return {
+            row["id"] for row in select_in(q.GET_EXISTING_CATEGORY_IDS, category_ids)
+        }
+
+    @staticmethod
+    def existing_names(names) -> set[str]:
+        """
+        Returns which of the given category names are already in use.
+
+        Args:
+            names: The names to check.
+
+        Returns:
+            set[str]: The subset of names present in the database.
+        """
+        return {row["name"] for row in select_in(q.GET_EXISTING_CATEGORY_NAMES, names)}
+
+    @staticmethod
+    def names_by_ids(category_ids) -> dict[int, str]:
+        """
+        Maps the given category IDs to their names in a single lookup.
+
+        Args:
+            category_ids: The IDs to resolve.
+
+        Returns:
+            dict[int, str]: Names keyed by ID; unknown IDs are left out.
+        """
+        rows = select_in(q.GET_CATEGORY_NAMES_BY_IDS, category_ids)
+        return {row["id"]: row["name"] for row in rows}
+
     @staticmethod
     def get_by_id(category_id: int) -> Category | None:
         """
@@ -41,16 +101,12 @@ class CategoryRepository:
         Returns:
             Category | None: The Category object, or None if not found.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.GET_CATEGORY_BY_ID, (category_id,))
-        result = cursor.fetchone()
-
-        cursor.close()
-        close_connection(conn)
+        with borrow_connection() as conn:
+            result = fetch_one(
+                conn, "category.by_id", q.GET_CATEGORY_BY_ID, (category_id,)
+            )
 
-        return Category.from_dict(result) if result else None
+        return Category.from_row(result) if result else None
 
     @staticmethod
     def list_all() -> list[Category]:
@@ -60,16 +116,67 @@ class CategoryRepository:
         Returns:
             list[Category]: A list of all Category objects.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ALL_CATEGORIES)
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Category.from_row(row) for row in results]
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Category]:
+        """
+        Streams all categories from the database without loading them into memory.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the server per batch.
+
+        Yields:
+            Category: One Category object at a time, ordered by ID.
+        """
+        for row in stream_rows(q.GET_ALL_CATEGORIES, fetch_size=fetch_size):
+            yield Category.from_row(row)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = 20) -> list[Category]:
+        """
+        Retrieves the page of categories that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of categories to return.
+
+        Returns:
+            list[Category]: Up to ``limit`` categories with IDs greater than ``after_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_CATEGORIES_PAGE_AFTER, (after_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Category.from_row(row) for row in results]
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = 20) -> list[Category]:
+        """
+        Retrieves the page of categories that precedes a given ID (keyset pagination).
 
-        cursor.execute(q.GET_ALL_CATEGORIES)
-        results = cursor.fetchall()
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of categories to return.
 
-        cursor.close()
-        close_connection(conn)
+        Returns:
+            list[Category]: Up to ``limit`` categories with IDs lower than ``before_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_CATEGORIES_PAGE_BEFORE, (before_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
 
-        return [Category.from_dict(row) for row in results]
+        return [Category.from_row(row) for row in reversed(results)]
 
     @staticmethod
     def update(category_id: int, name: str) -> bool:
@@ -81,17 +188,19 @@ class CategoryRepository:
             name (str): The new name.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
+            bool: True if the category exists, False otherwise.
 
-        cursor.execute(q.UPDATE_CATEGORY, (name, category_id))
-        conn.commit()
-        updated = cursor.rowcount > 0
+        Raises:
+            DuplicateKeyError: If the name belongs to another category.
+        """
+        with transaction() as conn:
+            updated = (
+                execute(
+                    conn, "category.update", q.UPDATE_CATEGORY, (name, category_id)
+                ).rowcount
+                > 0
+            )
 
-        cursor.close()
-        close_connection(conn)
         return updated
 
     @staticmethod
@@ -103,17 +212,16 @@ class CategoryRepository:
             category_id (int): The ID of the category to delete.
 
         Returns:
-            bool: True if the deletion was successful, False otherwise.
+            bool: True if the category existed, False otherwise.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(q.DELETE_CATEGORY, (category_id,))
-        conn.commit()
-        deleted = cursor.rowcount > 0
+        with transaction() as conn:
+            deleted = (
+                execute(
+                    conn, "category.delete", q.DELETE_CATEGORY, (category_id,)
+                ).rowcount
+                > 0
+            )
 
-        cursor.close()
-        close_connection(conn)
         return deleted
 
     @staticmethod
@@ -127,13 +235,9 @@ class CategoryRepository:
         Returns:
             bool: True if the name exists, False otherwise.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.CHECK_CATEGORY_NAME_EXISTS, (name,))
-        result = cursor.fetchone()
-
-        cursor.close()
-        close_connection(conn)
+        with borrow_connection() as conn:
+            result = fetch_one(
+                conn, "category.name_exists", q.CHECK_CATEGORY_NAME_EXISTS, (name,)
+            )
 
         return result["count"] > 0
@@ -1,4 +1,9 @@
-from db.connection import get_db_connection, close_connection
+from typing import Iterator
+from db.bulk import insert_many, select_in
+from db.backends import backend
+from db.connection import borrow_connection, transaction
+from db.statements import execute, execute_returning, fetch_one
+from db.streaming import stream_rows
 from models.client import Client
 import queries.client_queries as q
 
@@ -19,18 +24,70 @@ class ClientRepository:
 
         Returns:
             int: The ID of the newly inserted client.
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(q.CREATE_CLIENT, (name, email))
-        conn.commit()
-        client_id = cursor.lastrowid
+        Raises:
+            DuplicateKeyError: If the email is already registered.
+        """
+        with transaction() as conn:
+            client_id = execute(
+                conn, "client.create", q.CREATE_CLIENT, (name, email)
+            ).lastrowid
 
-        cursor.close()
-        close_connection(conn)
         return client_id
 
+    @staticmethod
+    def create_many(clients: list[tuple[str, str]]) -> list[int]:
+        """
+        Inserts many clients using batched multi-row inserts.
+
+        Args:
+            clients (list[tuple[str, str]]): (name, email) pairs.
+
+        Returns:
+            list[int]: The IDs of the inserted clients, in input order.
+        """
+        return insert_many(q.CREATE_CLIENTS_BULK, q.CLIENT_VALUES_ROW, clients)
+
+    @staticmethod
+    def existing_ids(client_ids) -> set[int]:
+        """
+        Returns which of the given client IDs exist.
+
+        Args:
+            client_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        return {row["id"] for row in select_in(q.GET_EXISTING_CLIENT_IDS, client_ids)}
+
+    @staticmethod
+    def existing_emails(emails) -> set[str]:
+        """
+        Returns which of the given emails are already registered.
+
+        Args:
+            emails: The emails to check.
+
+        Returns:
+            set[str]: The subset of emails present in the database.
+        """
+        return {row["email"] for row in select_in(q.GET_EXISTING_EMAILS, emails)}
+
+    @staticmethod
+    def names_by_ids(client_ids) -> dict[int, str]:
+        """
+        Maps the given client IDs to their names in a single lookup.
+
+        Args:
+            client_ids: The IDs to resolve.
+
+        Returns:
+            dict[int, str]: Names keyed by ID; unknown IDs are left out.
+        """
+        rows = select_in(q.GET_CLIENT_NAMES_BY_IDS, client_ids)
+        return {row["id"]: row["name"] for row in rows}
+
     @staticmethod
     def get_by_id(client_id: int) -> Client | None:
         """
@@ -42,16 +99,10 @@ class ClientRepository:
         Returns:
             Client | None: The Client object, or None if not found.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.GET_CLIENT_BY_ID, (client_id,))
-        result = cursor.fetchone()
+        with borrow_connection() as conn:
+            result = fetch_one(conn, "client.by_id", q.GET_CLIENT_BY_ID, (client_id,))
 
-        cursor.close()
-        close_connection(conn)
-
-        return Client.from_dict(result) if result else None
+        return Client.from_row(result) if result else None
 
     @staticmethod
     def list_all() -> list[Client]:
@@ -61,39 +112,100 @@ class ClientRepository:
         Returns:
             list[Client]: A list of all Client objects.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ALL_CLIENTS)
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Client.from_row(row) for row in results]
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Client]:
+        """
+        Streams all clients from the database without loading them into memory.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the server per batch.
+
+        Yields:
+            Client: One Client object at a time, ordered by ID.
+        """
+        for row in stream_rows(q.GET_ALL_CLIENTS, fetch_size=fetch_size):
+            yield Client.from_row(row)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = 20) -> list[Client]:
+        """
+        Retrieves the page of clients that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of clients to return.
+
+        Returns:
+            list[Client]: Up to ``limit`` clients with IDs greater than ``after_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_CLIENTS_PAGE_AFTER, (after_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Client.from_row(row) for row in results]
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = 20) -> list[Client]:
+        """
+        Retrieves the page of clients that precedes a given ID (keyset pagination).
 
-        cursor.execute(q.GET_ALL_CLIENTS)
-        results = cursor.fetchall()
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of clients to return.
 
-        cursor.close()
-        close_connection(conn)
+        Returns:
+            list[Client]: Up to ``limit`` clients with IDs lower than ``before_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_CLIENTS_PAGE_BEFORE, (before_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
 
-        return [Client.from_dict(row) for row in results]
+        return [Client.from_row(row) for row in reversed(results)]
 
     @staticmethod
-    def update(client_id: int, email: str) -> bool:
+    def update(client_id: int, email: str) -> Client | None:
         """
         Updates a client's information by ID.
 
+        A single ``UPDATE ... RETURNING`` where the backend supports it;
+        otherwise (MariaDB) the row is read back on the same connection.
+
         Args:
             client_id (int): The ID of the client to update.
             email (str): The new email.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
+            Client | None: The updated client, or None if it does not exist.
 
-        cursor.execute(q.UPDATE_CLIENT, (email, client_id))
-        conn.commit()
-        updated = cursor.rowcount > 0
-
-        cursor.close()
-        close_connection(conn)
-        return updated
+        Raises:
+            DuplicateKeyError: If the email belongs to another client.
+        """
+        params = (email, client_id)
+        with transaction() as conn:
+            if backend.UPDATE_RETURNING:
+                result = execute_returning(
+                    conn, "client.update_returning", q.UPDATE_CLIENT_RETURNING, params
+                )
+            elif execute(conn, "client.update", q.UPDATE_CLIENT, params).rowcount:
+                result = fetch_one(
+                    conn, "client.by_id", q.GET_CLIENT_BY_ID, (client_id,)
+                )
+            else:
+                result = None
+
+        return Client.from_row(result) if result else None
 
     @staticmethod
     def email_exists(email: str) -> bool:
@@ -106,13 +218,9 @@ class ClientRepository:
         Returns:
             bool: True if the email exists, False otherwise.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.CHECK_EMAIL_EXISTS, (email,))
-        result = cursor.fetchone()
-
-        cursor.close()
-        close_connection(conn)
+        with borrow_connection() as conn:
+            result = fetch_one(
+                conn, "client.email_exists", q.CHECK_EMAIL_EXISTS, (email,)
+            )
 
         return result["count"] > 0
@@ -1,6 +1,13 @@
 from datetime import date
-from db.connection import get_db_connection, close_connection
+from typing import Iterator
+from db.bulk import insert_many
+from db.connection import borrow_connection, transaction
+from db.errors import ForeignKeyError
+from db.statements import execute, fetch_one
+from db.streaming import stream_rows
 from models.order import Order
+from models.order_view import OrderView
+from repositories.rollup_repository import RollupRepository
 import queries.order_queries as q
 
 
@@ -12,7 +19,7 @@ class OrderRepository:
     @staticmethod
     def create(client_id: int, product_id: int) -> int:
         """
-        Inserts a new order into the database.
+        Inserts a new order into the database and adds it to the sales rollups.
 
         Args:
             client_id (int): The ID of the client placing the order.
@@ -21,18 +28,92 @@ class OrderRepository:
         Returns:
             int: The ID of the newly created order.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
         order_date = date.today()
-        cursor.execute(q.CREATE_ORDER, (client_id, product_id, order_date))
-        conn.commit()
-        order_id = cursor.lastrowid
+        with transaction() as conn:
+            params = (client_id, product_id, order_date, product_id)
+            order_id = execute(conn, "order.create", q.CREATE_ORDER, params).lastrowid
+            RollupRepository.add_orders(order_id, order_id)
 
-        cursor.close()
-        close_connection(conn)
         return order_id
 
+    @staticmethod
+    def create_if_referenced(client_id: int, product_id: int) -> int | None:
+        """
+        Inserts a new order only if its client and product exist, in one statement.
+
+        The order is added to the sales rollups in the same transaction.
+
+        Args:
+            client_id (int): The ID of the client placing the order.
+            product_id (int): The ID of the product being ordered.
+
+        Returns:
+            int | None: The ID of the new order, or None if the client or
+            product does not exist.
+        """
+        params = (client_id, product_id, date.today(), client_id, product_id)
+        try:
+            with transaction() as conn:
+                result = execute(
+                    conn,
+                    "order.create_if_referenced",
+                    q.CREATE_ORDER_IF_REFERENCED,
+                    params,
+                )
+                if not result.rowcount:
+                    return None
+                RollupRepository.add_orders(result.lastrowid, result.lastrowid)
+        except ForeignKeyError:
+            # The client or product was deleted between the check and the insert.
+            return None
+
+        return result.lastrowid
+
+    @staticmethod
+    def references_exist(client_id: int, product_id: int) -> tuple[bool, bool]:
+        """
+        Checks whether a client and a product exist, in one query.
+
+        Args:
+            client_id (int): The client ID to check.
+            product_id (int): The product ID to check.
+
+        Returns:
+            tuple[bool, bool]: Whether the client exists and whether the product exists.
+        """
+        with borrow_connection() as conn:
+            row = fetch_one(
+                conn,
+                "order.references_exist",
+                q.CHECK_ORDER_REFERENCES,
+                (client_id, product_id),
+            )
+
+        return bool(row["client_exists"]), bool(row["product_exists"])
+
+    @staticmethod
+    def create_many(orders: list[tuple[int, int, date]]) -> list[int]:
+        """
+        Inserts many orders using batched multi-row inserts.
+
+        Each order records its product's current price. The whole batch and
+        its sales rollup updates commit together.
+
+        Args:
+            orders (list[tuple[int, int, date]]): (client_id, product_id, order_date) rows.
+
+        Returns:
+            list[int]: The IDs of the inserted orders, in input order.
+        """
+        with transaction():
+            rows = [
+                (client_id, product_id, day, product_id)
+                for client_id, product_id, day in orders
+            ]
+            ids = insert_many(q.CREATE_ORDERS_BULK, q.ORDER_VALUES_ROW, rows)
+            RollupRepository.add_order_ids(ids)
+        return ids
+
     @staticmethod
     def get_by_id(order_id: int) -> Order | None:
         """
@@ -44,15 +125,10 @@ class OrderRepository:
         Returns:
             Order | None: The Order object, or None if not found.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.GET_ORDER_BY_ID, (order_id,))
-        result = cursor.fetchone()
+        with borrow_connection() as conn:
+            result = fetch_one(conn, "order.by_id", q.GET_ORDER_BY_ID, (order_id,))
 
-        cursor.close()
-        close_connection(conn)
-        return Order.from_dict(result) if result else None
+        return Order.from_row(result) if result else None
 
     @staticmethod
     def list_all() -> list[Order]:
@@ -62,13 +138,134 @@ class OrderRepository:
         Returns:
             list[Order]: A list of all Order objects.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ALL_ORDERS)
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Order.from_row(row) for row in results]
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Order]:
+        """
+        Streams all orders from the database without loading them into memory.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the server per batch.
+
+        Yields:
+            Order: One Order object at a time, ordered by ID.
+        """
+        for row in stream_rows(q.GET_ALL_ORDERS, fetch_size=fetch_size):
+            yield Order.from_row(row)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = 20) -> list[Order]:
+        """
+        Retrieves the page of orders that follows a given ID (keyset pagination).
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[Order]: Up to ``limit`` orders with IDs greater than ``after_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ORDERS_PAGE_AFTER, (after_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Order.from_row(row) for row in results]
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = 20) -> list[Order]:
+        """
+        Retrieves the page of orders that precedes a given ID (keyset pagination).
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[Order]: Up to ``limit`` orders with IDs lower than ``before_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ORDERS_PAGE_BEFORE, (before_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
 
-        cursor.execute(q.GET_ALL_ORDERS)
-        results = cursor.fetchall()
+        return [Order.from_row(row) for row in reversed(results)]
 
-        cursor.close()
-        close_connection(conn)
+    @staticmethod
+    def get_view_by_id(order_id: int) -> OrderView | None:
+        """
+        Retrieves an order together with its client and product details.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            OrderView | None: The joined order, or None if not found.
+        """
+        with borrow_connection() as conn:
+            result = fetch_one(conn, "order.by_id", q.GET_ORDER_BY_ID, (order_id,))
+
+        return OrderView.from_row(result) if result else None
+
+    @staticmethod
+    def iter_views(fetch_size: int = None) -> Iterator[OrderView]:
+        """
+        Streams all orders with their client and product details.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the server per batch.
+
+        Yields:
+            OrderView: One joined order at a time, ordered by ID.
+        """
+        for row in stream_rows(q.GET_ALL_ORDERS, fetch_size=fetch_size):
+            yield OrderView.from_row(row)
+
+    @staticmethod
+    def list_view_page(after_id: int = 0, limit: int = 20) -> list[OrderView]:
+        """
+        Retrieves the page of joined orders that follows a given ID.
+
+        Args:
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[OrderView]: Up to ``limit`` joined orders with IDs greater than ``after_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ORDERS_PAGE_AFTER, (after_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [OrderView.from_row(row) for row in results]
+
+    @staticmethod
+    def list_view_page_before(before_id: int, limit: int = 20) -> list[OrderView]:
+        """
+        Retrieves the page of joined orders that precedes a given ID.
+
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of orders to return.
+
+        Returns:
+            list[OrderView]: Up to ``limit`` joined orders with IDs lower than ``before_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ORDERS_PAGE_BEFORE, (before_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
 
-        return [Order.from_dict(row) for row in results]
+        return [OrderView.from_row(row) for row in reversed(results)]
@@ -1,4 +1,9 @@
-from db.connection import get_db_connection, close_connection
+from typing import Iterator
+from db.bulk import insert_many, select_in
+from db.backends import backend
+from db.connection import borrow_connection, transaction
+from db.statements import execute, execute_returning, fetch_one
+from db.streaming import stream_rows
 from models.product import Product
 import queries.product_queries as q
 
@@ -21,17 +26,53 @@ class ProductRepository:
         Returns:
             int: ID of the newly inserted product.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            product_id = execute(
+                conn, "product.create", q.CREATE_PRODUCT, (name, price, category_id)
+            ).lastrowid
 
-        cursor.execute(q.CREATE_PRODUCT, (name, price, category_id))
-        conn.commit()
-        product_id = cursor.lastrowid
-
-        cursor.close()
-        close_connection(conn)
         return product_id
 
+    @staticmethod
+    def create_many(products: list[tuple[str, float, int]]) -> list[int]:
+        """
+        Inserts many products using batched multi-row inserts.
+
+        Args:
+            products (list[tuple[str, float, int]]): (name, price, category_id) rows.
+
+        Returns:
+            list[int]: The IDs of the inserted products, in input order.
+        """
+        return insert_many(q.CREATE_PRODUCTS_BULK, q.PRODUCT_VALUES_ROW, products)
+
+    @staticmethod
+    def existing_ids(product_ids) -> set[int]:
+        """
+        Returns which of the given product IDs exist.
+
+        Args:
+            product_ids: The IDs to check.
+
+        Returns:
+            set[int]: The subset of IDs present in the database.
+        """
+        return {row["id"] for row in select_in(q.GET_EXISTING_PRODUCT_IDS, product_ids)}
+
+    @staticmethod
+    def names_by_ids(product_ids) -> dict[int, str]:
+        """
+        Maps the given product IDs to their names in a single lookup.
+
+        Args:
+            product_ids: The IDs to resolve.
+
+        Returns:
+            dict[int, str]: Names keyed by ID; unknown IDs are left out.
+        """
+        rows = select_in(q.GET_PRODUCT_NAMES_BY_IDS, product_ids)
+        return {row["id"]: row["name"] for row in rows}
+
     @staticmethod
     def get_by_id(product_id: int) -> Product | None:
         """
@@ -43,15 +84,12 @@ class ProductRepository:
         Returns:
             Product | None: Product instance or None if not found.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        with borrow_connection() as conn:
+            result = fetch_one(
+                conn, "product.by_id", q.GET_PRODUCT_BY_ID, (product_id,)
+            )
 
-        cursor.execute(q.GET_PRODUCT_BY_ID, (product_id,))
-        result = cursor.fetchone()
-
-        cursor.close()
-        close_connection(conn)
-        return Product.from_dict(result) if result else None
+        return Product.from_row(result) if result else None
 
     @staticmethod
     def list_all() -> list[Product]:
@@ -61,40 +99,97 @@ class ProductRepository:
         Returns:
             list[Product]: A list of all product records.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_ALL_PRODUCTS)
+            results = cursor.fetchall()
+            cursor.close()
 
-        cursor.execute(q.GET_ALL_PRODUCTS)
-        results = cursor.fetchall()
+        return [Product.from_row(row) for row in results]
 
-        cursor.close()
-        close_connection(conn)
-        return [Product.from_dict(row) for row in results]
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Product]:
+        """
+        Streams all products from the database without loading them into memory.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the server per batch.
+
+        Yields:
+            Product: One Product object at a time, ordered by ID.
+        """
+        for row in stream_rows(q.GET_ALL_PRODUCTS, fetch_size=fetch_size):
+            yield Product.from_row(row)
 
     @staticmethod
-    def update(product_id: int, price: float) -> bool:
+    def list_page(after_id: int = 0, limit: int = 20) -> list[Product]:
         """
-        Updates a product's data.
+        Retrieves the page of products that follows a given ID (keyset pagination).
 
         Args:
-            product_id (int): ID of the product to update.
-            name (str): New name.
-            price (float): New price.
-            category_id (int): New category ID.
+            after_id (int): Last ID of the previous page; 0 starts from the beginning.
+            limit (int): Maximum number of products to return.
 
         Returns:
-            bool: True if update was successful, False otherwise.
+            list[Product]: Up to ``limit`` products with IDs greater than ``after_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_PRODUCTS_PAGE_AFTER, (after_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [Product.from_row(row) for row in results]
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = 20) -> list[Product]:
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        Retrieves the page of products that precedes a given ID (keyset pagination).
 
-        cursor.execute(q.UPDATE_PRODUCT, (price, product_id))
-        conn.commit()
-        updated = cursor.rowcount > 0
+        Args:
+            before_id (int): First ID of the following page.
+            limit (int): Maximum number of products to return.
+
+        Returns:
+            list[Product]: Up to ``limit`` products with IDs lower than ``before_id``, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_PRODUCTS_PAGE_BEFORE, (before_id, limit))
+            results = cursor.fetchall()
+            cursor.close()
 
-        cursor.close()
-        close_connection(conn)
-        return updated
+        return [Product.from_row(row) for row in reversed(results)]
+
+    @staticmethod
+    def update(product_id: int, price: float) -> Product | None:
+        """
+        Updates a product's price.
+
+        A single ``UPDATE ... RETURNING`` where the backend supports it;
+        otherwise (MariaDB) the row is read back on the same connection.
+
+        Args:
+            product_id (int): ID of the product to update.
+            price (float): New price.
+
+        Returns:
+            Product | None: The updated product, or None if it does not exist.
+        """
+        params = (price, product_id)
+        with transaction() as conn:
+            if backend.UPDATE_RETURNING:
+                result = execute_returning(
+                    conn, "product.update_returning", q.UPDATE_PRODUCT_RETURNING, params
+                )
+            elif execute(conn, "product.update", q.UPDATE_PRODUCT, params).rowcount:
+                result = fetch_one(
+                    conn, "product.by_id", q.GET_PRODUCT_BY_ID, (product_id,)
+                )
+            else:
+                result = None
+
+        return Product.from_row(result) if result else None
 
     @staticmethod
     def delete(product_id: int) -> bool:
@@ -105,17 +200,16 @@ class ProductRepository:
             product_id (int): Product ID to delete.
 
         Returns:
-            bool: True if deletion was successful, False otherwise.
+            bool: True if the product existed, False otherwise.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(q.DELETE_PRODUCT, (product_id,))
-        conn.commit()
-        deleted = cursor.rowcount > 0
+        with transaction() as conn:
+            deleted = (
+                execute(
+                    conn, "product.delete", q.DELETE_PRODUCT, (product_id,)
+                ).rowcount
+                > 0
+            )
 
-        cursor.close()
-        close_connection(conn)
         return deleted
 
     @staticmethod
@@ -129,12 +223,9 @@ class ProductRepository:
         Returns:
             bool: True if name exists, False otherwise.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        cursor.execute(q.CHECK_PRODUCT_NAME_EXISTS, (name,))
-        result = cursor.fetchone()
+        with borrow_connection() as conn:
+            result = fetch_one(
+                conn, "product.name_exists", q.CHECK_PRODUCT_NAME_EXISTS, (name,)
+            )
 
-        cursor.close()
-        close_connection(conn)
         return result["count"] > 0
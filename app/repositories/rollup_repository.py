@@ -0,0 +1,174 @@
+from datetime import date
+from db.connection import borrow_connection, transaction
+from models.daily_sales import DailySales
+from models.sales_total import SalesTotal
+import queries.rollup_queries as q
+
+# Bounds used when a rebuild covers the whole order history.
+FIRST_DATE = date(1000, 1, 1)
+LAST_DATE = date(9999, 12, 31)
+
+
+class RollupRepository:
+    """
+    Maintains and reads the daily sales rollups (per product and per category).
+
+    The rollups are kept in step with the orders table inside the same
+    transaction as each order insert, so reports never have to scan orders.
+    Revenue is the sum of the orders' unit prices, the price each order was
+    placed at, whether it is added as orders come in or rebuilt.
+    """
+
+    @staticmethod
+    def add_orders(first_id: int, last_id: int) -> None:
+        """
+        Adds the orders with IDs in a contiguous range to the rollups.
+
+        Must run in the transaction that inserted those orders, and the range
+        must hold only orders inserted by it.
+
+        Args:
+            first_id (int): First order ID of the range.
+            last_id (int): Last order ID of the range, inclusive.
+        """
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(q.ADD_PRODUCT_SALES_FOR_ORDERS, (first_id, last_id))
+            cursor.execute(q.ADD_CATEGORY_SALES_FOR_ORDERS, (first_id, last_id))
+            cursor.close()
+
+    @staticmethod
+    def add_order_ids(order_ids: list[int]) -> None:
+        """
+        Adds freshly inserted orders to the rollups, one statement pair per ID run.
+
+        Args:
+            order_ids (list[int]): IDs returned by a bulk insert, in input order.
+        """
+        for first_id, last_id in _contiguous_ranges(order_ids):
+            RollupRepository.add_orders(first_id, last_id)
+
+    @staticmethod
+    def remove_product(product_id: int) -> None:
+        """
+        Removes a product's sales from the rollups before the product is deleted.
+
+        Deleting a product cascades to its orders, so its sales are subtracted
+        from its category's totals and its own rows are dropped.
+
+        Args:
+            product_id (int): The product about to be deleted.
+        """
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(q.SUBTRACT_PRODUCT_FROM_CATEGORY_SALES, (product_id,))
+            cursor.execute(q.DELETE_EMPTY_CATEGORY_SALES_OF_PRODUCT, (product_id,))
+            cursor.execute(q.DELETE_PRODUCT_SALES, (product_id,))
+            cursor.close()
+
+    @staticmethod
+    def remove_category(category_id: int) -> None:
+        """
+        Removes a category's sales, and its products', before the category is deleted.
+
+        Args:
+            category_id (int): The category about to be deleted.
+        """
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(q.DELETE_CATEGORY_PRODUCT_SALES, (category_id,))
+            cursor.execute(q.DELETE_CATEGORY_SALES, (category_id,))
+            cursor.close()
+
+    @staticmethod
+    def rebuild(start: date = None, end: date = None) -> None:
+        """
+        Recomputes the rollups for a date range from the orders table.
+
+        Revenue is recomputed from the orders' unit prices, so it matches what
+        was added as the orders were placed. Orders from before migration 0004
+        have no recorded price and are counted at the current product price.
+
+        Args:
+            start (date, optional): First day to rebuild; defaults to the earliest possible.
+            end (date, optional): Last day to rebuild; defaults to the latest possible.
+        """
+        params = (start or FIRST_DATE, end or LAST_DATE)
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(q.DELETE_PRODUCT_SALES_IN_RANGE, params)
+            cursor.execute(q.DELETE_CATEGORY_SALES_IN_RANGE, params)
+            cursor.execute(q.REBUILD_PRODUCT_SALES_IN_RANGE, params)
+            cursor.execute(q.REBUILD_CATEGORY_SALES_IN_RANGE, params)
+            cursor.close()
+
+    @staticmethod
+    def daily_sales(start: date, end: date) -> list[DailySales]:
+        """
+        Retrieves order count and revenue per day.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+
+        Returns:
+            list[DailySales]: One entry per day with orders, ascending.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_DAILY_SALES, (start, end))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [DailySales.from_row(row) for row in results]
+
+    @staticmethod
+    def product_sales(start: date, end: date, limit: int) -> list[SalesTotal]:
+        """
+        Retrieves the best-selling products by revenue.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+            limit (int): Maximum number of products to return.
+
+        Returns:
+            list[SalesTotal]: Product totals, highest revenue first.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_PRODUCT_SALES, (start, end, limit))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [SalesTotal.from_row(row) for row in results]
+
+    @staticmethod
+    def category_sales(start: date, end: date) -> list[SalesTotal]:
+        """
+        Retrieves order count and revenue per category.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+
+        Returns:
+            list[SalesTotal]: Category totals, highest revenue first.
+        """
+        with borrow_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(q.GET_CATEGORY_SALES, (start, end))
+            results = cursor.fetchall()
+            cursor.close()
+
+        return [SalesTotal.from_row(row) for row in results]
+
+
+def _contiguous_ranges(ids: list[int]) -> list[tuple[int, int]]:
+    ranges = []
+    for value in ids:
+        if ranges and value == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], value)
+        else:
+            ranges.append((value, value))
+    return ranges
@@ -0,0 +1,168 @@
+from cache.catalog_cache import CatalogCache
+from config.config import PAGINATION_CONFIG
+from db.async_connection import async_transaction
+from db.errors import DuplicateKeyError
+from models.category import Category
+from repositories.async_category_repository import AsyncCategoryRepository
+from repositories.async_rollup_repository import AsyncRollupRepository
+from utils.validators import (
+    validate_name,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
+
+
+class AsyncCategoryService:
+    """
+    Asyncio counterpart of CategoryService, with the same validation and errors.
+
+    Reads go to the database; writes still invalidate the in-process catalog
+    cache used by the synchronous services.
+    """
+
+    @staticmethod
+    async def create(name: str) -> Category:
+        """
+        Creates a new category after validating input.
+
+        Args:
+            name (str): The name of the category.
+
+        Returns:
+            Category: The newly created Category object.
+
+        Raises:
+            ValueError: If the name is invalid or already in use.
+        """
+        name = validate_name(name, "Category name")
+
+        try:
+            category_id = await AsyncCategoryRepository.create(name)
+        except DuplicateKeyError:
+            raise ValueError("Category name is already in use.") from None
+        CatalogCache.invalidate_categories()
+        return Category(id=category_id, name=name)
+
+    @staticmethod
+    async def get_by_id(category_id: int) -> Category:
+        """
+        Retrieves a category by ID.
+
+        Args:
+            category_id (int): The category's ID.
+
+        Returns:
+            Category: The corresponding Category object.
+
+        Raises:
+            ValueError: If the category is not found.
+        """
+        category_id = validate_id(category_id, "Category ID")
+        category = await AsyncCategoryRepository.get_by_id(category_id)
+        if not category:
+            raise ValueError("Category not found.")
+        return category
+
+    @staticmethod
+    async def list_all() -> list[Category]:
+        """
+        Retrieves all categories.
+
+        Returns:
+            list[Category]: List of all Category objects.
+        """
+        return await AsyncCategoryRepository.list_all()
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = None) -> list[Category]:
+        """
+        Retrieves the next page of categories after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Category]: The page of categories, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncCategoryRepository.list_page(after_id, limit)
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = None) -> list[Category]:
+        """
+        Retrieves the previous page of categories before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Category]: The page of categories, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncCategoryRepository.list_page_before(before_id, limit)
+
+    @staticmethod
+    async def update(category_id: int, name: str) -> Category:
+        """
+        Updates a category's name after validation.
+
+        Args:
+            category_id (int): ID of the category to update.
+            name (str): New name.
+
+        Returns:
+            Category: The updated Category object.
+
+        Raises:
+            ValueError: If inputs are invalid or name already exists.
+        """
+        category_id = validate_id(category_id, "Category ID")
+        name = validate_name(name, "Category name")
+
+        try:
+            found = await AsyncCategoryRepository.update(category_id, name)
+        except DuplicateKeyError:
+            raise ValueError("Category name is already in use.") from None
+        if not found:
+            raise ValueError("Category not found.")
+        CatalogCache.invalidate_categories()
+        return Category(id=category_id, name=name)
+
+    @staticmethod
+    async def delete(category_id: int) -> bool:
+        """
+        Deletes a category by ID.
+
+        Args:
+            category_id (int): The ID of the category to delete.
+
+        Returns:
+            bool: True if deletion was successful.
+
+        Raises:
+            ValueError: If the category is not found.
+        """
+        category_id = validate_id(category_id, "Category ID")
+        async with async_transaction():
+            await AsyncRollupRepository.remove_category(category_id)
+            if not await AsyncCategoryRepository.delete(category_id):
+                raise ValueError("Category not found.")
+        CatalogCache.invalidate_categories()
+        return True
@@ -0,0 +1,144 @@
+from config.config import PAGINATION_CONFIG
+from db.async_connection import async_transaction
+from db.errors import DuplicateKeyError
+from models.client import Client
+from repositories.async_client_repository import AsyncClientRepository
+from utils.validators import (
+    validate_name,
+    validate_email,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
+
+
+class AsyncClientService:
+    """
+    Asyncio counterpart of ClientService, with the same validation and errors.
+    """
+
+    @staticmethod
+    async def create(name: str, email: str) -> Client:
+        """
+        Creates a new client after validating input data.
+
+        Args:
+            name (str): The client's full name.
+            email (str): The client's email address.
+
+        Returns:
+            Client: The newly created Client object.
+
+        Raises:
+            ValueError: If the input data is invalid or email is already in use.
+        """
+        name = validate_name(name, "Client name")
+        email = validate_email(email)
+
+        try:
+            client_id = await AsyncClientRepository.create(name, email)
+        except DuplicateKeyError:
+            raise ValueError("Email is already registered.") from None
+        return Client(id=client_id, name=name, email=email)
+
+    @staticmethod
+    async def get_by_id(client_id: int) -> Client:
+        """
+        Retrieves a client by ID.
+
+        Args:
+            client_id (int): The ID of the client.
+
+        Returns:
+            Client: The corresponding Client object.
+
+        Raises:
+            ValueError: If the client is not found.
+        """
+        client_id = validate_id(client_id, "Client ID")
+        client = await AsyncClientRepository.get_by_id(client_id)
+        if not client:
+            raise ValueError("Client not found.")
+        return client
+
+    @staticmethod
+    async def list_all() -> list[Client]:
+        """
+        Retrieves all registered clients.
+
+        Returns:
+            list[Client]: A list of all Client objects.
+        """
+        return await AsyncClientRepository.list_all()
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = None) -> list[Client]:
+        """
+        Retrieves the next page of clients after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Client]: The page of clients, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncClientRepository.list_page(after_id, limit)
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = None) -> list[Client]:
+        """
+        Retrieves the previous page of clients before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Client]: The page of clients, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncClientRepository.list_page_before(before_id, limit)
+
+    @staticmethod
+    async def update(client_id: int, email: str) -> Client:
+        """
+        Updates a client's email after validation.
+
+        Args:
+            client_id (int): The ID of the client to update.
+            email (str): New email.
+
+        Returns:
+            Client: The updated Client object.
+
+        Raises:
+            ValueError: If the client does not exist or inputs are invalid.
+        """
+        client_id = validate_id(client_id, "Client ID")
+        email = validate_email(email)
+
+        async with async_transaction():
+            try:
+                found = await AsyncClientRepository.update(client_id, email)
+            except DuplicateKeyError:
+                raise ValueError("Email is already registered.") from None
+            if not found:
+                raise ValueError("Client not found.")
+
+            return await AsyncClientRepository.get_by_id(client_id)
@@ -0,0 +1,164 @@
+from datetime import date
+from config.config import PAGINATION_CONFIG
+from models.order import Order
+from models.order_view import OrderView
+from repositories.async_order_repository import AsyncOrderRepository
+from utils.validators import validate_id, validate_cursor_id, validate_page_size
+
+
+class AsyncOrderService:
+    """
+    Asyncio counterpart of OrderService, with the same validation and errors.
+    """
+
+    @staticmethod
+    async def create(client_id: int, product_id: int) -> Order:
+        """
+        Creates a new order, validating client and product existence in the same statement.
+
+        Args:
+            client_id (int): The ID of the client.
+            product_id (int): The ID of the product.
+
+        Returns:
+            Order: The newly created Order object.
+
+        Raises:
+            ValueError: If the client or product is not found.
+        """
+        client_id = validate_id(client_id, "Client ID")
+        product_id = validate_id(product_id, "Product ID")
+
+        order_id = await AsyncOrderRepository.create_if_referenced(
+            client_id, product_id
+        )
+        if order_id is None:
+            client_exists, _ = await AsyncOrderRepository.references_exist(
+                client_id, product_id
+            )
+            if not client_exists:
+                raise ValueError("Client not found.")
+            raise ValueError("Product not found.")
+
+        return Order(
+            id=order_id,
+            client_id=client_id,
+            product_id=product_id,
+            order_date=date.today(),
+        )
+
+    @staticmethod
+    async def get_by_id(order_id: int) -> Order:
+        """
+        Retrieves an order by ID.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            Order: The Order object.
+
+        Raises:
+            ValueError: If the order is not found.
+        """
+        order_id = validate_id(order_id, "Order ID")
+        order = await AsyncOrderRepository.get_by_id(order_id)
+        if not order:
+            raise ValueError("Order not found.")
+        return order
+
+    @staticmethod
+    async def get_view_by_id(order_id: int) -> OrderView:
+        """
+        Retrieves an order together with its client and product details.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            OrderView: The order with the joined client and product fields.
+
+        Raises:
+            ValueError: If the order is not found.
+        """
+        order_id = validate_id(order_id, "Order ID")
+        view = await AsyncOrderRepository.get_view_by_id(order_id)
+        if not view:
+            raise ValueError("Order not found.")
+        return view
+
+    @staticmethod
+    async def list_all() -> list[Order]:
+        """
+        Retrieves all registered orders.
+
+        Returns:
+            list[Order]: A list of all Order objects.
+        """
+        return await AsyncOrderRepository.list_all()
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = None) -> list[Order]:
+        """
+        Retrieves the next page of orders after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Order]: The page of orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncOrderRepository.list_page(after_id, limit)
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = None) -> list[Order]:
+        """
+        Retrieves the previous page of orders before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Order]: The page of orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncOrderRepository.list_page_before(before_id, limit)
+
+    @staticmethod
+    async def list_view_page(after_id: int = 0, limit: int = None) -> list[OrderView]:
+        """
+        Retrieves the next page of orders with their client and product details.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[OrderView]: The page of order views, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncOrderRepository.list_view_page(after_id, limit)
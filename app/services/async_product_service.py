@@ -0,0 +1,171 @@
+from cache.catalog_cache import CatalogCache
+from config.config import PAGINATION_CONFIG
+from db.async_connection import async_transaction
+from db.errors import ForeignKeyError
+from models.product import Product
+from repositories.async_product_repository import AsyncProductRepository
+from repositories.async_rollup_repository import AsyncRollupRepository
+from utils.validators import (
+    validate_name,
+    validate_positive_price,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
+
+
+class AsyncProductService:
+    """
+    Asyncio counterpart of ProductService, with the same validation and errors.
+
+    Reads go to the database; writes still invalidate the in-process catalog
+    cache used by the synchronous services.
+    """
+
+    @staticmethod
+    async def create(name: str, price: float, category_id: int) -> Product:
+        """
+        Creates a new product after validating input data.
+
+        Args:
+            name (str): The name of the product.
+            price (float): The price of the product.
+            category_id (int): The ID of the category the product belongs to.
+
+        Returns:
+            Product: The newly created Product object.
+
+        Raises:
+            ValueError: If the input data is invalid or the category does not exist.
+        """
+        name = validate_name(name, "Product name")
+        price = validate_positive_price(price)
+        category_id = validate_id(category_id, "Category ID")
+
+        try:
+            product_id = await AsyncProductRepository.create(name, price, category_id)
+        except ForeignKeyError:
+            raise ValueError("Category not found.") from None
+        CatalogCache.invalidate_products()
+        return Product(id=product_id, name=name, price=price, category_id=category_id)
+
+    @staticmethod
+    async def get_by_id(product_id: int) -> Product:
+        """
+        Retrieves a product by its ID.
+
+        Args:
+            product_id (int): The ID of the product to retrieve.
+
+        Returns:
+            Product: The corresponding Product object.
+
+        Raises:
+            ValueError: If the product is not found.
+        """
+        product_id = validate_id(product_id, "Product ID")
+        product = await AsyncProductRepository.get_by_id(product_id)
+        if not product:
+            raise ValueError("Product not found.")
+        return product
+
+    @staticmethod
+    async def list_all() -> list[Product]:
+        """
+        Retrieves all registered products.
+
+        Returns:
+            list[Product]: A list of all Product objects.
+        """
+        return await AsyncProductRepository.list_all()
+
+    @staticmethod
+    async def list_page(after_id: int = 0, limit: int = None) -> list[Product]:
+        """
+        Retrieves the next page of products after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Product]: The page of products, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncProductRepository.list_page(after_id, limit)
+
+    @staticmethod
+    async def list_page_before(before_id: int, limit: int = None) -> list[Product]:
+        """
+        Retrieves the previous page of products before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Product]: The page of products, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return await AsyncProductRepository.list_page_before(before_id, limit)
+
+    @staticmethod
+    async def update(product_id: int, price: float) -> Product:
+        """
+        Updates a product's price after validation.
+
+        Args:
+            product_id (int): The ID of the product to update.
+            price (float): New price.
+
+        Returns:
+            Product: The updated Product object.
+
+        Raises:
+            ValueError: If the product does not exist or inputs are invalid.
+        """
+        product_id = validate_id(product_id, "Product ID")
+        price = validate_positive_price(price)
+
+        async with async_transaction():
+            if not await AsyncProductRepository.update(product_id, price):
+                raise ValueError("Product not found.")
+            product = await AsyncProductRepository.get_by_id(product_id)
+        CatalogCache.invalidate_products()
+        return product
+
+    @staticmethod
+    async def delete(product_id: int) -> bool:
+        """
+        Deletes a product by ID.
+
+        Args:
+            product_id (int): The ID of the product to delete.
+
+        Returns:
+            bool: True if deletion was successful.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        product_id = validate_id(product_id, "Product ID")
+        async with async_transaction():
+            await AsyncRollupRepository.remove_product(product_id)
+            if not await AsyncProductRepository.delete(product_id):
+                raise ValueError("Product not found.")
+        CatalogCache.invalidate_products()
+        return True
@@ -1,6 +1,17 @@
+from typing import Iterator
+from cache.catalog_cache import CatalogCache
+from config.config import PAGINATION_CONFIG
+from db.connection import transaction
+from db.errors import DuplicateKeyError
 from models.category import Category
 from repositories.category_repository import CategoryRepository
-from utils.validators import validate_name, validate_id
+from repositories.rollup_repository import RollupRepository
+from utils.validators import (
+    validate_name,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
 
 
 class CategoryService:
@@ -24,12 +35,52 @@ class CategoryService:
         """
         name = validate_name(name, "Category name")
 
-        if CategoryRepository.name_exists(name):
-            raise ValueError("Category name is already in use.")
-
-        category_id = CategoryRepository.create(name)
+        with transaction():
+            try:
+                category_id = CategoryRepository.create(name)
+            except DuplicateKeyError:
+                raise ValueError("Category name is already in use.") from None
+            CatalogCache.invalidate_categories()
         return Category(id=category_id, name=name)
 
+    @staticmethod
+    def create_many(names: list[str]) -> list[int]:
+        """
+        Creates many categories at once after validating the whole batch.
+
+        Args:
+            names (list[str]): The category names.
+
+        Returns:
+            list[int]: The IDs of the new categories, in input order.
+
+        Raises:
+            ValueError: If any name is invalid, repeated or already in use.
+        """
+        cleaned = []
+        for index, name in enumerate(names, start=1):
+            try:
+                cleaned.append(validate_name(name, "Category name"))
+            except ValueError as ve:
+                raise ValueError(f"Row {index}: {ve}") from ve
+
+        if len(set(cleaned)) != len(cleaned):
+            raise ValueError("Category name is repeated within the batch.")
+        taken = CategoryRepository.existing_names(cleaned)
+        if taken:
+            raise ValueError(
+                f"Category name is already in use: {', '.join(sorted(taken))}."
+            )
+
+        # The check above can race another writer; the unique key decides.
+        with transaction():
+            try:
+                ids = CategoryRepository.create_many(cleaned)
+            except DuplicateKeyError:
+                raise ValueError("Category name is already in use.") from None
+            CatalogCache.invalidate_categories()
+        return ids
+
     @staticmethod
     def get_by_id(category_id: int) -> Category:
         """
@@ -45,7 +96,7 @@ class CategoryService:
             ValueError: If the category is not found.
         """
         category_id = validate_id(category_id, "Category ID")
-        category = CategoryRepository.get_by_id(category_id)
+        category = CatalogCache.category_by_id(category_id)
         if not category:
             raise ValueError("Category not found.")
         return category
@@ -58,7 +109,64 @@ class CategoryService:
         Returns:
             list[Category]: List of all Category objects.
         """
-        return CategoryRepository.list_all()
+        return CatalogCache.categories()
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Category]:
+        """
+        Streams all registered categories one at a time.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the database per batch.
+
+        Returns:
+            Iterator[Category]: Category objects ordered by ID.
+        """
+        return CategoryRepository.iter_all(fetch_size)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = None) -> list[Category]:
+        """
+        Retrieves the next page of categories after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Category]: The page of categories, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return CategoryRepository.list_page(after_id, limit)
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = None) -> list[Category]:
+        """
+        Retrieves the previous page of categories before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Category]: The page of categories, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return CategoryRepository.list_page_before(before_id, limit)
 
     @staticmethod
     def update(category_id: int, name: str) -> Category:
@@ -78,18 +186,16 @@ class CategoryService:
         category_id = validate_id(category_id, "Category ID")
         name = validate_name(name, "Category name")
 
-        existing = CategoryRepository.get_by_id(category_id)
-        if not existing:
-            raise ValueError("Category not found.")
-
-        if existing.name != name and CategoryRepository.name_exists(name):
-            raise ValueError("Category name is already in use.")
-
-        if not CategoryRepository.update(category_id, name):
-            raise RuntimeError("Failed to update category.")
+        with transaction():
+            try:
+                found = CategoryRepository.update(category_id, name)
+            except DuplicateKeyError:
+                raise ValueError("Category name is already in use.") from None
+            if not found:
+                raise ValueError("Category not found.")
+            CatalogCache.invalidate_categories()
 
-        existing.name = name
-        return existing
+        return Category(id=category_id, name=name)
 
     @staticmethod
     def delete(category_id: int) -> bool:
@@ -106,6 +212,9 @@ class CategoryService:
             ValueError: If the category is not found.
         """
         category_id = validate_id(category_id, "Category ID")
-        if not CategoryRepository.get_by_id(category_id):
-            raise ValueError("Category not found.")
-        return CategoryRepository.delete(category_id)
+        with transaction():
+            RollupRepository.remove_category(category_id)
+            if not CategoryRepository.delete(category_id):
+                raise ValueError("Category not found.")
+            CatalogCache.invalidate_categories()
+        return True
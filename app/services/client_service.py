@@ -1,6 +1,16 @@
+from typing import Iterator
+from config.config import PAGINATION_CONFIG
+from db.connection import transaction
+from db.errors import DuplicateKeyError
 from models.client import Client
 from repositories.client_repository import ClientRepository
-from utils.validators import validate_name, validate_email, validate_id
+from utils.validators import (
+    validate_name,
+    validate_email,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
 
 
 class ClientService:
@@ -26,12 +36,49 @@ class ClientService:
         name = validate_name(name, "Client name")
         email = validate_email(email)
 
-        if ClientRepository.email_exists(email):
-            raise ValueError("Email is already registered.")
-
-        client_id = ClientRepository.create(name, email)
+        try:
+            client_id = ClientRepository.create(name, email)
+        except DuplicateKeyError:
+            raise ValueError("Email is already registered.") from None
         return Client(id=client_id, name=name, email=email)
 
+    @staticmethod
+    def create_many(clients: list[tuple[str, str]]) -> list[int]:
+        """
+        Creates many clients at once after validating the whole batch.
+
+        Args:
+            clients (list[tuple[str, str]]): (name, email) pairs.
+
+        Returns:
+            list[int]: The IDs of the new clients, in input order.
+
+        Raises:
+            ValueError: If any row is invalid or an email is repeated or already in use.
+        """
+        rows = []
+        for index, (name, email) in enumerate(clients, start=1):
+            try:
+                rows.append((validate_name(name, "Client name"), validate_email(email)))
+            except ValueError as ve:
+                raise ValueError(f"Row {index}: {ve}") from ve
+
+        emails = [email for _, email in rows]
+        if len(set(emails)) != len(emails):
+            raise ValueError("Email is repeated within the batch.")
+        taken = ClientRepository.existing_emails(emails)
+        if taken:
+            raise ValueError(
+                f"Email is already registered: {', '.join(sorted(taken))}."
+            )
+
+        # The check above can race another writer; the unique key decides.
+        with transaction():
+            try:
+                return ClientRepository.create_many(rows)
+            except DuplicateKeyError:
+                raise ValueError("Email is already registered.") from None
+
     @staticmethod
     def get_by_id(client_id: int) -> Client:
         """
@@ -62,6 +109,63 @@ class ClientService:
         """
         return ClientRepository.list_all()
 
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Client]:
+        """
+        Streams all registered clients one at a time.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the database per batch.
+
+        Returns:
+            Iterator[Client]: Client objects ordered by ID.
+        """
+        return ClientRepository.iter_all(fetch_size)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = None) -> list[Client]:
+        """
+        Retrieves the next page of clients after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Client]: The page of clients, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return ClientRepository.list_page(after_id, limit)
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = None) -> list[Client]:
+        """
+        Retrieves the previous page of clients before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Client]: The page of clients, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return ClientRepository.list_page_before(before_id, limit)
+
     @staticmethod
     def update(client_id: int, email: str) -> Client:
         """
@@ -80,15 +184,10 @@ class ClientService:
         client_id = validate_id(client_id, "Client ID")
         email = validate_email(email)
 
-        existing = ClientRepository.get_by_id(client_id)
-        if not existing:
+        try:
+            client = ClientRepository.update(client_id, email)
+        except DuplicateKeyError:
+            raise ValueError("Email is already registered.") from None
+        if client is None:
             raise ValueError("Client not found.")
-
-        if existing.email != email and ClientRepository.email_exists(email):
-            raise ValueError("Email is already registered.")
-
-        if not ClientRepository.update(client_id, email):
-            raise RuntimeError("Failed to update client.")
-
-        existing.email = email
-        return existing
+        return client
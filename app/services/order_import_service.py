@@ -0,0 +1,243 @@
+import csv
+import json
+import os
+import time
+from collections import namedtuple
+from datetime import date
+from itertools import islice
+from typing import Iterator
+from config.config import IMPORT_CONFIG
+from db.errors import ForeignKeyError
+from repositories.client_repository import ClientRepository
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from utils.validators import validate_date, validate_id
+
+
+class ImportResult(
+    namedtuple("ImportResult", ["rows", "imported", "rejected", "seconds"])
+):
+    """
+    Totals of an order import.
+
+    Attributes:
+        rows (int): Records read from the file.
+        imported (int): Orders inserted.
+        rejected (int): Records written to the rejects file.
+        seconds (float): Wall-clock time spent.
+    """
+
+    __slots__ = ()
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class OrderImportService:
+    """
+    Imports orders from CSV or JSONL files in constant memory.
+
+    Records are read lazily and handled one chunk at a time: each chunk is
+    validated, its client and product IDs are checked with one ``IN`` lookup
+    per table, and the valid rows are bulk-inserted. If a client or product
+    is deleted in between, that chunk is inserted row by row so only the
+    affected records are rejected.
+    """
+
+    @staticmethod
+    def import_file(
+        path: str, rejects_path: str = None, chunk_size: int = None, on_chunk=None
+    ) -> ImportResult:
+        """
+        Imports every order in a file.
+
+        CSV files need a header with ``client_id`` and ``product_id`` and may
+        have ``order_date`` (YYYY-MM-DD; defaults to today). JSONL files hold
+        one object per line with the same keys.
+
+        Args:
+            path (str): The ``.csv`` or ``.jsonl`` file to import.
+            rejects_path (str, optional): Where rejected records are written as
+                JSONL with their line number and error; defaults to
+                ``<path>.rejects.jsonl``.
+            chunk_size (int, optional): Records per chunk; defaults to IMPORT_CHUNK_SIZE.
+            on_chunk (callable, optional): Called with the running ImportResult
+                after each chunk, e.g. to report progress.
+
+        Returns:
+            ImportResult: How many records were read, imported and rejected.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        chunk_size = validate_id(
+            chunk_size or IMPORT_CONFIG["chunk_size"], "Chunk size"
+        )
+        rejects_path = rejects_path or f"{path}.rejects.jsonl"
+        records = read_records(path)
+
+        rows = imported = rejected = 0
+        start = time.perf_counter()
+        with _RejectsFile(rejects_path) as rejects:
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                valid, errors = _validate_chunk(chunk)
+                inserted = _insert_chunk(valid, errors) if valid else 0
+                for line, record, error in errors:
+                    rejects.write(line, record, error)
+
+                rows += len(chunk)
+                imported += inserted
+                rejected += len(errors)
+                if on_chunk is not None:
+                    on_chunk(
+                        ImportResult(
+                            rows, imported, rejected, time.perf_counter() - start
+                        )
+                    )
+
+        return ImportResult(rows, imported, rejected, time.perf_counter() - start)
+
+
+def read_records(path: str) -> Iterator[tuple[int, dict]]:
+    """
+    Lazily reads order records from a CSV or JSONL file.
+
+    Args:
+        path (str): The file to read.
+
+    Yields:
+        tuple[int, dict]: The line number and the raw record.
+
+    Raises:
+        ValueError: If the file extension is neither .csv nor .jsonl.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return _read_csv(path)
+    if extension in (".jsonl", ".ndjson"):
+        return _read_jsonl(path)
+    raise ValueError("Unsupported import format. Use a .csv or .jsonl file.")
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as source:
+        reader = csv.DictReader(source)
+        for record in reader:
+            yield reader.line_num, record
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as source:
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Kept as text so the rejects file shows what was received.
+                record = line.rstrip("\n")
+            yield line_number, record
+
+
+def _validate_chunk(chunk):
+    """
+    Splits a chunk into insertable rows and rejects, with one lookup per table.
+    """
+    parsed, errors = [], []
+    for line, record in chunk:
+        try:
+            parsed.append((line, record, _parse_record(record)))
+        except ValueError as ve:
+            errors.append((line, record, str(ve)))
+
+    clients = ClientRepository.existing_ids({row[0] for _, _, row in parsed})
+    products = ProductRepository.existing_ids({row[1] for _, _, row in parsed})
+
+    valid = []
+    for line, record, row in parsed:
+        if row[0] not in clients:
+            errors.append((line, record, "Client not found."))
+        elif row[1] not in products:
+            errors.append((line, record, "Product not found."))
+        else:
+            valid.append((line, record, row))
+    return valid, errors
+
+
+def _insert_chunk(valid, errors) -> int:
+    """
+    Inserts the validated rows of a chunk and returns how many went in.
+
+    Rows whose client or product was deleted after ``_validate_chunk`` are
+    added to ``errors`` instead.
+    """
+    try:
+        OrderRepository.create_many([row for _, _, row in valid])
+        return len(valid)
+    except ForeignKeyError:
+        pass
+
+    # The failed batch rolled back as a whole; the foreign keys decide row by row.
+    inserted = 0
+    for line, record, row in valid:
+        try:
+            OrderRepository.create_many([row])
+        except ForeignKeyError:
+            errors.append((line, record, "Client or product not found."))
+        else:
+            inserted += 1
+    return inserted
+
+
+def _parse_record(record) -> tuple[int, int, date]:
+    if not isinstance(record, dict):
+        raise ValueError("Malformed record.")
+
+    client_id = validate_id(_to_int(record.get("client_id")), "Client ID")
+    product_id = validate_id(_to_int(record.get("product_id")), "Product ID")
+    order_date = record.get("order_date") or date.today()
+    if isinstance(order_date, str):
+        try:
+            order_date = date.fromisoformat(order_date.strip())
+        except ValueError:
+            raise ValueError("Order date must be a valid date.") from None
+    return client_id, product_id, validate_date(order_date, field_name="Order date")
+
+
+def _to_int(value):
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return value
+    return value
+
+
+class _RejectsFile:
+    """
+    Writes rejected records as JSONL, creating the file only if something is rejected.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        # A rejects file left by an earlier run would be mistaken for this one's.
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        return self
+
+    def write(self, line: int, record, error: str) -> None:
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+        entry = {"line": line, "error": error, "record": record}
+        self._file.write(json.dumps(entry, default=str) + "\n")
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            self._file.close()
@@ -1,9 +1,18 @@
 from datetime import date
+from typing import Iterator
+from config.config import PAGINATION_CONFIG
+from db.errors import ForeignKeyError
 from models.order import Order
+from models.order_view import OrderView
 from repositories.order_repository import OrderRepository
 from repositories.client_repository import ClientRepository
 from repositories.product_repository import ProductRepository
-from utils.validators import validate_id
+from utils.validators import (
+    validate_id,
+    validate_date,
+    validate_cursor_id,
+    validate_page_size,
+)
 
 
 class OrderService:
@@ -14,7 +23,10 @@ class OrderService:
     @staticmethod
     def create(client_id: int, product_id: int) -> Order:
         """
-        Creates a new order after validating client and product existence.
+        Creates a new order, validating client and product existence in the same statement.
+
+        Only when nothing was inserted does a second query find out which
+        reference is missing.
 
         Args:
             client_id (int): The ID of the client.
@@ -29,12 +41,13 @@ class OrderService:
         client_id = validate_id(client_id, "Client ID")
         product_id = validate_id(product_id, "Product ID")
 
-        if not ClientRepository.get_by_id(client_id):
-            raise ValueError("Client not found.")
-        if not ProductRepository.get_by_id(product_id):
+        order_id = OrderRepository.create_if_referenced(client_id, product_id)
+        if order_id is None:
+            client_exists, _ = OrderRepository.references_exist(client_id, product_id)
+            if not client_exists:
+                raise ValueError("Client not found.")
             raise ValueError("Product not found.")
 
-        order_id = OrderRepository.create(client_id, product_id)
         return Order(
             id=order_id,
             client_id=client_id,
@@ -42,6 +55,59 @@ class OrderService:
             order_date=date.today(),
         )
 
+    @staticmethod
+    def create_many(orders: list[tuple]) -> list[int]:
+        """
+        Creates many orders at once, checking clients and products in one lookup each.
+
+        Args:
+            orders (list[tuple]): (client_id, product_id) or
+                (client_id, product_id, order_date) rows; the date defaults to today.
+
+        Returns:
+            list[int]: The IDs of the new orders, in input order.
+
+        Raises:
+            ValueError: If any row is invalid or references a missing client or product.
+        """
+        today = date.today()
+        rows = []
+        for index, order in enumerate(orders, start=1):
+            try:
+                client_id, product_id, *rest = order
+                order_date = (
+                    validate_date(rest[0], field_name="Order date") if rest else today
+                )
+                rows.append(
+                    (
+                        validate_id(client_id, "Client ID"),
+                        validate_id(product_id, "Product ID"),
+                        order_date,
+                    )
+                )
+            except ValueError as ve:
+                raise ValueError(f"Row {index}: {ve}") from ve
+
+        client_ids = {client_id for client_id, _, _ in rows}
+        missing = client_ids - ClientRepository.existing_ids(client_ids)
+        if missing:
+            raise ValueError(
+                f"Client not found: {', '.join(map(str, sorted(missing)))}."
+            )
+
+        product_ids = {product_id for _, product_id, _ in rows}
+        missing = product_ids - ProductRepository.existing_ids(product_ids)
+        if missing:
+            raise ValueError(
+                f"Product not found: {', '.join(map(str, sorted(missing)))}."
+            )
+
+        # A client or product may be deleted after the check; the foreign keys decide.
+        try:
+            return OrderRepository.create_many(rows)
+        except ForeignKeyError:
+            raise ValueError("Client or product not found.") from None
+
     @staticmethod
     def get_by_id(order_id: int) -> Order:
         """
@@ -71,3 +137,137 @@ class OrderService:
             list[Order]: A list of all Order objects.
         """
         return OrderRepository.list_all()
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Order]:
+        """
+        Streams all registered orders one at a time.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the database per batch.
+
+        Returns:
+            Iterator[Order]: Order objects ordered by ID.
+        """
+        return OrderRepository.iter_all(fetch_size)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = None) -> list[Order]:
+        """
+        Retrieves the next page of orders after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Order]: The page of orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return OrderRepository.list_page(after_id, limit)
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = None) -> list[Order]:
+        """
+        Retrieves the previous page of orders before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Order]: The page of orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return OrderRepository.list_page_before(before_id, limit)
+
+    @staticmethod
+    def get_view_by_id(order_id: int) -> OrderView:
+        """
+        Retrieves an order with its client and product details in one query.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            OrderView: The joined order.
+
+        Raises:
+            ValueError: If the order is not found.
+        """
+        order_id = validate_id(order_id, "Order ID")
+        view = OrderRepository.get_view_by_id(order_id)
+        if not view:
+            raise ValueError("Order not found.")
+        return view
+
+    @staticmethod
+    def iter_views(fetch_size: int = None) -> Iterator[OrderView]:
+        """
+        Streams all orders with their client and product details.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the database per batch.
+
+        Returns:
+            Iterator[OrderView]: Joined orders ordered by ID.
+        """
+        return OrderRepository.iter_views(fetch_size)
+
+    @staticmethod
+    def list_view_page(after_id: int = 0, limit: int = None) -> list[OrderView]:
+        """
+        Retrieves the next page of joined orders after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[OrderView]: The page of joined orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return OrderRepository.list_view_page(after_id, limit)
+
+    @staticmethod
+    def list_view_page_before(before_id: int, limit: int = None) -> list[OrderView]:
+        """
+        Retrieves the previous page of joined orders before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[OrderView]: The page of joined orders, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return OrderRepository.list_view_page_before(before_id, limit)
@@ -1,7 +1,19 @@
+from typing import Iterator
+from cache.catalog_cache import CatalogCache
+from config.config import PAGINATION_CONFIG
+from db.connection import transaction
+from db.errors import ForeignKeyError
 from models.product import Product
 from repositories.product_repository import ProductRepository
+from repositories.rollup_repository import RollupRepository
 from repositories.category_repository import CategoryRepository
-from utils.validators import validate_name, validate_positive_price, validate_id
+from utils.validators import (
+    validate_name,
+    validate_positive_price,
+    validate_id,
+    validate_cursor_id,
+    validate_page_size,
+)
 
 
 class ProductService:
@@ -29,12 +41,57 @@ class ProductService:
         price = validate_positive_price(price)
         category_id = validate_id(category_id, "Category ID")
 
-        if not CategoryRepository.get_by_id(category_id):
-            raise ValueError("Category not found.")
+        with transaction():
+            if not CategoryRepository.get_by_id(category_id):
+                raise ValueError("Category not found.")
 
-        product_id = ProductRepository.create(name, price, category_id)
+            product_id = ProductRepository.create(name, price, category_id)
+            CatalogCache.invalidate_products()
         return Product(id=product_id, name=name, price=price, category_id=category_id)
 
+    @staticmethod
+    def create_many(products: list[tuple[str, float, int]]) -> list[int]:
+        """
+        Creates many products at once, checking every category in one lookup.
+
+        Args:
+            products (list[tuple[str, float, int]]): (name, price, category_id) rows.
+
+        Returns:
+            list[int]: The IDs of the new products, in input order.
+
+        Raises:
+            ValueError: If any row is invalid or references a missing category.
+        """
+        rows = []
+        for index, (name, price, category_id) in enumerate(products, start=1):
+            try:
+                rows.append(
+                    (
+                        validate_name(name, "Product name"),
+                        validate_positive_price(price),
+                        validate_id(category_id, "Category ID"),
+                    )
+                )
+            except ValueError as ve:
+                raise ValueError(f"Row {index}: {ve}") from ve
+
+        category_ids = {category_id for _, _, category_id in rows}
+        missing = category_ids - CategoryRepository.existing_ids(category_ids)
+        if missing:
+            raise ValueError(
+                f"Category not found: {', '.join(map(str, sorted(missing)))}."
+            )
+
+        # The category may be deleted after the check; the foreign key decides.
+        with transaction():
+            try:
+                ids = ProductRepository.create_many(rows)
+            except ForeignKeyError:
+                raise ValueError("Category not found.") from None
+            CatalogCache.invalidate_products()
+        return ids
+
     @staticmethod
     def get_by_id(product_id: int) -> Product:
         """
@@ -50,7 +107,7 @@ class ProductService:
             ValueError: If the product is not found.
         """
         product_id = validate_id(product_id, "Product ID")
-        product = ProductRepository.get_by_id(product_id)
+        product = CatalogCache.product_by_id(product_id)
         if not product:
             raise ValueError("Product not found.")
         return product
@@ -63,7 +120,64 @@ class ProductService:
         Returns:
             list[Product]: A list of all Product objects.
         """
-        return ProductRepository.list_all()
+        return CatalogCache.products()
+
+    @staticmethod
+    def iter_all(fetch_size: int = None) -> Iterator[Product]:
+        """
+        Streams all registered products one at a time.
+
+        Args:
+            fetch_size (int, optional): Rows fetched from the database per batch.
+
+        Returns:
+            Iterator[Product]: Product objects ordered by ID.
+        """
+        return ProductRepository.iter_all(fetch_size)
+
+    @staticmethod
+    def list_page(after_id: int = 0, limit: int = None) -> list[Product]:
+        """
+        Retrieves the next page of products after a given ID.
+
+        Args:
+            after_id (int): Last ID already shown; 0 for the first page.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Product]: The page of products, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        after_id = validate_cursor_id(after_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return ProductRepository.list_page(after_id, limit)
+
+    @staticmethod
+    def list_page_before(before_id: int, limit: int = None) -> list[Product]:
+        """
+        Retrieves the previous page of products before a given ID.
+
+        Args:
+            before_id (int): First ID currently shown.
+            limit (int, optional): Page size; defaults to the configured page size.
+
+        Returns:
+            list[Product]: The page of products, ordered by ID.
+
+        Raises:
+            ValueError: If the cursor or page size is invalid.
+        """
+        before_id = validate_cursor_id(before_id)
+        limit = validate_page_size(
+            PAGINATION_CONFIG["page_size"] if limit is None else limit,
+            PAGINATION_CONFIG["max_page_size"],
+        )
+        return ProductRepository.list_page_before(before_id, limit)
 
     @staticmethod
     def update(product_id: int, price: float) -> Product:
@@ -83,15 +197,11 @@ class ProductService:
         product_id = validate_id(product_id, "Product ID")
         price = validate_positive_price(price)
 
-        existing = ProductRepository.get_by_id(product_id)
-        if not existing:
+        product = ProductRepository.update(product_id, price)
+        if product is None:
             raise ValueError("Product not found.")
-
-        if not ProductRepository.update(product_id, price):
-            raise RuntimeError("Failed to update product.")
-
-        existing.price = price
-        return existing
+        CatalogCache.invalidate_products()
+        return product
 
     @staticmethod
     def delete(product_id: int) -> bool:
@@ -108,6 +218,9 @@ class ProductService:
             ValueError: If the product does not exist.
         """
         product_id = validate_id(product_id, "Product ID")
-        if not ProductRepository.get_by_id(product_id):
-            raise ValueError("Product not found.")
-        return ProductRepository.delete(product_id)
+        with transaction():
+            RollupRepository.remove_product(product_id)
+            if not ProductRepository.delete(product_id):
+                raise ValueError("Product not found.")
+            CatalogCache.invalidate_products()
+        return True
@@ -0,0 +1,96 @@
+from datetime import date
+from config.config import PAGINATION_CONFIG
+from models.daily_sales import DailySales
+from models.sales_total import SalesTotal
+from repositories.rollup_repository import RollupRepository
+from utils.validators import validate_date, validate_page_size
+
+
+class ReportService:
+    """
+    Answers sales reports from the daily rollups instead of the orders table.
+    """
+
+    @staticmethod
+    def daily_sales(start: date, end: date) -> list[DailySales]:
+        """
+        Reports order count and revenue for each day of a range.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+
+        Returns:
+            list[DailySales]: One entry per day with orders, ascending.
+
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        start, end = _validate_range(start, end)
+        return RollupRepository.daily_sales(start, end)
+
+    @staticmethod
+    def top_products(start: date, end: date, limit: int = 10) -> list[SalesTotal]:
+        """
+        Reports the products with the highest revenue in a range.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+            limit (int): Maximum number of products to return.
+
+        Returns:
+            list[SalesTotal]: Product totals, highest revenue first.
+
+        Raises:
+            ValueError: If the range or the limit is invalid.
+        """
+        start, end = _validate_range(start, end)
+        limit = validate_page_size(limit, PAGINATION_CONFIG["max_page_size"])
+        return RollupRepository.product_sales(start, end, limit)
+
+    @staticmethod
+    def category_sales(start: date, end: date) -> list[SalesTotal]:
+        """
+        Reports order count and revenue per category in a range.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range, inclusive.
+
+        Returns:
+            list[SalesTotal]: Category totals, highest revenue first.
+
+        Raises:
+            ValueError: If the range is invalid.
+        """
+        start, end = _validate_range(start, end)
+        return RollupRepository.category_sales(start, end)
+
+    @staticmethod
+    def rebuild(start: date = None, end: date = None) -> None:
+        """
+        Recomputes the rollups from the orders table, for a range or for all days.
+
+        Args:
+            start (date, optional): First day to rebuild.
+            end (date, optional): Last day to rebuild, inclusive.
+
+        Raises:
+            ValueError: If a bound is not a date or the range is reversed.
+        """
+        if start is not None:
+            start = validate_date(start, allow_future=True, field_name="Start date")
+        if end is not None:
+            end = validate_date(end, allow_future=True, field_name="End date")
+        if start and end and start > end:
+            raise ValueError("Start date must not be after end date.")
+        RollupRepository.rebuild(start, end)
+
+
+def _validate_range(start: date, end: date) -> tuple[date, date]:
+    start = validate_date(start, allow_future=True, field_name="Start date")
+    end = validate_date(end, allow_future=True, field_name="End date")
+    if start > end:
+        raise ValueError("Start date must not be after end date.")
+    return start, end
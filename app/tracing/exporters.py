@@ -0,0 +1,116 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+
+class JsonLinesExporter:
+    """
+    Appends finished spans to a file, one JSON object per line.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The file to append to; created if missing.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans) -> None:
+        lines = "".join(
+            json.dumps(span.to_dict(), default=str) + "\n" for span in spans
+        )
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(lines)
+
+
+class OtlpHttpExporter:
+    """
+    Posts finished spans to an OpenTelemetry collector over OTLP/HTTP with JSON
+    encoding, using only the standard library.
+
+    Export failures are counted and the batch is dropped: tracing must never
+    take the application down with the collector.
+    """
+
+    def __init__(
+        self, endpoint: str, service_name: str = "marketflow", timeout: float = 5.0
+    ):
+        """
+        Args:
+            endpoint (str): The collector's traces URL, e.g. http://127.0.0.1:4318/v1/traces.
+            service_name (str): Reported as the 'service.name' resource attribute.
+            timeout (float): Seconds to wait for the collector.
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self.failures = 0
+
+    def export(self, spans) -> None:
+        body = json.dumps(self.payload(spans)).encode()
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except (urllib.error.URLError, OSError):
+            self.failures += 1
+
+    def payload(self, spans) -> dict:
+        """
+        Builds the OTLP ExportTraceServiceRequest for a batch of spans.
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "marketflow.tracing"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_span(span) -> dict:
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        # SPAN_KIND_INTERNAL
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            _attribute(key, value) for key, value in span.attributes.items()
+        ],
+        # STATUS_CODE_ERROR or STATUS_CODE_UNSET
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def _attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
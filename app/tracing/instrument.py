@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+
+import controllers
+import repositories
+import services
+from config.config import TRACING_CONFIG
+from tracing import tracer
+from tracing.exporters import JsonLinesExporter, OtlpHttpExporter
+from utils.method_hooks import find_classes, hook_static_methods
+
+# Packages whose classes get a span per method call, and their layer attribute.
+LAYERS = {
+    "controller": (controllers, "Controller"),
+    "service": (services, "Service"),
+    "repository": (repositories, "Repository"),
+}
+
+
+def install() -> list[str]:
+    """
+    Wraps every public controller, service and repository method in a span.
+
+    Each call becomes the parent of the calls it makes, down to the
+    connection acquire and query spans of the connection layer. Controller
+    spans include the time spent waiting for input. Installing twice leaves
+    methods wrapped once.
+
+    Returns:
+        list[str]: The traced methods, as 'Class.method'.
+    """
+    traced = []
+    for layer, (package, suffix) in LAYERS.items():
+        for cls in find_classes(package, suffix):
+            traced.extend(trace_class(cls, layer))
+    return traced
+
+
+def trace_class(cls, layer: str) -> list[str]:
+    """
+    Wraps the public static methods of one class in spans.
+
+    Args:
+        cls (type): The class to patch.
+        layer (str): The 'marketflow.layer' attribute, e.g. 'service'.
+
+    Returns:
+        list[str]: The traced methods, as 'Class.method'.
+    """
+
+    def on_start(class_name, method):
+        return tracer.start_span(
+            f"{class_name}.{method}",
+            {
+                "marketflow.layer": layer,
+                "code.namespace": class_name,
+                "code.function": method,
+            },
+        )
+
+    return hook_static_methods(cls, "__tracing_hook__", on_start, _on_finish, _activate)
+
+
+def start_tracing() -> None:
+    """
+    Configures the exporter and instruments the application.
+
+    Does nothing unless TRACING_ENABLED is true. TRACING_EXPORTER selects
+    the JSON-lines file ('jsonl') or an OTLP/HTTP collector ('otlp').
+
+    Raises:
+        ValueError: If TRACING_EXPORTER names an unknown exporter.
+    """
+    if not TRACING_CONFIG["enabled"]:
+        return
+    if TRACING_CONFIG["exporter"] == "jsonl":
+        exporter = JsonLinesExporter(TRACING_CONFIG["path"])
+    elif TRACING_CONFIG["exporter"] == "otlp":
+        exporter = OtlpHttpExporter(
+            TRACING_CONFIG["endpoint"], TRACING_CONFIG["service_name"]
+        )
+    else:
+        raise ValueError(
+            f"Unknown tracing exporter '{TRACING_CONFIG['exporter']}'. Choose from: jsonl, otlp."
+        )
+    tracer.configure(exporter)
+    install()
+
+
+@contextmanager
+def _activate(span):
+    # The span is the parent of the calls made while the method's code runs;
+    # for generators only while they run, not while the caller iterates.
+    token = tracer.activate(span)
+    try:
+        yield
+    finally:
+        tracer.deactivate(token)
+
+
+def _on_finish(span, error, result) -> None:
+    if isinstance(result, list):
+        span.set("marketflow.result_count", len(result))
+    span.end(error)
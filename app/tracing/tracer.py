@@ -0,0 +1,234 @@
+import atexit
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from config.config import TRACING_CONFIG
+
+# Spans are exported in batches from a background thread; beyond MAX_QUEUE
+# unexported spans, new ones are dropped rather than slowing callers down.
+MAX_BATCH = 512
+MAX_QUEUE = 4096
+FLUSH_INTERVAL = 5.0
+
+
+class Span:
+    """
+    One timed operation of a trace, e.g. a service call or a query.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    recording = True
+
+    def __init__(
+        self, name: str, trace_id: str, parent_id: str | None, attributes: dict
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+
+    def set(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: BaseException = None) -> None:
+        """
+        Finishes the span and hands it to the exporter.
+
+        Args:
+            error (BaseException, optional): What made the operation fail.
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        _processor.add(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NonRecordingSpan:
+    """
+    Stands in for the spans of unsampled traces: every operation is a no-op.
+    """
+
+    __slots__ = ()
+
+    recording = False
+
+    def set(self, key: str, value) -> None:
+        pass
+
+    def end(self, error: BaseException = None) -> None:
+        pass
+
+
+NOT_RECORDING = _NonRecordingSpan()
+
+
+class _BatchProcessor:
+    """
+    Queues finished spans and exports them in batches from a daemon thread.
+    """
+
+    def __init__(self):
+        self.exporter = None
+        self.dropped = 0
+        self._queue = []
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self, exporter) -> None:
+        self.exporter = exporter
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="tracing-export", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            if len(self._queue) >= MAX_QUEUE:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            full = len(self._queue) >= MAX_BATCH
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._export_lock:
+            with self._lock:
+                spans, self._queue = self._queue, []
+            if spans and self.exporter is not None:
+                while spans:
+                    batch, spans = spans[:MAX_BATCH], spans[MAX_BATCH:]
+                    self.exporter.export(batch)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+
+_settings = dict(TRACING_CONFIG)
+_processor = _BatchProcessor()
+_current_span = ContextVar("marketflow_current_span", default=None)
+
+
+def configure(exporter, sample_rate: float = None) -> None:
+    """
+    Turns tracing on, sending finished spans to an exporter.
+
+    Args:
+        exporter: An object with an ``export(spans)`` method, such as
+            ``JsonLinesExporter`` or ``OtlpHttpExporter``.
+        sample_rate (float, optional): Share of traces to record, from 0 to 1;
+            defaults to TRACING_SAMPLE_RATE.
+    """
+    if sample_rate is not None:
+        _settings["sample_rate"] = sample_rate
+    _processor.start(exporter)
+    _settings["enabled"] = True
+
+
+def disable() -> None:
+    """
+    Stops recording new spans. Spans already queued are still exported.
+    """
+    _settings["enabled"] = False
+
+
+def is_enabled() -> bool:
+    return _settings["enabled"]
+
+
+def flush() -> None:
+    """
+    Exports every queued span now, e.g. before a short-lived script exits.
+    """
+    _processor.flush()
+
+
+def start_span(name: str, attributes: dict = None):
+    """
+    Starts a span as a child of the current one, without making it current.
+
+    Use it for leaf operations such as queries; ``activate`` makes a span the
+    parent of the spans started inside it. Whether a trace is recorded is
+    decided once at its root span, so a trace is either complete or absent.
+
+    Args:
+        name (str): Operation name, e.g. 'ProductService.list_all'.
+        attributes (dict, optional): Initial attributes.
+
+    Returns:
+        Span: The span, or a non-recording stand-in when tracing is off or the
+        trace was not sampled. Call ``end()`` on it either way.
+    """
+    if not _settings["enabled"]:
+        return NOT_RECORDING
+    parent = _current_span.get()
+    if parent is None:
+        if random.random() >= _settings["sample_rate"]:
+            return NOT_RECORDING
+        return Span(name, f"{random.getrandbits(128):032x}", None, attributes or {})
+    if not parent.recording:
+        return NOT_RECORDING
+    return Span(name, parent.trace_id, parent.span_id, attributes or {})
+
+
+def activate(span):
+    """
+    Makes a span the parent of the spans started in this context.
+
+    Returns:
+        A token to pass to ``deactivate`` once the span's operation is over.
+    """
+    return _current_span.set(span)
+
+
+def deactivate(token) -> None:
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # A generator finalized from another context; that context never saw the span.
+        pass
+
+
+def current_span():
+    """
+    Returns the span of the operation running in this context, if any.
+    """
+    return _current_span.get()
@@ -1,41 +1,87 @@
-import inflect
-from services.category_service import CategoryService
+from functools import lru_cache
+
+from utils.label_resolver import LabelResolver
+from utils.pagination import ID_WIDTH, TEXT_WIDTH, Column, show_page
+
+# Plurals of the entity names the controllers list, precomputed so that a
+# listing does not have to import inflect, which takes seconds to load.
+PLURALS = {
+    "category": "categories",
+    "client": "clients",
+    "order": "orders",
+    "product": "products",
+}
+
 
 def list_entities(service, entity_name):
     """
-    Dynamically prints all fields of each entity returned by the service's list_all method.
+    Shows every field of the service's first page of records as a table.
+
+    Controllers call this before asking for an ID, so it never prompts: one
+    keyset page is shown (the table is never loaded whole) and any ID can
+    then be typed. The list_all screens page through the rest. Foreign keys
+    (category, client, product) are shown by name, resolved once per page.
 
     Args:
-        service: The service class that provides the list_all() method.
+        service: The service class that provides list_page().
         entity_name (str): The name of the entity type (for display only).
     """
-    p = inflect.engine()
+    plural_name = plural(entity_name)
+    labels = LabelResolver()
     try:
-        items = service.list_all()
-        if not items:
-            print(f"\nℹ️ No registered {p.plural(entity_name)} found.")
-            return
+        show_page(
+            service.list_page,
+            lambda page: entity_columns(page[0], labels),
+            f"\n📦 Registered {plural_name.capitalize()}:",
+            f"\nℹ️ No registered {plural_name} found.",
+            prepare_page=labels.load,
+        )
+        print()
+    except Exception as e:
+        print(f"❌ Failed to load {plural_name}: {e}")
 
-        plural_name = p.plural(entity_name)
-        print(f"\n📦 Registered {plural_name.capitalize()}:")
 
-        for item in items:
-            attributes = vars(item)
+def entity_columns(item, labels: LabelResolver) -> list[Column]:
+    """
+    Builds one column per field of a record, showing foreign keys by name.
+    """
+    columns = []
+    for key in item.to_dict():
+        if labels.resolves(key):
+            title, width = labels.title(key), TEXT_WIDTH
+        else:
+            title, width = (
+                ("ID", ID_WIDTH) if key == "id" else (key.capitalize(), TEXT_WIDTH)
+            )
+        columns.append(Column(title, width, _cell_value(key, labels)))
+    return columns
 
-            # Se for produto, carrega dicionário {id: name} das categorias
-            category_names = {}
-            if entity_name == "product":
-                category_names = {c.id: c.name for c in CategoryService.list_all()}
 
-            print("\n" + "\n".join([
-            f"- {'Category' if key == 'category_id' and entity_name == 'product' else key.capitalize()}: "
-            f"{category_names[value] if key == 'category_id' and entity_name == 'product' else format_value(key, value)}"
-            for key, value in attributes.items()
-        ]))
+def _cell_value(key, labels: LabelResolver):
+    if labels.resolves(key):
+        return lambda item: labels.label(key, getattr(item, key))
+    return lambda item: format_value(key, getattr(item, key))
 
-        print()
-    except Exception as e:
-        print(f"❌ Failed to load {entity_name}s: {e}")
+
+@lru_cache(maxsize=256)
+def plural(noun: str) -> str:
+    """
+    Returns the plural of an entity name.
+
+    Known entities come from PLURALS; any other name is pluralized by an
+    inflect engine created on first use and shared afterwards.
+    """
+    known = PLURALS.get(noun)
+    if known is not None:
+        return known
+    return _inflect_engine().plural(noun)
+
+
+@lru_cache(maxsize=1)
+def _inflect_engine():
+    import inflect
+
+    return inflect.engine()
 
 
 def format_value(key, value):
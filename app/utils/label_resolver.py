@@ -0,0 +1,71 @@
+from repositories.category_repository import CategoryRepository
+from repositories.client_repository import ClientRepository
+from repositories.product_repository import ProductRepository
+
+# Foreign-key fields shown by name: field -> (display title, batched name lookup).
+FOREIGN_KEYS = {
+    "category_id": ("Category", CategoryRepository.names_by_ids),
+    "client_id": ("Client", ClientRepository.names_by_ids),
+    "product_id": ("Product", ProductRepository.names_by_ids),
+}
+
+
+class LabelResolver:
+    """
+    Resolves foreign-key IDs to display names for a batch of records.
+
+    ``load`` collects every referenced ID per foreign-key field and resolves
+    them with one lookup per referenced table, so rendering N records costs
+    a constant number of queries instead of one per record.
+    """
+
+    def __init__(self):
+        """
+        Initializes a resolver with no labels loaded.
+        """
+        self._labels = {field: {} for field in FOREIGN_KEYS}
+
+    def load(self, items) -> None:
+        """
+        Loads the labels referenced by a batch of records.
+
+        Args:
+            items: Model objects exposing to_dict().
+        """
+        wanted = {field: set() for field in FOREIGN_KEYS}
+        for item in items:
+            for field, value in item.to_dict().items():
+                if field in wanted and value not in self._labels[field]:
+                    wanted[field].add(value)
+
+        for field, ids in wanted.items():
+            if ids:
+                _, lookup = FOREIGN_KEYS[field]
+                self._labels[field].update(lookup(ids))
+
+    @staticmethod
+    def resolves(field: str) -> bool:
+        """
+        Tells whether a field is a foreign key shown by name.
+        """
+        return field in FOREIGN_KEYS
+
+    @staticmethod
+    def title(field: str) -> str:
+        """
+        Returns the display title of a foreign-key field, e.g. 'Category'.
+        """
+        return FOREIGN_KEYS[field][0]
+
+    def label(self, field: str, value: int) -> str:
+        """
+        Returns the loaded name for a foreign-key value.
+
+        Args:
+            field (str): The foreign-key field, e.g. 'category_id'.
+            value (int): The referenced ID.
+
+        Returns:
+            str: The referenced record's name, or 'Unknown' if it was not found.
+        """
+        return self._labels[field].get(value, "Unknown")
@@ -0,0 +1,150 @@
+import functools
+import importlib
+import inspect
+import pkgutil
+from contextlib import nullcontext
+
+
+def find_classes(package, suffix: str) -> list[type]:
+    """
+    Imports every module of a package and returns the classes named '*<suffix>'.
+
+    Modules whose optional dependencies are missing are skipped.
+
+    Args:
+        package (module): A package such as ``repositories``.
+        suffix (str): Class name suffix, e.g. 'Repository'.
+
+    Returns:
+        list[type]: The classes defined in the package's modules.
+    """
+    classes = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        try:
+            module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        except ImportError:
+            continue
+        classes.extend(
+            cls
+            for cls in vars(module).values()
+            if inspect.isclass(cls)
+            and cls.__module__ == module.__name__
+            and cls.__name__.endswith(suffix)
+        )
+    return classes
+
+
+def hook_static_methods(
+    cls, marker: str, on_start, on_finish, activate=None
+) -> list[str]:
+    """
+    Wraps the public static methods of a class with start and finish callbacks.
+
+    Classes are patched in place, so callers that imported them directly are
+    covered too. A method already carrying ``marker`` is left alone, which
+    makes hooking idempotent; different markers stack.
+
+    Args:
+        cls (type): The class to patch.
+        marker (str): Attribute set on the wrappers, e.g. '__metrics_hook__'.
+        on_start (callable): Called with (class name, method name) before each
+            call; returns a state object.
+        on_finish (callable): Called with (state, error, result) once the call
+            is over; error is None on success.
+        activate (callable, optional): Called with the state; returns a context
+            manager entered only while the method's own code runs.
+
+    Returns:
+        list[str]: The hooked methods, as 'Class.method'.
+    """
+    hooked = []
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not isinstance(attribute, staticmethod):
+            continue
+        function = attribute.__func__
+        if not getattr(function, marker, False):
+            wrapper = wrap_call(
+                function, (cls.__name__, name), on_start, on_finish, activate
+            )
+            setattr(wrapper, marker, True)
+            setattr(cls, name, staticmethod(wrapper))
+        hooked.append(f"{cls.__name__}.{name}")
+    return hooked
+
+
+def wrap_call(function, key: tuple, on_start, on_finish, activate=None):
+    """
+    Wraps a function so callbacks run around each call.
+
+    Coroutines finish when awaited and generators when exhausted or closed,
+    so their time covers the work rather than the creation of the object.
+    Generators report the number of items they yielded as their result.
+
+    ``activate`` wraps the whole call of functions and coroutines, but only
+    each resume of a generator: a generator runs in its caller's context, so
+    whatever it activated would otherwise stay active while the caller works
+    between two items.
+    """
+    if activate is None:
+        activate = _inactive
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            state = on_start(*key)
+            try:
+                with activate(state):
+                    result = await function(*args, **kwargs)
+            except Exception as error:
+                on_finish(state, error, None)
+                raise
+            on_finish(state, None, result)
+            return result
+
+    elif inspect.isgeneratorfunction(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            state = on_start(*key)
+            items = function(*args, **kwargs)
+            count = 0
+            error = None
+            try:
+                while True:
+                    with activate(state):
+                        try:
+                            item = next(items)
+                        except StopIteration:
+                            break
+                    count += 1
+                    yield item
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                # Closing the inner generator runs its cleanup when the caller
+                # stops early, as ``yield from`` would.
+                with activate(state):
+                    items.close()
+                on_finish(state, error, None if error else count)
+
+    else:
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            state = on_start(*key)
+            try:
+                with activate(state):
+                    result = function(*args, **kwargs)
+            except Exception as error:
+                on_finish(state, error, None)
+                raise
+            on_finish(state, None, result)
+            return result
+
+    return wrapper
+
+
+def _inactive(state):
+    return nullcontext()
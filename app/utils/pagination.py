@@ -0,0 +1,278 @@
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from config.config import PAGINATION_CONFIG
+
+PAGE_PROMPT = "[Enter] next page | [p] previous page | [g ID] go to ID | [q] back: "
+
+# Pages kept for going back (and forward again) without a query.
+HISTORY_PAGES = 20
+
+# Default column widths of list views.
+ID_WIDTH = 8
+TEXT_WIDTH = 24
+
+
+class Column(namedtuple("Column", ["title", "width", "value"])):
+    """
+    One fixed-width column of a list view.
+
+    Attributes:
+        title (str): Header text.
+        width (int): Characters reserved for the column; longer values are cut.
+        value (callable): Returns the cell value of a record.
+    """
+
+    __slots__ = ()
+
+
+def fit(value, width: int) -> str:
+    """
+    Pads or cuts a value to exactly ``width`` characters.
+    """
+    text = "" if value is None else str(value)
+    if len(text) > width:
+        return text[: width - 1] + "…"
+    return text.ljust(width)
+
+
+def format_table(columns, page) -> str:
+    """
+    Formats a header and one line per record as a single block of text.
+
+    Args:
+        columns (list[Column]): The columns to show.
+        page (list): The records.
+
+    Returns:
+        str: The table, ending with a newline.
+    """
+    header = " ".join(fit(column.title, column.width) for column in columns)
+    lines = [header.rstrip(), "-" * len(header)]
+    for item in page:
+        cells = (fit(column.value(item), column.width) for column in columns)
+        lines.append(" ".join(cells).rstrip())
+    return "\n".join(lines) + "\n"
+
+
+class PageBrowser:
+    """
+    Keyset pages of records, navigated forward, back or straight to an ID.
+
+    While a page is shown, the next one is fetched on a background thread,
+    so moving forward rarely waits for the database. Pages already seen are
+    kept (up to HISTORY_PAGES each way) so going back and forth again does
+    not query at all.
+    """
+
+    def __init__(self, list_page, list_page_before, page_size: int):
+        """
+        Args:
+            list_page (callable): Returns the page after an ID, e.g. a service's list_page.
+            list_page_before (callable): Returns the page before an ID.
+            page_size (int): Records per page.
+        """
+        self._list_page = list_page
+        self._list_page_before = list_page_before
+        self.page_size = page_size
+        self.page = []
+        self._behind = deque(maxlen=HISTORY_PAGES)
+        self._ahead = deque(maxlen=HISTORY_PAGES)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._next = None
+
+    def first(self) -> list:
+        """
+        Loads the first page.
+        """
+        return self.go_to(1)
+
+    def go_to(self, record_id: int) -> list:
+        """
+        Loads the page starting at a record ID (or the next existing one).
+
+        Returns:
+            list: The new page; empty (and the current page kept) if there
+            are no records from that ID on.
+        """
+        target = self._list_page(max(record_id, 1) - 1, self.page_size)
+        if target:
+            self._behind.clear()
+            self._ahead.clear()
+            self._show(target)
+        return target
+
+    def next(self) -> list:
+        """
+        Moves to the next page, using the prefetched one when it is ready.
+
+        Returns:
+            list: The new page, or an empty list at the last page.
+        """
+        if self._ahead:
+            target = self._ahead.pop()
+        elif self._next is not None:
+            target = self._next.result()
+        else:
+            target = []
+        if target:
+            self._behind.append(self.page)
+            self._show(target)
+        return target
+
+    def previous(self) -> list:
+        """
+        Moves to the previous page.
+
+        Returns:
+            list: The new page, or an empty list at the first page.
+        """
+        if self._behind:
+            target = self._behind.pop()
+        else:
+            target = self._list_page_before(self.page[0].id, self.page_size)
+        if target:
+            self._ahead.append(self.page)
+            self._show(target)
+        return target
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _show(self, page: list) -> None:
+        self.page = page
+        self._next = None
+        if not self._ahead and len(page) == self.page_size:
+            # The context is copied so the prefetch joins the caller's trace.
+            self._next = self._executor.submit(
+                copy_context().run, self._list_page, page[-1].id, self.page_size
+            )
+
+
+def browse_pages(
+    list_page,
+    list_page_before,
+    columns,
+    title: str,
+    empty_message: str,
+    page_size=None,
+    prepare_page=None,
+    out=None,
+):
+    """
+    Shows records as a fixed-width table, one keyset page at a time.
+
+    Each page is formatted in full and written with a single buffered write,
+    instead of one print() per row, while the next page is prefetched.
+
+    Args:
+        list_page (callable): Returns the page after an ID, e.g. a service's list_page.
+        list_page_before (callable): Returns the page before an ID.
+        columns (list[Column] or callable): The columns to show, or a function
+            building them from the first page.
+        title (str): Header printed above the first page.
+        empty_message (str): Message printed when there are no records.
+        page_size (int, optional): Records per page; defaults to the configured page size.
+        prepare_page (callable, optional): Called with each page before it is
+            rendered, e.g. to batch-load the labels its records reference.
+        out (optional): Text stream to write to; defaults to sys.stdout.
+    """
+    out = out or sys.stdout
+    browser = PageBrowser(
+        list_page, list_page_before, page_size or PAGINATION_CONFIG["page_size"]
+    )
+    try:
+        if not browser.first():
+            print(empty_message, file=out)
+            return
+
+        columns = _render_first(out, columns, title, browser.page, prepare_page)
+        if len(browser.page) < browser.page_size:
+            return
+
+        while True:
+            choice = input(PAGE_PROMPT).strip().lower()
+            if choice == "q":
+                break
+
+            if choice == "p":
+                moved, edge = browser.previous(), "first"
+            elif choice.startswith("g"):
+                record_id = choice[1:].strip()
+                if not record_id.isdigit():
+                    print("\n❌ Enter 'g' followed by a numeric ID.\n", file=out)
+                    continue
+                moved = browser.go_to(int(record_id))
+                if not moved:
+                    print(f"\nℹ️ No records from ID {record_id} on.\n", file=out)
+                    continue
+            else:
+                moved, edge = browser.next(), "last"
+
+            if not moved:
+                print(f"\nℹ️ Already at the {edge} page.\n", file=out)
+                continue
+
+            print(file=out)
+            _render(out, columns, browser.page, prepare_page)
+    finally:
+        browser.close()
+
+
+def show_page(
+    list_page,
+    columns,
+    title: str,
+    empty_message: str,
+    page_size=None,
+    prepare_page=None,
+    out=None,
+) -> list:
+    """
+    Shows the first page of records as a fixed-width table, without prompting.
+
+    Meant for screens that list records only so the user can then type an
+    ID, where a paging prompt would swallow that input.
+
+    Args:
+        list_page (callable): Returns the page after an ID, e.g. a service's list_page.
+        columns (list[Column] or callable): The columns to show, or a function
+            building them from the page.
+        title (str): Header printed above the page.
+        empty_message (str): Message printed when there are no records.
+        page_size (int, optional): Records shown; defaults to the configured page size.
+        prepare_page (callable, optional): Called with the page before it is rendered.
+        out (optional): Text stream to write to; defaults to sys.stdout.
+
+    Returns:
+        list: The records shown.
+    """
+    out = out or sys.stdout
+    page_size = page_size or PAGINATION_CONFIG["page_size"]
+    page = list_page(0, page_size)
+    if not page:
+        print(empty_message, file=out)
+        return page
+
+    _render_first(out, columns, title, page, prepare_page)
+    if len(page) == page_size:
+        print(f"\nℹ️ Showing the first {page_size}; any ID can be entered.", file=out)
+    return page
+
+
+def _render_first(out, columns, title, page, prepare_page):
+    if callable(columns):
+        columns = columns(page)
+    print(title, file=out)
+    print(file=out)
+    _render(out, columns, page, prepare_page)
+    return columns
+
+
+def _render(out, columns, page, prepare_page) -> None:
+    if prepare_page is not None:
+        prepare_page(page)
+    out.write(format_table(columns, page))
+    out.flush()
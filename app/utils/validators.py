@@ -81,6 +81,44 @@ def validate_id(value: int, field_name: str = "ID") -> int:
     return value
 
 
+def validate_cursor_id(value: int, field_name: str = "Cursor ID") -> int:
+    """
+    Validates a keyset pagination cursor, where 0 means "from the start".
+
+    Args:
+        value (int): The value to validate.
+        field_name (str): Optional label for custom error messaging.
+
+    Returns:
+        int: The validated cursor.
+
+    Raises:
+        ValueError: If the value is not a non-negative integer.
+    """
+    if not isinstance(value, int) or value < 0:
+        raise ValueError(f"{field_name} must be a non-negative integer.")
+    return value
+
+
+def validate_page_size(value: int, maximum: int) -> int:
+    """
+    Validates that a page size is a positive integer no larger than the maximum.
+
+    Args:
+        value (int): The requested page size.
+        maximum (int): The largest page size allowed.
+
+    Returns:
+        int: The validated page size.
+
+    Raises:
+        ValueError: If the page size is out of range.
+    """
+    if not isinstance(value, int) or not 0 < value <= maximum:
+        raise ValueError(f"Page size must be between 1 and {maximum}.")
+    return value
+
+
 def validate_date(
     value: date, allow_future: bool = False, field_name: str = "Date"
 ) -> date:
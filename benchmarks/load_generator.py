@@ -0,0 +1,308 @@
+"""
+Drives concurrent checkout traffic against MarketFlow and reports latencies.
+
+Each worker (a thread or a process) runs a weighted mix of operations for a
+fixed duration:
+
+    order.create       OrderService.create for a random client and product
+    product.get_by_id  ProductService.get_by_id for a random product
+    product.list_all   ProductService.list_all
+
+The report gives throughput, p50/p95/p99 latency and error rate per
+operation, the connection pool counters of every worker process and the
+peak number of server connections, and is also written as JSON so runs with
+different connection settings can be compared.
+
+Usage (with ``app/`` on PYTHONPATH, as in the app container):
+    python benchmarks/load_generator.py --workers 16 --duration 30 \\
+        --mix order.create=20,product.get_by_id=75,product.list_all=5 \\
+        --output load-results.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from db.connection import borrow_connection, get_pool
+from repositories.client_repository import ClientRepository
+from repositories.product_repository import ProductRepository
+from services.category_service import CategoryService
+from services.client_service import ClientService
+from services.order_service import OrderService
+from services.product_service import ProductService
+
+DEFAULT_MIX = "order.create=20,product.get_by_id=75,product.list_all=5"
+SEED_ROWS = 100
+SERVER_SAMPLE_INTERVAL = 0.5
+
+OPERATIONS = {
+    "order.create": lambda rng, ids: OrderService.create(
+        rng.choice(ids["clients"]), rng.choice(ids["products"])
+    ),
+    "product.get_by_id": lambda rng, ids: ProductService.get_by_id(
+        rng.choice(ids["products"])
+    ),
+    "product.list_all": lambda rng, ids: ProductService.list_all(),
+}
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """
+    Parses 'name=weight,...' into a dictionary of operation weights.
+    """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation '{name}'. Choose from: {', '.join(OPERATIONS)}."
+            )
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("The operation mix needs at least one positive weight.")
+    return mix
+
+
+def load_ids(sample: int) -> dict[str, list[int]]:
+    """
+    Picks the clients and products the workers will use, seeding a few if there are none.
+    """
+    clients = [c.id for c in ClientRepository.list_page(0, sample)]
+    if not clients:
+        clients = ClientService.create_many(
+            [(f"Load Client {n}", f"load{n}@example.com") for n in range(SEED_ROWS)]
+        )
+
+    products = [p.id for p in ProductRepository.list_page(0, sample)]
+    if not products:
+        categories = CategoryService.list_page(0, 1)
+        category = categories[0] if categories else CategoryService.create("Load Test")
+        products = ProductService.create_many(
+            [(f"Load Product {n}", 1.0 + n % 50, category.id) for n in range(SEED_ROWS)]
+        )
+
+    return {"clients": clients, "products": products}
+
+
+def run_worker(worker: int, mix: dict, ids: dict, duration: float, seed: int) -> dict:
+    """
+    Runs operations until the duration elapses and returns raw measurements.
+    """
+    rng = random.Random(seed + worker)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies = {name: [] for name in names}
+    errors = {name: Counter() for name in names}
+
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            OPERATIONS[name](rng, ids)
+        except Exception as e:
+            errors[name][type(e).__name__] += 1
+        latencies[name].append(time.perf_counter() - start)
+
+    return {"latencies": latencies, "errors": errors}
+
+
+def run_process(worker: int, threads: int, mix, ids, duration, seed) -> dict:
+    """
+    Entry point of a worker process: runs its threads and reports its own pool.
+    """
+    results = run_threads(worker * threads, threads, mix, ids, duration, seed)
+    return {"workers": results, "pool": get_pool().stats()}
+
+
+def run_threads(first: int, count: int, mix, ids, duration, seed) -> list[dict]:
+    """
+    Runs ``count`` workers as threads sharing this process's pool.
+    """
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [
+            executor.submit(run_worker, first + n, mix, ids, duration, seed)
+            for n in range(count)
+        ]
+        return [future.result() for future in futures]
+
+
+def sample_server_connections(stop: threading.Event, peak: list) -> None:
+    """
+    Records the highest Threads_connected value seen while the load runs.
+    """
+    while not stop.wait(SERVER_SAMPLE_INTERVAL):
+        try:
+            with borrow_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SHOW GLOBAL STATUS LIKE 'Threads_connected'")
+                peak[0] = max(peak[0], int(cursor.fetchone()[1]))
+                cursor.close()
+        except Exception:
+            pass
+
+
+def summarize(worker_results: list[dict], mix: dict, elapsed: float) -> dict:
+    """
+    Merges per-worker measurements into per-operation statistics.
+    """
+    operations = {}
+    total_ops = total_errors = 0
+    for name in mix:
+        samples = sorted(
+            latency
+            for result in worker_results
+            for latency in result["latencies"][name]
+        )
+        errors = Counter()
+        for result in worker_results:
+            errors.update(result["errors"][name])
+        count = len(samples)
+        failed = sum(errors.values())
+        total_ops += count
+        total_errors += failed
+        operations[name] = {
+            "count": count,
+            "throughput": count / elapsed,
+            "errors": failed,
+            "error_rate": failed / count if count else 0.0,
+            "error_types": dict(errors),
+            "mean_ms": sum(samples) / count * 1000 if count else None,
+            "p50_ms": percentile(samples, 50),
+            "p95_ms": percentile(samples, 95),
+            "p99_ms": percentile(samples, 99),
+            "max_ms": samples[-1] * 1000 if samples else None,
+        }
+
+    return {
+        "ops": total_ops,
+        "throughput": total_ops / elapsed,
+        "errors": total_errors,
+        "error_rate": total_errors / total_ops if total_ops else 0.0,
+        "operations": operations,
+    }
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float | None:
+    """
+    Nearest-rank percentile of sorted latencies in seconds, returned in milliseconds.
+    """
+    if not sorted_samples:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1] * 1000
+
+
+def merge_pool_stats(stats: list[dict]) -> dict:
+    """
+    Adds up the pool counters of every worker process.
+    """
+    merged = Counter()
+    for snapshot in stats:
+        merged.update(snapshot)
+    return dict(merged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--workers", type=int, default=8, help="threads, or processes with --processes"
+    )
+    parser.add_argument(
+        "--processes", action="store_true", help="run each worker as a process"
+    )
+    parser.add_argument("--threads-per-process", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="operation=weight pairs")
+    parser.add_argument(
+        "--sample", type=int, default=500, help="clients/products to draw from"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="load-results.json")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as ve:
+        parser.error(str(ve))
+    ids = load_ids(args.sample)
+
+    stop = threading.Event()
+    peak = [0]
+    sampler = threading.Thread(
+        target=sample_server_connections, args=(stop, peak), daemon=True
+    )
+    sampler.start()
+
+    start = time.perf_counter()
+    if args.processes:
+        # spawn: every process opens its own pool instead of sharing the parent's sockets.
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(args.workers) as processes:
+            outcomes = processes.starmap(
+                run_process,
+                [
+                    (n, args.threads_per_process, mix, ids, args.duration, args.seed)
+                    for n in range(args.workers)
+                ],
+            )
+        worker_results = [
+            result for outcome in outcomes for result in outcome["workers"]
+        ]
+        pools = [outcome["pool"] for outcome in outcomes]
+    else:
+        worker_results = run_threads(
+            0, args.workers, mix, ids, args.duration, args.seed
+        )
+        pools = [get_pool().stats()]
+    elapsed = time.perf_counter() - start
+    stop.set()
+    sampler.join()
+
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "workers": args.workers,
+            "mode": "processes" if args.processes else "threads",
+            "threads_per_process": args.threads_per_process if args.processes else None,
+            "duration": args.duration,
+            "mix": mix,
+        },
+        "elapsed": elapsed,
+        **summarize(worker_results, mix, elapsed),
+        "connections": {
+            "pool": merge_pool_stats(pools),
+            "server_threads_connected_peak": peak[0],
+        },
+    }
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    print(
+        f"{'operation':<20} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}"
+    )
+    for name, stats in report["operations"].items():
+        print(
+            f"{name:<20} {stats['throughput']:>10,.1f} {stats['p50_ms'] or 0:>9.2f} "
+            f"{stats['p95_ms'] or 0:>9.2f} {stats['p99_ms'] or 0:>9.2f} {stats['error_rate']:>8.2%}"
+        )
+    connections = report["connections"]
+    print(
+        f"\nTotal {report['throughput']:,.1f} ops/s, {report['error_rate']:.2%} errors; "
+        f"pool created {connections['pool'].get('created', 0)} connections, "
+        f"waited {connections['pool'].get('waits', 0)} times; "
+        f"peak server connections {connections['server_threads_connected_peak']}."
+    )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Compares the slotted models against the previous dict-backed classes.
+
+For each model it reports the memory held per instance and how many rows per
+second can be hydrated through the sanitizing ``from_dict`` path and the
+trusted ``from_row`` path used by the repositories.
+
+Usage (with ``app/`` on PYTHONPATH, as in the app container):
+    python benchmarks/model_hydration.py --rows 200000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+
+from models.order import Order
+from models.product import Product
+
+
+class LegacyProduct:
+    """
+    The Product class as it was before __slots__: per-instance __dict__ and
+    sanitization on every construction.
+    """
+
+    def __init__(self, id=None, name="", price=0.0, category_id=None):
+        self.id = id
+        self.name = name.strip()
+        self.price = round(float(price), 2)
+        self.category_id = category_id
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data.get("id"),
+            name=data.get("name", ""),
+            price=data.get("price", 0.0),
+            category_id=data.get("category_id"),
+        )
+
+
+class LegacyOrder:
+    """
+    The Order class as it was before __slots__, including the date.today()
+    default evaluated for every row.
+    """
+
+    def __init__(self, id=None, client_id=None, product_id=None, order_date=None):
+        self.id = id
+        self.client_id = client_id
+        self.product_id = product_id
+        self.order_date = order_date or date.today()
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data.get("id"),
+            client_id=data.get("client_id"),
+            product_id=data.get("product_id"),
+            order_date=data.get("order_date", date.today()),
+        )
+
+
+def product_rows(count):
+    return [
+        {
+            "id": i,
+            "name": f"Product {i}",
+            "price": Decimal("9.99"),
+            "category_id": i % 50 + 1,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def order_rows(count):
+    today = date.today()
+    return [
+        {
+            "id": i,
+            "client_id": i % 1000 + 1,
+            "product_id": i % 5000 + 1,
+            "order_date": today,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(label, hydrate, rows):
+    """
+    Hydrates every row once for timing and once under tracemalloc for memory.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    objects = [hydrate(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [hydrate(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+
+    # The list holding the objects costs one pointer per row; leave it out.
+    per_instance = (after - before) / len(rows) - 8
+    print(
+        f"{label:<28} {len(rows) / elapsed:>14,.0f} rows/s {per_instance:>10.1f} B/instance"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'model / path':<28} {'throughput':>21} {'memory':>21}")
+    rows = product_rows(args.rows)
+    measure("LegacyProduct.from_dict", LegacyProduct.from_dict, rows)
+    measure("Product.from_dict", Product.from_dict, rows)
+    measure("Product.from_row", Product.from_row, rows)
+
+    rows = order_rows(args.rows)
+    measure("LegacyOrder.from_dict", LegacyOrder.from_dict, rows)
+    measure("Order.from_dict", Order.from_dict, rows)
+    measure("Order.from_row", Order.from_row, rows)
+
+
+if __name__ == "__main__":
+    main()
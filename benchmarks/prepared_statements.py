@@ -0,0 +1,70 @@
+"""
+Compares point-query throughput with prepared statements on and off.
+
+Runs the same mix of lookups the application issues most often
+(``client.by_id``, ``product.by_id``, ``client.email_exists``) once through
+server-side prepared statements and once through the text protocol, and
+reports operations per second for each.
+
+Usage (with ``app/`` on PYTHONPATH, as in the app container):
+    python benchmarks/prepared_statements.py --ops 20000
+"""
+
+import argparse
+import random
+import time
+
+from db.connection import get_pool
+from db.statements import use_prepared_statements
+from repositories.client_repository import ClientRepository
+from repositories.product_repository import ProductRepository
+
+
+def run(label, ops, clients, product_ids):
+    """
+    Runs ``ops`` lookups and prints the achieved throughput.
+    """
+    rng = random.Random(42)
+    start = time.perf_counter()
+    for i in range(ops):
+        kind = i % 3
+        if kind == 0:
+            ClientRepository.get_by_id(rng.choice(clients).id)
+        elif kind == 1 and product_ids:
+            ProductRepository.get_by_id(rng.choice(product_ids))
+        else:
+            ClientRepository.email_exists(rng.choice(clients).email)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<22} {ops / elapsed:>12,.0f} ops/s  ({elapsed:.2f}s for {ops:,} ops)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument(
+        "--sample", type=int, default=500, help="rows sampled per table"
+    )
+    args = parser.parse_args()
+
+    clients = ClientRepository.list_page(0, args.sample)
+    if not clients:
+        print("ℹ️ No clients found; register some before running the benchmark.")
+        return
+    product_ids = [
+        product.id for product in ProductRepository.list_page(0, args.sample)
+    ]
+
+    # Warm the pool so connection setup is not part of either measurement.
+    get_pool().fill()
+
+    for label, enabled in (("text protocol", False), ("prepared statements", True)):
+        use_prepared_statements(enabled)
+        run(label, args.ops, clients, product_ids)
+
+    get_pool().close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+Times every repository and service method at several data sizes.
+
+For each size the tables are wiped and reloaded with that many clients,
+products and orders (one category per hundred products) using batched
+multi-row inserts, then each method is timed on random keys:
+
+    create, get_by_id, list_all, name_exists / email_exists, and the order
+    joins (get_view_by_id, list_view_page) for the repositories and services.
+
+Running the sizes side by side shows how each call's cost grows with the
+data. Results can be saved as a baseline and later runs compared against
+it; a method whose median latency grows by more than the threshold is
+reported as a regression and the script exits with status 1.
+
+The suite wipes the MarketFlow tables, so point it at a scratch database.
+It runs on the backend selected by DB_BACKEND: a MariaDB container, or the
+embedded SQLite backend (DB_BACKEND=sqlite, migrated with app/migrate.py).
+
+Usage (with ``app/`` on PYTHONPATH, as in the app container):
+    python benchmarks/repository_suite.py --yes --sizes 1k,100k --save-baseline
+    python benchmarks/repository_suite.py --yes --sizes 1k,100k --threshold 0.25
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+
+from cache.catalog_cache import CatalogCache
+from config.config import CACHE_CONFIG, STATEMENT_CONFIG
+from db.backends import backend
+from db.connection import borrow_connection
+from load_generator import percentile
+from repositories.category_repository import CategoryRepository
+from repositories.client_repository import ClientRepository
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from services.category_service import CategoryService
+from services.client_service import ClientService
+from services.order_service import OrderService
+from services.product_service import ProductService
+
+DEFAULT_SIZES = "1k,100k,1M"
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+LOAD_BATCH = 50_000
+PRODUCTS_PER_CATEGORY = 100
+ORDER_DAYS = 365
+
+# Child tables first, so the wipe never trips a foreign key.
+TABLES = (
+    "sales_by_category_day",
+    "sales_by_product_day",
+    "orders",
+    "products",
+    "categories",
+    "clients",
+)
+
+
+def parse_sizes(text: str) -> list[int]:
+    """
+    Parses sizes such as '1k,100k,1M' into row counts.
+    """
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        factor = multipliers.get(part[-1:], 1)
+        digits = part[:-1] if part[-1:] in multipliers else part
+        sizes.append(int(float(digits) * factor))
+    return sizes
+
+
+def size_label(size: int) -> str:
+    if size >= 1_000_000 and size % 1_000_000 == 0:
+        return f"{size // 1_000_000}M"
+    if size >= 1_000 and size % 1_000 == 0:
+        return f"{size // 1_000}k"
+    return str(size)
+
+
+def load_dataset(size: int) -> None:
+    """
+    Wipes the tables and loads ``size`` clients, products and orders.
+
+    Rows are generated lazily and inserted ``LOAD_BATCH`` at a time through the
+    repositories' bulk inserts, so memory stays flat even at a million rows.
+    IDs start from 1 again because the tables are reset.
+    """
+    with borrow_connection() as conn:
+        cursor = conn.cursor()
+        backend.reset_tables(cursor, TABLES)
+        conn.commit()
+        cursor.close()
+    # Cached catalog entries describe the previous dataset.
+    CatalogCache.invalidate_categories()
+    CatalogCache.invalidate_products()
+
+    categories = max(1, size // PRODUCTS_PER_CATEGORY)
+    _load(
+        CategoryRepository.create_many,
+        (f"Category {n}" for n in range(1, categories + 1)),
+    )
+    _load(
+        ClientRepository.create_many,
+        ((f"Client {n}", f"client{n}@example.com") for n in range(1, size + 1)),
+    )
+    _load(
+        ProductRepository.create_many,
+        (
+            (f"Product {n}", 1 + n % 500 + 0.99, n % categories + 1)
+            for n in range(1, size + 1)
+        ),
+    )
+    rng = random.Random(size)
+    today = date.today()
+    _load(
+        OrderRepository.create_many,
+        (
+            (
+                rng.randint(1, size),
+                rng.randint(1, size),
+                today - timedelta(days=rng.randrange(ORDER_DAYS)),
+            )
+            for _ in range(size)
+        ),
+    )
+
+
+def _load(create_many, rows) -> None:
+    while True:
+        batch = list(islice(rows, LOAD_BATCH))
+        if not batch:
+            return
+        create_many(batch)
+
+
+def build_cases(size: int) -> list[tuple[str, str, object]]:
+    """
+    Lists the timed calls as (name, kind, call) with ``call(rng, n)``.
+
+    ``kind`` is 'scan' for calls that read a whole table, which are repeated
+    fewer times than point calls and writes.
+    """
+    categories = max(1, size // PRODUCTS_PER_CATEGORY)
+
+    def some_id(rng):
+        return rng.randint(1, size)
+
+    def new_name(prefix, n):
+        # Unique across runs at the same size, since names and emails are unique keys.
+        return f"{prefix} {size}-{n}-{time.monotonic_ns()}"
+
+    def new_email(prefix, n):
+        return f"{prefix}-{size}-{n}-{time.monotonic_ns()}@example.com"
+
+    return [
+        # Repositories
+        (
+            "ClientRepository.create",
+            "point",
+            lambda rng, n: ClientRepository.create(
+                "Bench Client", new_email("repo", n)
+            ),
+        ),
+        (
+            "ClientRepository.get_by_id",
+            "point",
+            lambda rng, n: ClientRepository.get_by_id(some_id(rng)),
+        ),
+        (
+            "ClientRepository.email_exists",
+            "point",
+            lambda rng, n: ClientRepository.email_exists(
+                f"client{some_id(rng)}@example.com"
+            ),
+        ),
+        (
+            "ClientRepository.list_all",
+            "scan",
+            lambda rng, n: ClientRepository.list_all(),
+        ),
+        (
+            "CategoryRepository.create",
+            "point",
+            lambda rng, n: CategoryRepository.create(new_name("Bench", n)),
+        ),
+        (
+            "CategoryRepository.get_by_id",
+            "point",
+            lambda rng, n: CategoryRepository.get_by_id(rng.randint(1, categories)),
+        ),
+        (
+            "CategoryRepository.name_exists",
+            "point",
+            lambda rng, n: CategoryRepository.name_exists(
+                f"Category {rng.randint(1, categories)}"
+            ),
+        ),
+        (
+            "CategoryRepository.list_all",
+            "scan",
+            lambda rng, n: CategoryRepository.list_all(),
+        ),
+        (
+            "ProductRepository.create",
+            "point",
+            lambda rng, n: ProductRepository.create(
+                new_name("Bench", n), 9.99, rng.randint(1, categories)
+            ),
+        ),
+        (
+            "ProductRepository.get_by_id",
+            "point",
+            lambda rng, n: ProductRepository.get_by_id(some_id(rng)),
+        ),
+        (
+            "ProductRepository.name_exists",
+            "point",
+            lambda rng, n: ProductRepository.name_exists(f"Product {some_id(rng)}"),
+        ),
+        (
+            "ProductRepository.list_all",
+            "scan",
+            lambda rng, n: ProductRepository.list_all(),
+        ),
+        (
+            "OrderRepository.create",
+            "point",
+            lambda rng, n: OrderRepository.create(some_id(rng), some_id(rng)),
+        ),
+        (
+            "OrderRepository.get_by_id",
+            "point",
+            lambda rng, n: OrderRepository.get_by_id(some_id(rng)),
+        ),
+        (
+            "OrderRepository.get_view_by_id",
+            "point",
+            lambda rng, n: OrderRepository.get_view_by_id(some_id(rng)),
+        ),
+        (
+            "OrderRepository.list_view_page",
+            "point",
+            lambda rng, n: OrderRepository.list_view_page(some_id(rng), 20),
+        ),
+        ("OrderRepository.list_all", "scan", lambda rng, n: OrderRepository.list_all()),
+        # Services
+        (
+            "ClientService.create",
+            "point",
+            lambda rng, n: ClientService.create("Bench Client", new_email("svc", n)),
+        ),
+        (
+            "ClientService.get_by_id",
+            "point",
+            lambda rng, n: ClientService.get_by_id(some_id(rng)),
+        ),
+        ("ClientService.list_all", "scan", lambda rng, n: ClientService.list_all()),
+        (
+            "CategoryService.create",
+            "point",
+            lambda rng, n: CategoryService.create(new_name("Svc", n)),
+        ),
+        (
+            "CategoryService.get_by_id",
+            "point",
+            lambda rng, n: CategoryService.get_by_id(rng.randint(1, categories)),
+        ),
+        ("CategoryService.list_all", "scan", lambda rng, n: CategoryService.list_all()),
+        (
+            "ProductService.create",
+            "point",
+            lambda rng, n: ProductService.create(
+                new_name("Svc", n), 9.99, rng.randint(1, categories)
+            ),
+        ),
+        (
+            "ProductService.get_by_id",
+            "point",
+            lambda rng, n: ProductService.get_by_id(some_id(rng)),
+        ),
+        ("ProductService.list_all", "scan", lambda rng, n: ProductService.list_all()),
+        (
+            "OrderService.create",
+            "point",
+            lambda rng, n: OrderService.create(some_id(rng), some_id(rng)),
+        ),
+        (
+            "OrderService.get_by_id",
+            "point",
+            lambda rng, n: OrderService.get_by_id(some_id(rng)),
+        ),
+        (
+            "OrderService.get_view_by_id",
+            "point",
+            lambda rng, n: OrderService.get_view_by_id(some_id(rng)),
+        ),
+        (
+            "OrderService.list_view_page",
+            "point",
+            lambda rng, n: OrderService.list_view_page(some_id(rng)),
+        ),
+        ("OrderService.list_all", "scan", lambda rng, n: OrderService.list_all()),
+    ]
+
+
+def time_case(call, repeat: int, seed: int) -> dict:
+    """
+    Runs a call ``repeat`` times and summarizes its latency in milliseconds.
+    """
+    rng = random.Random(seed)
+    samples = []
+    errors = 0
+    for n in range(repeat):
+        start = time.perf_counter()
+        try:
+            call(rng, n)
+        except ValueError:
+            # A random key can hit a row deleted meanwhile; the call still counts.
+            errors += 1
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+        "calls": repeat,
+        "errors": errors,
+        "mean_ms": sum(samples) / repeat * 1000,
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Lists the methods whose median latency grew beyond the threshold.
+    """
+    regressions = []
+    for size, cases in results.items():
+        for name, stats in cases.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous or not previous["p50_ms"]:
+                continue
+            ratio = stats["p50_ms"] / previous["p50_ms"]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name} @ {size}: p50 {previous['p50_ms']:.3f} → "
+                    f"{stats['p50_ms']:.3f} ms (+{ratio - 1:.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help="row counts, e.g. 1k,100k,1M"
+    )
+    parser.add_argument("--ops", type=int, default=300, help="calls per point method")
+    parser.add_argument(
+        "--scan-ops", type=int, default=3, help="calls per list_all method"
+    )
+    parser.add_argument("--only", help="run only methods whose name contains this text")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store this run as the baseline"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed p50 growth, 0.2 = 20%%"
+    )
+    parser.add_argument("--output", help="also write this run's results as JSON")
+    parser.add_argument(
+        "--yes", action="store_true", help="confirm that the tables may be wiped"
+    )
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error(
+            "the suite wipes clients, products, orders and categories; pass --yes to confirm."
+        )
+
+    results = {}
+    for size in parse_sizes(args.sizes):
+        label = size_label(size)
+        print(f"⏳ Loading {label} rows...")
+        start = time.perf_counter()
+        load_dataset(size)
+        print(f"✅ Loaded {label} rows in {time.perf_counter() - start:.1f}s")
+
+        results[label] = {}
+        print(
+            f"{'method':<34} {'calls':>6} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}"
+        )
+        for index, (name, kind, call) in enumerate(build_cases(size)):
+            if args.only and args.only not in name:
+                continue
+            repeat = args.scan_ops if kind == "scan" else args.ops
+            stats = time_case(call, repeat, seed=size + index)
+            results[label][name] = stats
+            print(
+                f"{name:<34} {repeat:>6} {stats['mean_ms']:>10.3f} "
+                f"{stats['p50_ms']:>10.3f} {stats['p95_ms']:>10.3f}"
+            )
+
+    run = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "settings": {
+            "ops": args.ops,
+            "scan_ops": args.scan_ops,
+            "backend": backend.NAME,
+            "cache": CACHE_CONFIG["enabled"],
+            "prepared_statements": STATEMENT_CONFIG["prepared"],
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(run, output, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as output:
+            json.dump(run, output, indent=2)
+        print(f"✅ Baseline saved to {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, encoding="utf-8") as source:
+            baseline = json.load(source)["results"]
+    except FileNotFoundError:
+        print(f"⚠️ No baseline at {args.baseline}; run with --save-baseline first.")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.threshold:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Measures how long the CLI takes to show its menu, and what it imports.
+
+The menu time is measured end to end: ``main.py`` is started as a fresh
+process, fed "0" to exit, and timed until the main menu has been printed.
+The median over several runs is compared with a budget (100 ms by default)
+and the script exits with status 1 when it is exceeded.
+
+The import profile (``python -X importtime``) is reported for two phases:
+
+    menu         what ``import main`` loads before the menu is shown
+    controllers  what the first menu choice adds, for all four controllers
+
+Each phase lists its total import time and the modules with the most
+self time, so a new eager import of a heavy dependency stands out.
+
+Usage (with ``app/`` on PYTHONPATH, as in the app container):
+    python benchmarks/startup_profile.py --runs 20 --budget-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"
+)
+MENU_MARKER = b"MarketFlow - Main Menu"
+
+PHASES = {
+    "menu": "import main",
+    "controllers": "import main\nfor choice in main.CONTROLLERS:\n    main.load_controller(choice)",
+}
+
+
+def time_to_menu() -> float:
+    """
+    Starts the CLI once and returns the seconds until its main menu is printed.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=APP_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    output = b""
+    while MENU_MARKER not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError("main.py exited before showing the menu.")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(b"0\n")
+    return elapsed
+
+
+def import_profile(code: str) -> list[tuple[str, int, int]]:
+    """
+    Runs code under ``-X importtime`` and returns (module, self µs, cumulative µs).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def report_imports(phase: str, code: str, top: int, exclude: set) -> set:
+    entries = [entry for entry in import_profile(code) if entry[0] not in exclude]
+    total_ms = sum(self_us for _, self_us, _ in entries) / 1000
+    print(f"\n📦 {phase}: {len(entries)} modules, {total_ms:.1f} ms of imports")
+    print(f"{'module':<48} {'self ms':>9} {'cumulative ms':>14}")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: -e[1])[:top]:
+        print(f"{name:<48} {self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}")
+    return exclude | {name for name, _, _ in entries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="CLI starts to time")
+    parser.add_argument(
+        "--budget-ms", type=float, default=100.0, help="allowed median time to menu"
+    )
+    parser.add_argument("--top", type=int, default=15, help="modules listed per phase")
+    parser.add_argument(
+        "--skip-imports", action="store_true", help="only time the menu"
+    )
+    args = parser.parse_args()
+
+    samples = [time_to_menu() * 1000 for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print(
+        f"⏱️ Time to menu over {args.runs} runs: median {median:.1f} ms, "
+        f"min {min(samples):.1f} ms, max {max(samples):.1f} ms"
+    )
+
+    if not args.skip_imports:
+        seen = set()
+        for phase, code in PHASES.items():
+            seen = report_imports(phase, code, args.top, seen)
+
+    if median > args.budget_ms:
+        print(f"\n❌ Median time to menu exceeds the {args.budget_ms:.0f} ms budget.")
+        sys.exit(1)
+    print(f"\n✅ Median time to menu is within the {args.budget_ms:.0f} ms budget.")
+
+
+if __name__ == "__main__":
+    main()
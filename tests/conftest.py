@@ -0,0 +1,10 @@
+import pytest
+from db.migrate import migrate
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_schema():
+    """
+    Brings the test database schema up to date before any test runs.
+    """
+    migrate()
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from cache.catalog_cache import CatalogCache
+from db.async_connection import close_async_pool, get_async_pool
+from db.backends import backend
+from db.connection import get_db_connection, close_connection
+from services.async_category_service import AsyncCategoryService
+from services.async_client_service import AsyncClientService
+from services.async_order_service import AsyncOrderService
+from services.async_product_service import AsyncProductService
+
+pytestmark = pytest.mark.skipif(
+    backend.NAME != "mariadb", reason="The asyncio layer runs on MariaDB only."
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    """
+    Clears the sales rollups, orders, catalog and clients before each test.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    for table in (
+        "sales_by_product_day",
+        "sales_by_category_day",
+        "orders",
+        "products",
+        "categories",
+        "clients",
+    ):
+        cursor.execute(f"DELETE FROM {table}")
+    conn.commit()
+    cursor.close()
+    close_connection(conn)
+    CatalogCache.invalidate_categories()
+
+
+def run(coroutine_function):
+    """
+    Runs a coroutine function on a fresh event loop and closes that loop's pool.
+    """
+
+    async def main():
+        try:
+            return await coroutine_function()
+        finally:
+            await close_async_pool()
+
+    return asyncio.run(main())
+
+
+def test_async_order_flow():
+    """
+    Tests creating and reading back a client, category, product and order.
+    """
+
+    async def scenario():
+        client = await AsyncClientService.create("Async", "async@example.com")
+        category = await AsyncCategoryService.create("Async Category")
+        product = await AsyncProductService.create("Async Product", 7.5, category.id)
+        order = await AsyncOrderService.create(client.id, product.id)
+        return await AsyncOrderService.get_view_by_id(order.id)
+
+    view = run(scenario)
+    assert view.client_email == "async@example.com"
+    assert view.product_price == 7.5
+
+
+def test_async_services_raise_the_sync_errors():
+    """
+    Tests the async services report the same validation errors as the sync ones.
+    """
+
+    async def scenario():
+        await AsyncClientService.create("Taken", "taken@example.com")
+        with pytest.raises(ValueError, match="Email is already registered."):
+            await AsyncClientService.create("Again", "taken@example.com")
+        with pytest.raises(ValueError, match="Category not found."):
+            await AsyncProductService.create("Orphan", 1.0, 999)
+        with pytest.raises(ValueError, match="Client not found."):
+            await AsyncOrderService.create(999, 999)
+
+    run(scenario)
+
+
+def test_concurrent_lookups_share_the_pool():
+    """
+    Tests hundreds of concurrent lookups complete on one loop within the pool bound.
+    """
+
+    async def scenario():
+        client = await AsyncClientService.create("Busy", "busy@example.com")
+        results = await asyncio.gather(
+            *(AsyncClientService.get_by_id(client.id) for _ in range(300))
+        )
+        return results, get_async_pool().stats()
+
+    results, stats = run(scenario)
+    assert {c.email for c in results} == {"busy@example.com"}
+    assert stats["size"] <= stats["max_size"]
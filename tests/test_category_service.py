@@ -1,8 +1,9 @@
 import pytest
+from cache.catalog_cache import CatalogCache
 from services.category_service import CategoryService
 from repositories.category_repository import CategoryRepository
 from models.category import Category
-from db.connection import get_db_connection, close_connection
+from db.connection import get_db_connection, close_connection, transaction
 
 
 @pytest.fixture(autouse=True)
@@ -17,6 +18,7 @@ def clear_categories_table():
     conn.commit()
     cursor.close()
     close_connection(conn)
+    CatalogCache.invalidate_categories()
 
 
 def test_create_category_success():
@@ -110,3 +112,14 @@ def test_delete_category_not_found():
     """
     with pytest.raises(ValueError, match="Category not found."):
         CategoryService.delete(999)
+
+
+def test_transaction_rolls_back_on_error():
+    """
+    Tests that writes made inside a unit of work are discarded when the block raises.
+    """
+    with pytest.raises(RuntimeError):
+        with transaction():
+            CategoryService.create("Rolled Back")
+            raise RuntimeError("abort")
+    assert CategoryService.list_all() == []
@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+from cli import run
+from db.connection import get_db_connection, close_connection
+
+
+@pytest.fixture(autouse=True)
+def clear_clients_table():
+    """
+    Clears the clients table before each test to ensure test isolation.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM clients")
+    conn.commit()
+    cursor.close()
+    close_connection(conn)
+
+
+def cli(*argv):
+    """
+    Runs the command line and returns (exit status, stdout lines, stderr lines).
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = run(list(argv), stdout, stderr)
+    return status, stdout.getvalue().splitlines(), stderr.getvalue().splitlines()
+
+
+def test_create_and_list_as_json_lines():
+    """
+    Tests a created client is printed and then streamed back by list.
+    """
+    status, out, err = cli("clients", "create", "--name", "Ana", "--email", "ana@x.com")
+    assert status == 0 and err == []
+    created = json.loads(out[0])
+    assert created["email"] == "ana@x.com"
+
+    status, out, _ = cli("clients", "list")
+    assert status == 0
+    assert [json.loads(line) for line in out] == [created]
+
+
+def test_batch_file_rejects_only_bad_lines(tmp_path):
+    """
+    Tests a file is created in bulk and invalid lines are reported on stderr.
+    """
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "name,email\nAna,ana@x.com\nBruno,not-an-email\nCarla,carla@x.com\nDan,\n"
+    )
+
+    status, out, err = cli("clients", "create", "--file", str(path))
+
+    assert status == 1
+    assert [json.loads(line)["line"] for line in out] == [2, 4]
+    assert sorted(json.loads(line)["line"] for line in err) == [3, 5]
+
+
+def test_missing_record_fails_with_json_error():
+    """
+    Tests a lookup of an unknown ID exits with 1 and a JSON error.
+    """
+    status, out, err = cli("clients", "get", "999999", "--format", "json")
+    assert status == 1
+    assert json.loads("\n".join(out)) == []
+    assert json.loads(err[0]) == {"error": "Client not found."}
+
+
+def test_table_format_has_fixed_width_columns():
+    """
+    Tests table output aligns every row under its header.
+    """
+    cli("clients", "create", "--name", "Ana", "--email", "ana@x.com")
+    status, out, _ = cli("clients", "list", "--format", "table")
+    assert status == 0
+    header, row = out
+    assert header.index("name") == row.index("Ana")
+    assert header.index("email") == row.index("ana@x.com")
@@ -1,7 +1,9 @@
 import pytest
 from db.connection import get_db_connection, close_connection
+from db.statements import use_prepared_statements
 from services.client_service import ClientService
 from models.client import Client
+from repositories.client_repository import ClientRepository
 
 
 @pytest.fixture(autouse=True)
@@ -82,3 +84,100 @@ def test_update_client_success():
     updated = ClientService.update(created.id, "new@example.com")
     assert updated.name == "Old Name"
     assert updated.email == "new@example.com"
+
+
+def test_update_client_to_taken_email():
+    """
+    Tests the unique email constraint is reported as a validation error on update.
+    """
+    ClientService.create("First", "first@example.com")
+    second = ClientService.create("Second", "second@example.com")
+    with pytest.raises(ValueError, match="Email is already registered."):
+        ClientService.update(second.id, "first@example.com")
+
+
+def test_update_client_not_found():
+    """
+    Tests updating a non-existent client.
+    Expects a 'Client not found' error.
+    """
+    with pytest.raises(ValueError, match="Client not found."):
+        ClientService.update(999, "ghost@example.com")
+
+
+def test_update_client_with_unchanged_email():
+    """
+    Tests re-saving a client's current email is accepted.
+    """
+    created = ClientService.create("Same", "same@example.com")
+    assert (
+        ClientService.update(created.id, "same@example.com").email == "same@example.com"
+    )
+
+
+def test_create_many_clients_duplicate_email():
+    """
+    Tests bulk client creation rejects emails that are already registered.
+    """
+    ClientService.create("Existing", "taken@example.com")
+    with pytest.raises(
+        ValueError, match="Email is already registered: taken@example.com."
+    ):
+        ClientService.create_many(
+            [("New", "new@example.com"), ("Dup", "taken@example.com")]
+        )
+
+
+def test_create_many_clients_lost_race_rolls_back(monkeypatch):
+    """
+    Tests an email registered after the check is rejected by the unique key,
+    as a ValueError, and no client of the batch is kept.
+    """
+    ClientService.create("Existing", "taken@example.com")
+    monkeypatch.setattr(ClientRepository, "existing_emails", lambda emails: set())
+    with pytest.raises(ValueError, match="Email is already registered."):
+        ClientService.create_many(
+            [("New", "new@example.com"), ("Dup", "taken@example.com")]
+        )
+    assert [c.email for c in ClientService.list_all()] == ["taken@example.com"]
+
+
+def test_list_page_keyset_pagination():
+    """
+    Tests paging forward and backward through clients by ID.
+    """
+    ids = [
+        ClientService.create(f"User {n}", f"user{n}@example.com").id for n in range(5)
+    ]
+    first = ClientService.list_page(0, 2)
+    second = ClientService.list_page(first[-1].id, 2)
+    assert [c.id for c in first] == ids[:2]
+    assert [c.id for c in second] == ids[2:4]
+    assert [c.id for c in ClientService.list_page_before(second[0].id, 2)] == ids[:2]
+
+
+@pytest.mark.parametrize("limit", [0, 10_000])
+def test_list_page_invalid_size(limit):
+    """
+    Tests that an out-of-range page size, including 0, is rejected.
+    """
+    with pytest.raises(ValueError, match="Page size must be between"):
+        ClientService.list_page(0, limit)
+
+
+@pytest.mark.parametrize("prepared", [True, False])
+def test_point_queries_with_and_without_prepared_statements(prepared):
+    """
+    Tests lookups, updates and existence checks give the same results
+    through prepared statements and the text protocol.
+    """
+    use_prepared_statements(prepared)
+    try:
+        created = ClientService.create("Carol", "carol@example.com")
+        assert ClientService.get_by_id(created.id).email == "carol@example.com"
+        updated = ClientService.update(created.id, "carol@new.example.com")
+        assert updated.email == "carol@new.example.com"
+        with pytest.raises(ValueError, match="Client not found."):
+            ClientService.get_by_id(created.id + 1000)
+    finally:
+        use_prepared_statements(True)
@@ -0,0 +1,81 @@
+import urllib.request
+
+import pytest
+from metrics.exporter import dump, serve
+from metrics.instrument import install
+from metrics.registry import REGISTRY, Registry
+from services.client_service import ClientService
+
+
+@pytest.fixture(scope="module", autouse=True)
+def instrumented():
+    """
+    Instruments the repository and service classes once for this module.
+    """
+    return install()
+
+
+def test_every_layer_is_instrumented(instrumented):
+    """
+    Tests repository and service methods are wrapped, and only once.
+    """
+    assert "ClientRepository.get_by_id" in instrumented
+    assert "OrderService.create" in instrumented
+    assert install() == instrumented
+    assert ClientService.create.__wrapped__.__name__ == "create"
+
+
+def test_calls_and_errors_are_exported():
+    """
+    Tests method calls, errors and pool gauges appear in the exposition.
+    """
+    ClientService.create("Metric User", "metric@example.com")
+    with pytest.raises(ValueError):
+        ClientService.create("", "metric@example.com")
+
+    text = REGISTRY.render()
+    assert (
+        'marketflow_method_calls_total{layer="repository",class="ClientRepository",method="create"}'
+        in text
+    )
+    assert (
+        'marketflow_method_errors_total{layer="service",class="ClientService",method="create",error="ValueError"}'
+        in text
+    )
+    assert "# TYPE marketflow_method_duration_seconds histogram" in text
+    assert "marketflow_db_pool_connections" in text
+
+
+def test_histogram_rendering():
+    """
+    Tests histogram buckets are cumulative and end with +Inf, sum and count.
+    """
+    registry = Registry()
+    latency = registry.histogram("demo_seconds", "Demo.", ("op",), buckets=(0.1, 1))
+    latency.observe(0.05, "a")
+    latency.observe(0.5, "a")
+    latency.observe(5, "a")
+
+    lines = registry.render().splitlines()
+    assert 'demo_seconds_bucket{op="a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{op="a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{op="a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{op="a"} 3' in lines
+
+
+def test_http_endpoint_and_file_dump(tmp_path):
+    """
+    Tests the registry is served over HTTP and dumped to a file.
+    """
+    server = serve("127.0.0.1", 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+    assert "marketflow_method_calls_total" in body
+
+    path = tmp_path / "marketflow.prom"
+    dump(str(path))
+    assert "marketflow_method_calls_total" in path.read_text()
@@ -0,0 +1,17 @@
+from db.migrate import applied_versions, discover, migrate, verify_query_plans
+
+
+def test_migrations_are_recorded_and_idempotent():
+    """
+    Tests every migration is recorded and a second run applies nothing.
+    """
+    migrate()
+    assert migrate() == []
+    assert {m.version for m in discover()} <= applied_versions()
+
+
+def test_queries_do_not_scan_whole_tables():
+    """
+    Tests no query outside the allowlist plans a full table scan.
+    """
+    assert verify_query_plans() == []
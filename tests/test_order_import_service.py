@@ -0,0 +1,138 @@
+import json
+
+import pytest
+from cache.catalog_cache import CatalogCache
+from db.connection import get_db_connection, close_connection
+from repositories.product_repository import ProductRepository
+from services.category_service import CategoryService
+from services.client_service import ClientService
+from services.order_import_service import OrderImportService
+from services.order_service import OrderService
+from services.product_service import ProductService
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    """
+    Clears the sales rollups, orders, catalog and clients before each test.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    for table in (
+        "sales_by_product_day",
+        "sales_by_category_day",
+        "orders",
+        "products",
+        "categories",
+        "clients",
+    ):
+        cursor.execute(f"DELETE FROM {table}")
+    conn.commit()
+    cursor.close()
+    close_connection(conn)
+    CatalogCache.invalidate_categories()
+
+
+@pytest.fixture
+def client_and_product():
+    """
+    Creates a client and a product to reference from import files.
+    """
+    client = ClientService.create("Importer", "importer@example.com")
+    category = CategoryService.create("Imported")
+    product = ProductService.create("Imported Product", 2.5, category.id)
+    return client, product
+
+
+def test_import_csv_rejects_invalid_rows(tmp_path, client_and_product):
+    """
+    Tests a CSV import inserts valid rows and writes the rest to the rejects file.
+    """
+    client, product = client_and_product
+    source = tmp_path / "orders.csv"
+    source.write_text(
+        "client_id,product_id,order_date\n"
+        f"{client.id},{product.id},2024-01-15\n"
+        f"{client.id},{product.id},\n"
+        f"999,{product.id},2024-01-15\n"
+        f"{client.id},abc,2024-01-15\n"
+        f"{client.id},{product.id},not-a-date\n"
+    )
+
+    result = OrderImportService.import_file(str(source), chunk_size=2)
+
+    assert (result.rows, result.imported, result.rejected) == (5, 2, 3)
+    assert len(OrderService.list_all()) == 2
+    rejects = [
+        json.loads(line)
+        for line in (tmp_path / "orders.csv.rejects.jsonl").read_text().splitlines()
+    ]
+    assert sorted((r["line"], r["error"]) for r in rejects) == [
+        (4, "Client not found."),
+        (5, "Product ID must be a positive integer."),
+        (6, "Order date must be a valid date."),
+    ]
+
+
+def test_import_rejects_rows_whose_product_is_deleted_mid_chunk(
+    tmp_path, monkeypatch, client_and_product
+):
+    """
+    Tests a product deleted after the chunk lookups only rejects its own rows.
+    """
+    client, product = client_and_product
+    doomed = ProductService.create("Doomed Product", 1.0, product.category_id)
+    source = tmp_path / "orders.csv"
+    source.write_text(
+        "client_id,product_id,order_date\n"
+        f"{client.id},{product.id},2024-01-15\n"
+        f"{client.id},{doomed.id},2024-01-15\n"
+        f"{client.id},{product.id},2024-01-16\n"
+        f"{client.id},{product.id},2024-01-17\n"
+    )
+    lookup = ProductRepository.existing_ids
+
+    def lookup_then_delete(ids):
+        found = lookup(ids)
+        if doomed.id in ids:
+            ProductService.delete(doomed.id)
+        return found
+
+    monkeypatch.setattr(ProductRepository, "existing_ids", lookup_then_delete)
+    result = OrderImportService.import_file(str(source), chunk_size=2)
+
+    assert (result.rows, result.imported, result.rejected) == (4, 3, 1)
+    assert len(OrderService.list_all()) == 3
+    (reject,) = [
+        json.loads(line)
+        for line in (tmp_path / "orders.csv.rejects.jsonl").read_text().splitlines()
+    ]
+    assert (reject["line"], reject["error"]) == (3, "Client or product not found.")
+
+
+def test_import_jsonl_without_rejects(tmp_path, client_and_product):
+    """
+    Tests a clean JSONL import reports throughput and leaves no rejects file.
+    """
+    client, product = client_and_product
+    source = tmp_path / "orders.jsonl"
+    source.write_text(
+        "\n".join(
+            json.dumps({"client_id": client.id, "product_id": product.id})
+            for _ in range(3)
+        )
+    )
+
+    result = OrderImportService.import_file(str(source))
+
+    assert result.imported == 3
+    assert result.rows_per_second > 0
+    assert not (tmp_path / "orders.jsonl.rejects.jsonl").exists()
+
+
+def test_import_unsupported_format(tmp_path):
+    """
+    Tests that files other than CSV and JSONL are refused.
+    """
+    with pytest.raises(ValueError, match="Unsupported import format"):
+        OrderImportService.import_file(str(tmp_path / "orders.xml"))
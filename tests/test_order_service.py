@@ -1,4 +1,5 @@
 import pytest
+from cache.catalog_cache import CatalogCache
 from services.order_service import OrderService
 from services.client_service import ClientService
 from services.product_service import ProductService
@@ -10,11 +11,13 @@ from db.connection import get_db_connection, close_connection
 @pytest.fixture(autouse=True)
 def clear_orders_table():
     """
-    Clears the orders, products, categories, and clients tables before each test.
+    Clears the sales rollups and the orders, products, categories, and clients tables before each test.
     Ensures test isolation and avoids data dependency between tests.
     """
     conn = get_db_connection()
     cursor = conn.cursor()
+    cursor.execute("DELETE FROM sales_by_product_day")
+    cursor.execute("DELETE FROM sales_by_category_day")
     cursor.execute("DELETE FROM orders")
     cursor.execute("DELETE FROM products")
     cursor.execute("DELETE FROM categories")
@@ -22,6 +25,7 @@ def clear_orders_table():
     conn.commit()
     cursor.close()
     close_connection(conn)
+    CatalogCache.invalidate_categories()
 
 
 def create_valid_client_and_product():
@@ -66,6 +70,16 @@ def test_create_order_invalid_product():
         OrderService.create(client.id, 999)
 
 
+def test_create_order_reports_missing_client_first():
+    """
+    Tests that the client is reported when neither reference exists,
+    and that no order is inserted.
+    """
+    with pytest.raises(ValueError, match="Client not found."):
+        OrderService.create(999, 999)
+    assert OrderService.list_all() == []
+
+
 def test_get_order_by_id_success():
     """
     Tests retrieving a specific order by ID when it exists.
@@ -94,3 +108,55 @@ def test_list_all_orders():
     OrderService.create(client.id, product.id)
     orders = OrderService.list_all()
     assert len(orders) == 2
+
+
+def test_create_many_orders():
+    """
+    Tests bulk order creation with set-based client and product validation.
+    """
+    client, product = create_valid_client_and_product()
+    ids = OrderService.create_many([(client.id, product.id), (client.id, product.id)])
+    assert len(ids) == 2
+    assert [order.id for order in OrderService.list_all()] == ids
+
+
+def test_create_many_orders_invalid_product():
+    """
+    Tests bulk order creation failure when a referenced product does not exist.
+    """
+    client, _ = create_valid_client_and_product()
+    with pytest.raises(ValueError, match="Product not found: 999."):
+        OrderService.create_many([(client.id, 999)])
+
+
+def test_iter_all_orders_streams_in_id_order():
+    """
+    Tests streaming orders with a small fetch size yields every order in ID order.
+    """
+    client, product = create_valid_client_and_product()
+    ids = [OrderService.create(client.id, product.id).id for _ in range(3)]
+    assert [order.id for order in OrderService.iter_all(fetch_size=2)] == ids
+
+
+def test_get_order_view_keeps_joined_fields():
+    """
+    Tests that the order view carries the client and product details from the join.
+    """
+    client, product = create_valid_client_and_product()
+    created = OrderService.create(client.id, product.id)
+    view = OrderService.get_view_by_id(created.id)
+    assert view.client_name == "Order Test"
+    assert view.client_email == "order@example.com"
+    assert view.product_name == "TestProduct"
+    assert view.product_price == 10.0
+
+
+def test_list_view_page():
+    """
+    Tests paging through joined orders.
+    """
+    client, product = create_valid_client_and_product()
+    ids = [OrderService.create(client.id, product.id).id for _ in range(3)]
+    page = OrderService.list_view_page(0, 2)
+    assert [view.id for view in page] == ids[:2]
+    assert all(view.product_name == "TestProduct" for view in page)
@@ -0,0 +1,151 @@
+import io
+import threading
+from types import SimpleNamespace
+
+import pytest
+from utils.pagination import Column, browse_pages, fit, show_page
+
+RECORDS = [SimpleNamespace(id=i, name=f"Item {i}") for i in range(1, 11)]
+COLUMNS = [
+    Column("ID", 4, lambda item: item.id),
+    Column("Name", 8, lambda item: item.name),
+]
+
+
+class FakeSource:
+    """
+    Keyset pages over RECORDS, recording each call and the thread it ran on.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def list_page(self, after_id, limit):
+        self.calls.append(("after", after_id, threading.current_thread()))
+        return [item for item in RECORDS if item.id > after_id][:limit]
+
+    def list_page_before(self, before_id, limit):
+        self.calls.append(("before", before_id, threading.current_thread()))
+        return [item for item in RECORDS if item.id < before_id][-limit:]
+
+
+def browse(monkeypatch, choices, page_size=3):
+    """
+    Browses RECORDS with the given prompt answers; returns (output lines, source).
+    """
+    answers = iter(choices)
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+    source = FakeSource()
+    out = io.StringIO()
+    browse_pages(
+        source.list_page,
+        source.list_page_before,
+        COLUMNS,
+        "Items:",
+        "No items.",
+        page_size=page_size,
+        out=out,
+    )
+    return out.getvalue().splitlines(), source
+
+
+def shown_ids(lines):
+    return [int(line.split()[0]) for line in lines if line[:1].isdigit()]
+
+
+def test_fit_pads_and_truncates():
+    """
+    Tests values are padded or cut to exactly the column width.
+    """
+    assert fit(7, 4) == "7   "
+    assert fit(None, 3) == "   "
+    assert fit("Oversized", 5) == "Over…"
+
+
+def test_pages_are_fixed_width_tables(monkeypatch):
+    """
+    Tests each page is a header, a rule and one aligned row per record.
+    """
+    lines, _ = browse(monkeypatch, ["q"])
+    header = lines[2]
+    assert header == "ID   Name"
+    assert lines[3] == "-" * 13
+    assert lines[4:7] == ["1    Item 1", "2    Item 2", "3    Item 3"]
+
+
+def test_next_page_is_prefetched_in_background(monkeypatch):
+    """
+    Tests the page after the one shown is fetched off the main thread.
+    """
+    lines, source = browse(monkeypatch, ["", "q"])
+    assert shown_ids(lines) == [1, 2, 3, 4, 5, 6]
+    main = threading.current_thread()
+    assert source.calls[0] == ("after", 0, main)
+    # The prefetch after page 2 may be cancelled when the browser is closed.
+    _, after_id, thread = source.calls[1]
+    assert after_id == 3 and thread is not main
+
+
+def test_back_and_forward_reuse_seen_pages(monkeypatch):
+    """
+    Tests going back and forward again does not query the pages again.
+    """
+    lines, source = browse(monkeypatch, ["", "p", "", "q"])
+    assert shown_ids(lines) == [1, 2, 3, 4, 5, 6, 1, 2, 3, 4, 5, 6]
+    assert not [call for call in source.calls if call[0] == "before"]
+    assert [call[1] for call in source.calls][:2] == [0, 3]
+    assert [call[1] for call in source.calls].count(3) == 1
+
+
+def test_jump_to_id_and_page_back_from_there(monkeypatch):
+    """
+    Tests 'g ID' shows the page starting at that ID and 'p' pages back from it.
+    """
+    lines, source = browse(monkeypatch, ["g 8", "p", "q"])
+    assert shown_ids(lines) == [1, 2, 3, 8, 9, 10, 5, 6, 7]
+    assert ("before", 8) in [call[:2] for call in source.calls]
+
+
+@pytest.mark.parametrize(
+    "choices, message",
+    [
+        (["p", "q"], "Already at the first page."),
+        (["", "", "", "", "q"], "Already at the last page."),
+        (["g 99", "q"], "No records from ID 99 on."),
+        (["g x", "q"], "Enter 'g' followed by a numeric ID."),
+    ],
+)
+def test_navigation_limits(monkeypatch, choices, message):
+    """
+    Tests moving past either end or to a missing ID keeps the page and says why.
+    """
+    lines, _ = browse(monkeypatch, choices)
+    assert any(message in line for line in lines)
+
+
+def test_single_page_does_not_prompt(monkeypatch):
+    """
+    Tests a listing that fits in one page is shown without a prompt.
+    """
+    lines, source = browse(monkeypatch, [], page_size=20)
+    assert shown_ids(lines) == list(range(1, 11))
+    assert len(source.calls) == 1
+
+
+def test_show_page_renders_one_page_without_prompting(monkeypatch):
+    """
+    Tests the picker view shows only the first page and never reads input.
+    """
+
+    def no_input(prompt):
+        raise AssertionError("show_page must not prompt")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    source = FakeSource()
+    out = io.StringIO()
+    page = show_page(source.list_page, COLUMNS, "Items:", "No items.", 3, out=out)
+    lines = out.getvalue().splitlines()
+    assert [item.id for item in page] == [1, 2, 3]
+    assert shown_ids(lines) == [1, 2, 3]
+    assert "Showing the first 3" in lines[-1]
+    assert len(source.calls) == 1
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+
+import pytest
+from db.async_connection import (
+    AsyncConnectionPool,
+    async_transaction,
+    open_async_connection,
+)
+from db.backends import backend
+from db.connection import ConnectionPool
+from db.pooling import PoolTimeoutError
+
+
+class FakeConnection:
+    """
+    Just enough of a connection for the pools: health, rollback and close.
+    """
+
+    def __init__(self):
+        self.alive = True
+        self.in_transaction = False
+        self.closed = False
+
+    def is_connected(self):
+        return self.alive and not self.closed
+
+    def rollback(self):
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncFakeConnection(FakeConnection):
+    async def is_connected(self):
+        return FakeConnection.is_connected(self)
+
+    async def rollback(self):
+        FakeConnection.rollback(self)
+
+    async def commit(self):
+        self.in_transaction = False
+
+    async def close(self):
+        FakeConnection.close(self)
+
+
+def sync_pool(**options):
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    return ConnectionPool(connect=connect, **options), opened
+
+
+def async_pool(**options):
+    opened = []
+
+    async def connect():
+        opened.append(AsyncFakeConnection())
+        return opened[-1]
+
+    return AsyncConnectionPool(connect=connect, **options), opened
+
+
+def test_pools_reuse_released_connections():
+    """
+    Tests both pools hand a released connection out again instead of opening one.
+    """
+    pool, opened = sync_pool(min_size=0, max_size=2)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+    async def scenario():
+        pool, opened = async_pool(min_size=0, max_size=2)
+        first = await pool.acquire()
+        await pool.release(first)
+        return first, await pool.acquire(), opened, pool.stats()
+
+    first, second, async_opened, stats = asyncio.run(scenario())
+    assert second is first
+    assert len(opened) == len(async_opened) == 1
+    assert stats["acquired"] == 2 and stats["created"] == 1
+
+
+def test_dead_and_dirty_connections_are_dropped():
+    """
+    Tests a dead idle connection is replaced and an open transaction is rolled back on release.
+    """
+    pool, opened = sync_pool(min_size=0, max_size=1)
+    connection = pool.acquire()
+    connection.in_transaction = True
+    pool.release(connection)
+    assert not connection.in_transaction
+    connection.alive = False
+    replacement = pool.acquire()
+    assert replacement is not connection and connection.closed
+    assert pool.stats()["discarded"] == 1
+
+
+def test_exhausted_pools_wait_then_time_out():
+    """
+    Tests a waiting caller gets the next released connection, or PoolTimeoutError.
+    """
+    pool, _ = sync_pool(min_size=0, max_size=1)
+    held = pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire(timeout=0.01)
+    threading.Timer(0.05, pool.release, (held,)).start()
+    assert pool.acquire(timeout=5) is held
+
+    async def scenario():
+        pool, _ = async_pool(min_size=0, max_size=1)
+        held = await pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire(timeout=0.01)
+        asyncio.get_running_loop().call_later(
+            0.05, asyncio.ensure_future, pool.release(held)
+        )
+        return held, await pool.acquire(timeout=5), pool.stats()
+
+    held, again, stats = asyncio.run(scenario())
+    assert again is held
+    assert stats["timeouts"] == 1 and stats["waits"] == 2
+
+
+def test_failed_connect_frees_the_slot():
+    """
+    Tests a connection that fails to open does not count against max_size.
+    """
+    attempts = []
+
+    def connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("down")
+        return FakeConnection()
+
+    pool = ConnectionPool(min_size=0, max_size=1, connect=connect)
+    with pytest.raises(ConnectionError):
+        pool.acquire()
+    assert pool.acquire(timeout=0) is not None
+    assert pool.stats()["size"] == 1
+
+
+def test_async_transaction_runs_after_commit_callbacks(monkeypatch):
+    """
+    Tests the asyncio unit of work runs its callbacks only once it has committed.
+    """
+    from db import async_connection
+
+    pool, _ = async_pool(min_size=0, max_size=1)
+    monkeypatch.setattr(async_connection, "get_async_pool", lambda: pool)
+    ran = []
+
+    async def scenario(fail):
+        async with async_transaction():
+            async_connection.async_after_commit(lambda: ran.append(fail))
+            if fail:
+                raise ValueError("rolled back")
+
+    asyncio.run(scenario(False))
+    with pytest.raises(ValueError):
+        asyncio.run(scenario(True))
+    assert ran == [False]
+
+
+@pytest.mark.skipif(backend.NAME == "mariadb", reason="MariaDB has an asyncio driver.")
+def test_async_connections_need_mariadb():
+    """
+    Tests the asyncio layer refuses to connect on a backend without an asyncio driver.
+    """
+    with pytest.raises(RuntimeError, match="DB_BACKEND=mariadb"):
+        asyncio.run(open_async_connection(retries=1, delay=0))
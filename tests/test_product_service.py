@@ -1,7 +1,9 @@
 import pytest
+from cache.catalog_cache import CatalogCache
 from services.product_service import ProductService
 from services.category_service import CategoryService
 from repositories.product_repository import ProductRepository
+from repositories.category_repository import CategoryRepository
 from models.product import Product
 from db.connection import get_db_connection, close_connection
 
@@ -19,6 +21,7 @@ def clear_products_table():
     conn.commit()
     cursor.close()
     close_connection(conn)
+    CatalogCache.invalidate_categories()
 
 
 def test_create_product_success():
@@ -126,3 +129,64 @@ def test_delete_product_not_found():
     """
     with pytest.raises(ValueError, match="Product not found."):
         ProductService.delete(999)
+
+
+def test_create_many_products_returns_ids_in_order():
+    """
+    Tests bulk product creation returns the generated IDs in input order.
+    """
+    category = CategoryService.create("Bulk")
+    ids = ProductService.create_many(
+        [
+            ("Rice", 4.5, category.id),
+            ("Beans", 6.0, category.id),
+            ("Pasta", 3.25, category.id),
+        ]
+    )
+    assert len(ids) == 3
+    assert [ProductService.get_by_id(i).name for i in ids] == ["Rice", "Beans", "Pasta"]
+
+
+def test_create_many_products_missing_category():
+    """
+    Tests bulk product creation fails before inserting anything when a category is missing.
+    """
+    category = CategoryService.create("Grains")
+    with pytest.raises(ValueError, match="Category not found: 999."):
+        ProductService.create_many([("Oats", 2.0, category.id), ("Corn", 1.0, 999)])
+    assert ProductService.list_all() == []
+
+
+def test_create_many_products_lost_race_rolls_back(monkeypatch):
+    """
+    Tests a category deleted after the check is rejected by the foreign key,
+    as a ValueError, and no product of the batch is kept.
+    """
+    category = CategoryService.create("Grains")
+    monkeypatch.setattr(CategoryRepository, "existing_ids", lambda ids: set(ids))
+    with pytest.raises(ValueError, match="Category not found."):
+        ProductService.create_many([("Oats", 2.0, category.id), ("Corn", 1.0, 999)])
+    assert ProductService.list_all() == []
+
+
+def test_get_product_by_id_reflects_update():
+    """
+    Tests that a cached product is invalidated when its price changes.
+    """
+    category = CategoryService.create("Produce")
+    product = ProductService.create("Apple", 1.0, category.id)
+    assert ProductService.get_by_id(product.id).price == 1.0
+    ProductService.update(product.id, 1.5)
+    assert ProductService.get_by_id(product.id).price == 1.5
+
+
+def test_deleting_category_invalidates_cached_products():
+    """
+    Tests that products removed by the category cascade are no longer served from the cache.
+    """
+    category = CategoryService.create("Seasonal")
+    product = ProductService.create("Pumpkin", 7.0, category.id)
+    assert ProductService.get_by_id(product.id).name == "Pumpkin"
+    CategoryService.delete(category.id)
+    with pytest.raises(ValueError, match="Product not found."):
+        ProductService.get_by_id(product.id)
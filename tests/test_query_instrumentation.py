@@ -0,0 +1,106 @@
+import json
+
+import pytest
+from db import instrumentation
+from db.backends import backend
+from db.connection import get_pool
+from queries import client_queries, order_queries
+from services.category_service import CategoryService
+from services.client_service import ClientService
+from services.product_service import ProductService
+
+
+@pytest.fixture
+def slow_log(tmp_path):
+    """
+    Enables query instrumentation with every query logged as slow.
+
+    Idle pooled connections are closed on both ends, so the test runs on
+    instrumented connections and later tests on plain ones.
+    """
+    path = tmp_path / "slow.jsonl"
+    instrumentation.enable(slow_ms=0, slow_log=str(path), explain=False)
+    instrumentation.reset_query_stats()
+    get_pool().close_all()
+    yield path
+    instrumentation.disable()
+    instrumentation.reset_query_stats()
+    get_pool().close_all()
+
+
+def test_query_names():
+    """
+    Tests statements are named after their queries module and constant.
+    """
+    assert instrumentation.query_name(order_queries.GET_ALL_ORDERS) == "order.get_all"
+    assert (
+        instrumentation.query_name(client_queries.GET_CLIENT_BY_ID)
+        == "client.get_by_id"
+    )
+    bulk = client_queries.CREATE_CLIENTS_BULK.format(rows="(%s, %s), (%s, %s)")
+    assert instrumentation.query_name(bulk) == "client.create_bulk"
+    assert instrumentation.query_name("DELETE FROM clients") == "sql.delete"
+
+
+def test_queries_are_counted(slow_log):
+    """
+    Tests each executed query is counted under its name with its rows.
+    """
+    client = ClientService.create("Traced User", "traced@example.com")
+    ClientService.get_by_id(client.id)
+    ClientService.get_by_id(client.id)
+
+    stats = instrumentation.query_stats()
+    assert stats["client.create"]["calls"] == 1
+    assert stats["client.get_by_id"]["calls"] == 2
+    assert stats["client.get_by_id"]["rows"] == 2
+    assert sum(stats["client.get_by_id"]["buckets"].values()) == 2
+    assert "client.get_by_id" in instrumentation.format_report()
+
+
+def test_updates_return_the_row_without_a_second_query(slow_log):
+    """
+    Tests client and product updates return the row from the UPDATE itself
+    where the backend supports RETURNING, and read it back once otherwise.
+    """
+    client = ClientService.create("Updated User", "before@example.com")
+    category = CategoryService.create("Updates")
+    product = ProductService.create("Updated Product", 3.0, category.id)
+    instrumentation.reset_query_stats()
+
+    assert ClientService.update(client.id, "after@example.com").name == "Updated User"
+    assert ProductService.update(product.id, 3.5).name == "Updated Product"
+
+    if backend.UPDATE_RETURNING:
+        expected = {"client.update_returning", "product.update_returning"}
+    else:
+        expected = {
+            "client.update",
+            "client.get_by_id",
+            "product.update",
+            "product.get_by_id",
+        }
+    stats = instrumentation.query_stats()
+    assert set(stats) == expected
+    assert all(stats[name]["calls"] == 1 for name in expected)
+
+
+def test_slow_queries_are_logged_redacted(slow_log):
+    """
+    Tests slow queries are appended to the log without personal data.
+    """
+    ClientService.create("Secret Name", "secret@example.com")
+
+    entries = [json.loads(line) for line in slow_log.read_text().splitlines()]
+    created = [entry for entry in entries if entry["query"] == "client.create"]
+    assert len(created) == 1
+    assert created[0]["params"] == [instrumentation.REDACTED] * 2
+    assert "secret" not in slow_log.read_text()
+
+
+def test_disabled_connections_are_not_wrapped():
+    """
+    Tests connections are left untouched while instrumentation is off.
+    """
+    sentinel = object()
+    assert instrumentation.instrument(sentinel) is sentinel
@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+
+import pytest
+from cache.catalog_cache import CatalogCache
+from db.connection import get_db_connection, close_connection
+from services.category_service import CategoryService
+from services.client_service import ClientService
+from services.order_service import OrderService
+from services.product_service import ProductService
+from services.report_service import ReportService
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    """
+    Clears orders, catalog, clients and the sales rollups before each test.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    for table in (
+        "sales_by_product_day",
+        "sales_by_category_day",
+        "orders",
+        "products",
+        "categories",
+        "clients",
+    ):
+        cursor.execute(f"DELETE FROM {table}")
+    conn.commit()
+    cursor.close()
+    close_connection(conn)
+    CatalogCache.invalidate_categories()
+
+
+def create_catalog():
+    """
+    Creates a client and two products in different categories.
+    """
+    client = ClientService.create("Report Client", "report@example.com")
+    drinks = CategoryService.create("Drinks")
+    snacks = CategoryService.create("Snacks")
+    juice = ProductService.create("Juice", 4.5, drinks.id)
+    chips = ProductService.create("Chips", 3.0, snacks.id)
+    return client, juice, chips
+
+
+def test_rollups_follow_single_and_bulk_orders():
+    """
+    Tests that orders placed one by one and in bulk both reach the reports.
+    """
+    client, juice, chips = create_catalog()
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    OrderService.create(client.id, juice.id)
+    OrderService.create_many(
+        [(client.id, juice.id, yesterday), (client.id, chips.id), (client.id, chips.id)]
+    )
+
+    daily = ReportService.daily_sales(yesterday, today)
+    assert [(d.sales_date, d.order_count, d.revenue) for d in daily] == [
+        (yesterday, 1, 4.5),
+        (today, 3, 10.5),
+    ]
+
+    top = ReportService.top_products(yesterday, today, limit=1)
+    assert [(p.name, p.order_count, p.revenue) for p in top] == [("Juice", 2, 9.0)]
+
+    categories = ReportService.category_sales(today, today)
+    assert [(c.name, c.revenue) for c in categories] == [
+        ("Snacks", 6.0),
+        ("Drinks", 4.5),
+    ]
+
+
+def test_deleting_product_removes_its_sales():
+    """
+    Tests that a deleted product's cascaded orders leave the rollups.
+    """
+    client, juice, chips = create_catalog()
+    OrderService.create(client.id, juice.id)
+    OrderService.create(client.id, chips.id)
+    ProductService.delete(juice.id)
+
+    today = date.today()
+    assert [c.name for c in ReportService.category_sales(today, today)] == ["Snacks"]
+    assert ReportService.daily_sales(today, today)[0].revenue == 3.0
+
+
+def test_rebuild_matches_incremental_rollups():
+    """
+    Tests that a full rebuild reproduces the incrementally maintained totals.
+    """
+    client, juice, chips = create_catalog()
+    OrderService.create(client.id, juice.id)
+    OrderService.create(client.id, chips.id)
+    today = date.today()
+    before = [d.to_dict() for d in ReportService.daily_sales(today, today)]
+
+    ReportService.rebuild()
+    assert [d.to_dict() for d in ReportService.daily_sales(today, today)] == before
+
+
+def test_rebuild_keeps_the_price_orders_were_placed_at():
+    """
+    Tests that a price change neither alters past revenue nor a rebuild of it.
+    """
+    client, juice, _ = create_catalog()
+    OrderService.create(client.id, juice.id)
+    ProductService.update(juice.id, 10.0)
+    OrderService.create(client.id, juice.id)
+    today = date.today()
+
+    assert ReportService.daily_sales(today, today)[0].revenue == 14.5
+    ReportService.rebuild()
+    assert ReportService.daily_sales(today, today)[0].revenue == 14.5
+    (drinks,) = ReportService.category_sales(today, today)
+    assert drinks.revenue == 14.5
+
+
+def test_rebuild_counts_orders_without_a_price_at_the_current_price():
+    """
+    Tests that orders from before unit prices were recorded fall back to the
+    product's current price in a rebuild.
+    """
+    client, juice, _ = create_catalog()
+    OrderService.create(client.id, juice.id)
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("UPDATE orders SET unit_price = NULL")
+    conn.commit()
+    cursor.close()
+    close_connection(conn)
+    ProductService.update(juice.id, 5.0)
+    today = date.today()
+
+    ReportService.rebuild()
+    assert ReportService.daily_sales(today, today)[0].revenue == 5.0
+    assert ReportService.category_sales(today, today)[0].revenue == 5.0
+
+
+def test_report_rejects_reversed_range():
+    """
+    Tests that a start date after the end date is rejected.
+    """
+    today = date.today()
+    with pytest.raises(ValueError, match="Start date must not be after end date."):
+        ReportService.daily_sales(today, today - timedelta(days=1))
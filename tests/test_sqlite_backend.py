@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from db.backends import load_backend
+from db.backends.sqlite_dialect import VARIANTS
+from db.migrate import _statements, discover
+
+sqlite = load_backend("sqlite")
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    """
+    Opens a connection to a fresh SQLite file with every SQLite migration applied.
+    """
+    monkeypatch.setitem(sqlite.SQLITE_CONFIG, "path", str(tmp_path / "test.db"))
+    connection = sqlite.connect()
+    cursor = connection.cursor()
+    for migration in discover(sqlite.MIGRATIONS_DIR):
+        for statement in _statements(migration.path):
+            cursor.execute(statement)
+    connection.commit()
+    cursor.close()
+    yield connection
+    connection.close()
+
+
+def test_variants_are_valid_sqlite(conn):
+    """
+    Tests every SQLite variant of a MariaDB-only statement is accepted by SQLite.
+    """
+    cursor = conn.cursor(dictionary=True)
+    for mariadb_sql in VARIANTS:
+        params = ("1",) * mariadb_sql.count("%s")
+        sqlite.full_scans(cursor, mariadb_sql, params)
+    cursor.close()
+
+
+def test_errors_are_classified(conn):
+    """
+    Tests unique-key and foreign-key violations are told apart, with FKs enforced.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO clients (name, email) VALUES (%s, %s)", ("A", "a@x.com")
+    )
+    with pytest.raises(sqlite.Error) as duplicate:
+        cursor.execute(
+            "INSERT INTO clients (name, email) VALUES (%s, %s)", ("B", "a@x.com")
+        )
+    with pytest.raises(sqlite.Error) as missing:
+        cursor.execute(
+            "INSERT INTO products (name, price, category_id) VALUES (%s, %s, %s)",
+            ("P", 1.0, 999),
+        )
+    cursor.close()
+
+    assert sqlite.is_duplicate_key(duplicate.value)
+    assert not sqlite.is_foreign_key(duplicate.value)
+    assert sqlite.is_foreign_key(missing.value)
+
+
+def test_rows_have_mariadb_types(conn):
+    """
+    Tests dictionary rows return dates as date and DECIMAL columns as Decimal.
+    """
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("INSERT INTO categories (name) VALUES (%s)", ("Fruit",))
+    cursor.execute(
+        "INSERT INTO products (name, price, category_id) VALUES (%s, %s, %s)",
+        ("Apple", Decimal("2.50"), cursor.lastrowid),
+    )
+    cursor.execute(
+        "INSERT INTO clients (name, email) VALUES (%s, %s)", ("C", "c@x.com")
+    )
+    cursor.execute(
+        "INSERT INTO orders (client_id, product_id, order_date) VALUES (%s, %s, %s)",
+        (cursor.lastrowid, 1, date(2024, 5, 1)),
+    )
+    cursor.execute(
+        "SELECT o.order_date, p.price FROM orders o JOIN products p ON o.product_id = p.id"
+    )
+    row = cursor.fetchone()
+    cursor.close()
+
+    assert row == {"order_date": date(2024, 5, 1), "price": Decimal("2.5")}
+
+
+def test_first_insert_id_of_multi_row_insert(conn):
+    """
+    Tests the first generated ID is derived from SQLite's last-row ID.
+    """
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO categories (name) VALUES (%s)", ("Existing",))
+    cursor.execute(
+        "INSERT INTO categories (name) VALUES (%s), (%s), (%s)", ("A", "B", "C")
+    )
+    first_id = sqlite.first_insert_id(cursor, 3)
+    cursor.execute("SELECT id FROM categories WHERE name = %s", ("A",))
+
+    assert cursor.fetchone() == (first_id,)
+    cursor.close()
+
+
+def test_unknown_backend_is_rejected():
+    """
+    Tests an unknown DB_BACKEND value is reported with the valid choices.
+    """
+    with pytest.raises(ValueError, match="Unknown database backend 'oracle'"):
+        load_backend("oracle")
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import inflect
+from utils.entity_display import PLURALS, plural
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "app")
+
+
+def test_menu_imports_no_database_stack():
+    """
+    Tests importing main loads neither the controllers nor their dependencies.
+    """
+    code = (
+        "import sys, main\n"
+        "heavy = ('controllers', 'services', 'repositories', 'db', 'inflect', 'mysql')\n"
+        "print(sorted(name for name in sys.modules if name.split('.')[0] in heavy))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_precomputed_plurals_match_inflect():
+    """
+    Tests the precomputed entity plurals are what inflect would produce.
+    """
+    engine = inflect.engine()
+    for noun, expected in PLURALS.items():
+        assert engine.plural(noun) == expected
+        assert plural(noun) == expected
+
+
+def test_unknown_nouns_fall_back_to_inflect():
+    """
+    Tests names outside the precomputed table are still pluralized.
+    """
+    assert plural("supplier") == "suppliers"
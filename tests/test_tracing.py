@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from db.connection import get_pool
+from services.client_service import ClientService
+from tracing import tracer
+from tracing.exporters import JsonLinesExporter, OtlpHttpExporter
+from tracing.instrument import install
+
+
+@pytest.fixture
+def spans(tmp_path):
+    """
+    Traces every call into a JSON-lines file and returns a reader for it.
+
+    Idle pooled connections are closed on both ends, so the test runs on
+    instrumented connections and later tests on plain ones.
+    """
+    path = tmp_path / "traces.jsonl"
+    tracer.configure(JsonLinesExporter(str(path)), sample_rate=1.0)
+    install()
+    get_pool().close_all()
+
+    def read():
+        tracer.flush()
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    yield read
+    tracer.disable()
+    tracer.flush()
+    get_pool().close_all()
+
+
+def test_spans_follow_the_call_path(spans):
+    """
+    Tests a service call yields nested service, repository, acquire and query spans.
+    """
+    client = ClientService.create("Traced Client", "traced.client@example.com")
+    before = len(spans())
+    ClientService.get_by_id(client.id)
+
+    recorded = spans()[before:]
+    by_name = {span["name"]: span for span in recorded}
+    service = by_name["ClientService.get_by_id"]
+    repository = by_name["ClientRepository.get_by_id"]
+    acquire = by_name["db.acquire"]
+    query = by_name["db.query"]
+
+    assert service["parent_id"] is None
+    assert repository["parent_id"] == service["span_id"]
+    assert acquire["parent_id"] == repository["span_id"]
+    assert query["parent_id"] == repository["span_id"]
+    assert {span["trace_id"] for span in recorded} == {service["trace_id"]}
+    assert query["attributes"]["db.query.name"] == "client.get_by_id"
+    assert query["attributes"]["db.rows"] == 1
+    assert query["attributes"]["db.bytes"] > 0
+
+
+def test_generator_spans_are_current_only_while_they_run(spans):
+    """
+    Tests a traced generator's span is not the parent of work the caller
+    does between two items.
+    """
+    for index in range(2):
+        ClientService.create(f"Listed {index}", f"listed{index}@example.com")
+
+    items = ClientService.iter_all()
+    next(items)
+    assert tracer.current_span() is None
+    caller = tracer.start_span("caller.work")
+    caller.end()
+    next(items)
+    assert tracer.current_span() is None
+    items.close()
+
+    recorded = spans()
+    by_name = {span["name"]: span for span in recorded}
+    assert by_name["caller.work"]["parent_id"] is None
+    repository = by_name["ClientRepository.iter_all"]
+    assert by_name["db.acquire"]["parent_id"] == repository["span_id"]
+
+
+def test_unsampled_traces_are_not_recorded(spans):
+    """
+    Tests nothing is exported when the sample rate is zero.
+    """
+    tracer.configure(tracer._processor.exporter, sample_rate=0.0)
+    ClientService.create("Unsampled Client", "unsampled@example.com")
+    assert spans() == []
+
+
+def test_errors_are_recorded(spans):
+    """
+    Tests a failing call ends its span with the error.
+    """
+    with pytest.raises(ValueError):
+        ClientService.create("", "bad@example.com")
+
+    (span,) = spans()
+    assert span["name"] == "ClientService.create"
+    assert span["error"].startswith("ValueError")
+
+
+def test_otlp_payload():
+    """
+    Tests spans are encoded as an OTLP/JSON export request.
+    """
+    span = tracer.Span("demo", "ab" * 16, "cd" * 8, {"db.rows": 3})
+    span.end_ns = span.start_ns + 1000
+
+    payload = OtlpHttpExporter("http://127.0.0.1:1/v1/traces").payload([span])
+    (resource,) = payload["resourceSpans"]
+    (otlp,) = resource["scopeSpans"][0]["spans"]
+    assert otlp["traceId"] == "ab" * 16
+    assert otlp["parentSpanId"] == "cd" * 8
+    assert otlp["attributes"] == [{"key": "db.rows", "value": {"intValue": "3"}}]